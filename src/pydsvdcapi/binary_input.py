@@ -56,6 +56,7 @@ from typing import (
     Callable,
     Dict,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -147,11 +148,30 @@ class BinaryInput:
         self._extended_value: Optional[int] = None
         self._age: Optional[float] = None
         self._error: InputError = InputError.OK
+
+        # Plain-int shadows of the enum fields above, kept in sync by
+        # every writer so the property getters skip int(enum) calls.
+        self._input_usage_int: int = int(input_usage)
+        self._hardwired_function_int: int = int(hardwired_function)
+        self._sensor_function_int: int = int(sensor_function)
+        self._error_int: int = int(InputError.OK)
         #: Monotonic timestamp of the last value update (for age calc).
         self._last_update: Optional[float] = None
 
+        # Cached description / settings / persistence dicts; dropped
+        # by _invalidate_caches() from every writer of their fields.
+        self._desc_cache: Optional[Dict[str, Any]] = None
+        self._settings_cache: Optional[Dict[str, Any]] = None
+        self._tree_cache: Optional[Dict[str, Any]] = None
+
         # ---- session (stored by start_alive_timer for push fallback) -
         self._session: Optional[VdcSession] = None
+        #: ``(value, extendedValue, error)`` of the last push the vdSM
+        #: accepted; ``None`` until one succeeds.  Unchanged reports
+        #: are compared against this, not the locally held state.
+        self._pushed_state: Optional[
+            Tuple[Optional[bool], Optional[int], int]
+        ] = None
 
         # ---- value converter (optional, persisted) -------------------
         self._uplink_converter_code: Optional[str] = None
@@ -187,6 +207,7 @@ class BinaryInput:
     @name.setter
     def name(self, value: str) -> None:
         self._name = value
+        self._invalidate_caches()
 
     @property
     def update_interval(self) -> float:
@@ -208,6 +229,7 @@ class BinaryInput:
     @group.setter
     def group(self, value: int) -> None:
         self._group = int(value)
+        self._invalidate_caches()
         self._schedule_auto_save()
 
     @property
@@ -218,6 +240,8 @@ class BinaryInput:
     @sensor_function.setter
     def sensor_function(self, value: Union[BinaryInputType, int]) -> None:
         self._sensor_function = BinaryInputType(int(value))
+        self._sensor_function_int = int(self._sensor_function)
+        self._invalidate_caches()
         self._schedule_auto_save()
 
     # ---- converter management ---------------------------------------
@@ -264,6 +288,7 @@ class BinaryInput:
         else:
             self._uplink_converter_fn = compile_converter(code)
             self._uplink_converter_code = code
+        self._invalidate_caches()
 
     @property
     def uplink_converter_code(self) -> Optional[str]:
@@ -300,6 +325,7 @@ class BinaryInput:
     @error.setter
     def error(self, value: Union[InputError, int]) -> None:
         self._error = InputError(int(value))
+        self._error_int = int(self._error)
 
     # ---- state update (called by the physical device) ----------------
 
@@ -307,9 +333,17 @@ class BinaryInput:
         self,
         value: Optional[bool],
         session: Optional[VdcSession] = None,
+        *,
+        force: bool = False,
     ) -> None:
         """Set the boolean value and push a state notification.
 
+        Re-reporting the value last pushed to the vdSM (e.g. from a
+        polling loop) only refreshes ``age``; no notification is sent
+        unless *force* is set.  A value stored while no push was
+        possible (not announced, or the push failed) is pushed again
+        on the next report.
+
         Parameters
         ----------
         value:
@@ -318,6 +352,8 @@ class BinaryInput:
             Active session to send the push notification on.  If
             ``None`` or the vdSD is not announced, the value is stored
             locally but no push is sent.
+        force:
+            Push even if the value is unchanged.
         """
         value = apply_converter(
             self._uplink_converter_fn,
@@ -325,9 +361,17 @@ class BinaryInput:
             component_id=f"BinaryInput[{self._ds_index}] '{self._name}'",
             direction="uplink",
         )
+        pushed = self._pushed_state
+        unchanged = (
+            pushed is not None
+            and pushed[0] is value
+            and pushed[1] is None
+        )
         self._value = value
         self._extended_value = None  # bool takes precedence
         self._last_update = time.monotonic()
+        if unchanged and not force:
+            return
         logger.debug(
             "BinaryInput[%d] '%s' value → %s",
             self._ds_index, self._name, value,
@@ -338,9 +382,14 @@ class BinaryInput:
         self,
         value: Optional[int],
         session: Optional[VdcSession] = None,
+        *,
+        force: bool = False,
     ) -> None:
         """Set the extended (integer) value and push a state notification.
 
+        As with :meth:`update_value`, an unchanged value only refreshes
+        ``age`` unless *force* is set.
+
         Parameters
         ----------
         value:
@@ -348,6 +397,8 @@ class BinaryInput:
             1=open, 2=tilted).  ``None`` = unknown.
         session:
             Active session to send the push notification on.
+        force:
+            Push even if the value is unchanged.
         """
         value = apply_converter(
             self._uplink_converter_fn,
@@ -355,9 +406,17 @@ class BinaryInput:
             component_id=f"BinaryInput[{self._ds_index}] '{self._name}'",
             direction="uplink",
         )
+        pushed = self._pushed_state
+        unchanged = (
+            pushed is not None
+            and pushed[0] is None
+            and pushed[1] == value
+        )
         self._extended_value = value
         self._value = None  # extended takes precedence
         self._last_update = time.monotonic()
+        if unchanged and not force:
+            return
         logger.debug(
             "BinaryInput[%d] '%s' extendedValue → %s",
             self._ds_index, self._name, value,
@@ -368,17 +427,31 @@ class BinaryInput:
         self,
         error: Union[InputError, int],
         session: Optional[VdcSession] = None,
+        *,
+        force: bool = False,
     ) -> None:
         """Set the error status and push a state notification.
 
+        As with :meth:`update_value`, nothing is pushed if the error
+        status last pushed to the vdSM is re-reported, unless *force*
+        is set.
+
         Parameters
         ----------
         error:
             Updated error code.
         session:
             Active session to send the push notification on.
+        force:
+            Push even if the error status is unchanged.
         """
-        self._error = InputError(int(error))
+        error_int = int(error)
+        pushed = self._pushed_state
+        unchanged = pushed is not None and pushed[2] == error_int
+        self._error = InputError(error_int)
+        self._error_int = error_int
+        if unchanged and not force:
+            return
         logger.debug(
             "BinaryInput[%d] '%s' error → %s",
             self._ds_index, self._name, self._error.name,
@@ -390,43 +463,70 @@ class BinaryInput:
     def get_description_properties(self) -> Dict[str, Any]:
         """Return the ``binaryInputDescriptions[N]`` property dict.
 
-        These are read-only hardware characteristics.
+        These are read-only hardware characteristics.  A fresh copy
+        is returned on every call, so callers may mutate it.
         """
-        return {
-            "name": self._name,
-            "dsIndex": self._ds_index,
-            "inputType": self._input_type,
-            "inputUsage": int(self._input_usage),
-            "sensorFunction": int(self._hardwired_function),
-            "updateInterval": self._update_interval,
-        }
+        cache = self._desc_cache
+        if cache is None:
+            cache = self._desc_cache = {
+                "name": self._name,
+                "dsIndex": self._ds_index,
+                "inputType": self._input_type,
+                "inputUsage": self._input_usage_int,
+                "sensorFunction": self._hardwired_function_int,
+                "updateInterval": self._update_interval,
+            }
+        return cache.copy()
 
     def get_settings_properties(self) -> Dict[str, Any]:
         """Return the ``binaryInputSettings[N]`` property dict.
 
-        These are read/write, persisted.
+        These are read/write, persisted.  A fresh copy is returned on
+        every call, so callers may mutate it.
         """
-        return {
-            "group": self._group,
-            "sensorFunction": int(self._sensor_function),
-        }
+        cache = self._settings_cache
+        if cache is None:
+            cache = self._settings_cache = {
+                "group": self._group,
+                "sensorFunction": self._sensor_function_int,
+            }
+        return cache.copy()
 
-    def get_state_properties(self) -> Dict[str, Any]:
+    def get_state_properties(
+        self, now: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Return the ``binaryInputStates[N]`` property dict.
 
         These are read-only volatile state.
-        """
-        state: Dict[str, Any] = {}
 
-        # Prefer extendedValue over value when set.
-        if self._extended_value is not None:
-            state["extendedValue"] = self._extended_value
+        Parameters
+        ----------
+        now:
+            ``time.monotonic()`` snapshot to compute ``age`` against.
+            Callers collecting many inputs at once pass one shared
+            snapshot; defaults to the current time.
+        """
+        last_update = self._last_update
+        if last_update is None:
+            age = None  # NULL
         else:
-            state["value"] = self._value  # may be None (NULL)
+            if now is None:
+                now = time.monotonic()
+            age = now - last_update
 
-        state["age"] = self.age  # may be None (NULL)
-        state["error"] = int(self._error)
-        return state
+        # Prefer extendedValue over value when set.
+        extended_value = self._extended_value
+        if extended_value is not None:
+            return {
+                "extendedValue": extended_value,
+                "age": age,
+                "error": self._error_int,
+            }
+        return {
+            "value": self._value,  # may be None (NULL)
+            "age": age,
+            "error": self._error_int,
+        }
 
     # ---- settings mutation (called from vdc_host setProperty) --------
 
@@ -440,6 +540,7 @@ class BinaryInput:
             ``{"group": 2, "sensorFunction": 5}``).
         """
         changed = False
+        self._invalidate_caches()
         if "group" in incoming:
             self._group = int(incoming["group"])
             changed = True
@@ -447,6 +548,7 @@ class BinaryInput:
             self._sensor_function = BinaryInputType(
                 int(incoming["sensorFunction"])
             )
+            self._sensor_function_int = int(self._sensor_function)
             changed = True
         if changed:
             logger.debug(
@@ -463,21 +565,26 @@ class BinaryInput:
         """Return the persisted representation of this binary input.
 
         Only description and settings properties are included (state
-        is volatile and not persisted).
+        is volatile and not persisted).  The node is cached until one
+        of its fields changes; callers must not mutate it.
         """
-        node: Dict[str, Any] = {
+        node = self._tree_cache
+        if node is not None:
+            return node
+        node = {
             "dsIndex": self._ds_index,
             "name": self._name,
             "inputType": self._input_type,
-            "inputUsage": int(self._input_usage),
-            "hardwiredFunction": int(self._hardwired_function),
+            "inputUsage": self._input_usage_int,
+            "hardwiredFunction": self._hardwired_function_int,
             "updateInterval": self._update_interval,
             # Settings (writable)
             "group": self._group,
-            "sensorFunction": int(self._sensor_function),
+            "sensorFunction": self._sensor_function_int,
         }
         if self._uplink_converter_code is not None:
             node["uplinkConverter"] = self._uplink_converter_code
+        self._tree_cache = node
         return node
 
     def _apply_state(self, state: Dict[str, Any]) -> None:
@@ -486,6 +593,7 @@ class BinaryInput:
         Restores both description and settings properties.  State
         properties are left at their defaults (unknown / OK).
         """
+        self._invalidate_caches()
         if "dsIndex" in state:
             self._ds_index = int(state["dsIndex"])
         if "name" in state:
@@ -496,10 +604,12 @@ class BinaryInput:
             self._input_usage = BinaryInputUsage(
                 int(state["inputUsage"])
             )
+            self._input_usage_int = int(self._input_usage)
         if "hardwiredFunction" in state:
             self._hardwired_function = BinaryInputType(
                 int(state["hardwiredFunction"])
             )
+            self._hardwired_function_int = int(self._hardwired_function)
         if "updateInterval" in state:
             self._update_interval = float(state["updateInterval"])
         # Settings
@@ -509,6 +619,7 @@ class BinaryInput:
             self._sensor_function = BinaryInputType(
                 int(state["sensorFunction"])
             )
+            self._sensor_function_int = int(self._sensor_function)
         # Converter
         if "uplinkConverter" in state:
             self.set_uplink_converter(state["uplinkConverter"])
@@ -539,6 +650,7 @@ class BinaryInput:
             return
 
         state_dict = self.get_state_properties()
+        pushed = (self._value, self._extended_value, self._error_int)
 
         push_tree: Dict[str, Any] = {
             "binaryInputStates": {
@@ -554,6 +666,7 @@ class BinaryInput:
 
         try:
             await session.send_notification(msg)
+            self._pushed_state = pushed
             logger.debug(
                 "BinaryInput[%d] '%s': pushed state %s for vdSD %s",
                 self._ds_index, self._name, state_dict,
@@ -585,9 +698,22 @@ class BinaryInput:
     def stop_alive_timer(self) -> None:
         """Clear the stored session.
 
-        Called when the vdSD vanishes or the session disconnects.
+        Called when the vdSD vanishes or the session disconnects.  The
+        next report after re-announcement is pushed even if unchanged.
         """
         self._session = None
+        self._pushed_state = None
+
+    # ---- caching -----------------------------------------------------
+
+    def _invalidate_caches(self) -> None:
+        """Drop the cached property dicts, here and in the owning vdSD."""
+        self._desc_cache = None
+        self._settings_cache = None
+        self._tree_cache = None
+        invalidate = getattr(self._vdsd, "_invalidate_property_tree", None)
+        if invalidate is not None:
+            invalidate()
 
     # ---- auto-save ---------------------------------------------------
 
@@ -118,6 +118,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -146,31 +147,32 @@ logger = logging.getLogger(__name__)
 
 #: Standard element arrangement for each ButtonType.
 #:
-#: ``UNDEFINED`` maps to an empty list because the element layout is
-#: determined by the integrating application.
-BUTTON_TYPE_ELEMENTS: Dict[ButtonType, List[ButtonElementID]] = {
-    ButtonType.UNDEFINED: [],
-    ButtonType.SINGLE_PUSHBUTTON: [
+#: ``UNDEFINED`` maps to an empty tuple because the element layout is
+#: determined by the integrating application.  The layouts are tuples
+#: so the shared table cannot be mutated through a lookup.
+BUTTON_TYPE_ELEMENTS: Dict[ButtonType, Tuple[ButtonElementID, ...]] = {
+    ButtonType.UNDEFINED: (),
+    ButtonType.SINGLE_PUSHBUTTON: (
         ButtonElementID.CENTER,
-    ],
-    ButtonType.TWO_WAY_PUSHBUTTON: [
+    ),
+    ButtonType.TWO_WAY_PUSHBUTTON: (
         ButtonElementID.DOWN,
         ButtonElementID.UP,
-    ],
-    ButtonType.FOUR_WAY_NAVIGATION: [
+    ),
+    ButtonType.FOUR_WAY_NAVIGATION: (
         ButtonElementID.DOWN,
         ButtonElementID.UP,
         ButtonElementID.LEFT,
         ButtonElementID.RIGHT,
-    ],
-    ButtonType.FOUR_WAY_WITH_CENTER: [
+    ),
+    ButtonType.FOUR_WAY_WITH_CENTER: (
         ButtonElementID.CENTER,
         ButtonElementID.DOWN,
         ButtonElementID.UP,
         ButtonElementID.LEFT,
         ButtonElementID.RIGHT,
-    ],
-    ButtonType.EIGHT_WAY_WITH_CENTER: [
+    ),
+    ButtonType.EIGHT_WAY_WITH_CENTER: (
         ButtonElementID.CENTER,
         ButtonElementID.DOWN,
         ButtonElementID.UP,
@@ -180,11 +182,11 @@ BUTTON_TYPE_ELEMENTS: Dict[ButtonType, List[ButtonElementID]] = {
         ButtonElementID.LOWER_LEFT,
         ButtonElementID.UPPER_RIGHT,
         ButtonElementID.LOWER_RIGHT,
-    ],
-    ButtonType.ON_OFF_SWITCH: [
+    ),
+    ButtonType.ON_OFF_SWITCH: (
         ButtonElementID.DOWN,
         ButtonElementID.UP,
-    ],
+    ),
 }
 
 
@@ -207,6 +209,22 @@ DEFAULT_HOLD_REPEAT_INTERVAL: float = 1.0
 # ---------------------------------------------------------------------------
 
 
+#: Click types for 1, 2, 3 and 4+ short presses when emitting CLICK_Nx
+#: (capped at ``CLICK_3X``) and when emitting TIP_Nx.
+_CLICK_TYPES: Tuple[ButtonClickType, ...] = (
+    ButtonClickType.CLICK_1X,
+    ButtonClickType.CLICK_2X,
+    ButtonClickType.CLICK_3X,
+    ButtonClickType.CLICK_3X,
+)
+_TIP_TYPES: Tuple[ButtonClickType, ...] = (
+    ButtonClickType.TIP_1X,
+    ButtonClickType.TIP_2X,
+    ButtonClickType.TIP_3X,
+    ButtonClickType.TIP_4X,
+)
+
+
 class _ClickState(enum.Enum):
     """Internal states of the click detection state machine."""
 
@@ -285,6 +303,20 @@ class ClickDetector:
     * 2+ short presses + hold → ``SHORT_SHORT_LONG``
     """
 
+    __slots__ = (
+        "_on_click",
+        "_tip_timeout",
+        "_multi_click_window",
+        "_hold_repeat_interval",
+        "_use_tip_events",
+        "_click_types",
+        "_state",
+        "_tip_count",
+        "_timer",
+        "_deadline",
+        "_on_deadline",
+    )
+
     def __init__(
         self,
         on_click: Callable[[ButtonClickType, bool], Any],
@@ -299,13 +331,20 @@ class ClickDetector:
         self._multi_click_window = multi_click_window
         self._hold_repeat_interval = hold_repeat_interval
         self._use_tip_events = use_tip_events
+        # Resolved click types indexed by short-press count - 1.
+        self._click_types = _TIP_TYPES if use_tip_events else _CLICK_TYPES
 
         self._state: _ClickState = _ClickState.IDLE
         self._tip_count: int = 0
 
-        self._tip_timer: Optional[asyncio.TimerHandle] = None
-        self._multi_click_timer: Optional[asyncio.TimerHandle] = None
-        self._hold_repeat_timer: Optional[asyncio.TimerHandle] = None
+        # Each state waits on at most one deadline (tip timeout in
+        # PRESSED, multi-click window in TIP_WAIT, hold repeat in
+        # HOLDING), so a single handle serves all three.  The handle
+        # may fire before the current deadline; it then re-arms itself
+        # for the remainder instead of being cancelled on every edge.
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._deadline: Optional[float] = None
+        self._on_deadline: Optional[Callable[[], None]] = None
 
     # ---- public API --------------------------------------------------
 
@@ -345,16 +384,16 @@ class ClickDetector:
         Call this when the hardware detects a button-down event.
         Ignored if the button is already in a pressed state.
         """
-        if self._state == _ClickState.IDLE:
+        if self._state is _ClickState.IDLE:
             self._tip_count = 0
             self._state = _ClickState.PRESSED
-            self._schedule_tip_timer()
+            self._start_timer(self._tip_timeout, self._on_tip_timeout)
 
-        elif self._state == _ClickState.TIP_WAIT:
-            # Another press within the multi-click window.
-            self._cancel_multi_click_timer()
+        elif self._state is _ClickState.TIP_WAIT:
+            # Another press within the multi-click window; the tip
+            # timer replaces the multi-click timer.
             self._state = _ClickState.PRESSED
-            self._schedule_tip_timer()
+            self._start_timer(self._tip_timeout, self._on_tip_timeout)
 
         # In PRESSED or HOLDING: already pressed — ignore.
 
@@ -364,14 +403,15 @@ class ClickDetector:
         Call this when the hardware detects a button-up event.
         Ignored if the button is not in a pressed state.
         """
-        if self._state == _ClickState.PRESSED:
-            self._cancel_tip_timer()
+        if self._state is _ClickState.PRESSED:
             self._tip_count += 1
             self._state = _ClickState.TIP_WAIT
-            self._schedule_multi_click_timer()
+            self._start_timer(
+                self._multi_click_window, self._on_multi_click_timeout
+            )
 
-        elif self._state == _ClickState.HOLDING:
-            self._cancel_hold_repeat_timer()
+        elif self._state is _ClickState.HOLDING:
+            self._cancel_timer()
             self._state = _ClickState.IDLE
             self._emit(ButtonClickType.HOLD_END, False)
             self._tip_count = 0
@@ -384,34 +424,71 @@ class ClickDetector:
         Call when the button is removed, the vdSD vanishes, or the
         session disconnects.
         """
-        self._cancel_tip_timer()
-        self._cancel_multi_click_timer()
-        self._cancel_hold_repeat_timer()
+        if self._timer is None and self._state is _ClickState.IDLE:
+            # Nothing armed and nothing to reset (the count is always
+            # cleared on the way back to IDLE).
+            return
+        self._cancel_timer()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
         self._state = _ClickState.IDLE
         self._tip_count = 0
 
-    # ---- tip timer ---------------------------------------------------
+    # ---- timer -------------------------------------------------------
 
-    def _schedule_tip_timer(self) -> None:
-        """Start the tip-vs-hold discrimination timer."""
-        self._cancel_tip_timer()
+    def _start_timer(
+        self, delay: float, callback: Callable[[], None]
+    ) -> None:
+        """Arm the state timer: run *callback* after *delay* seconds.
+
+        Replaces any pending deadline.  A pending handle due no later
+        than the new deadline is kept (it re-checks when it fires);
+        only one due later is cancelled and rescheduled.
+        """
+        self._cancel_timer()
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
             return
-        self._tip_timer = loop.call_later(
-            self._tip_timeout, self._on_tip_timeout
-        )
+        deadline = loop.time() + delay
+        self._deadline = deadline
+        self._on_deadline = callback
+        timer = self._timer
+        if timer is not None:
+            if timer.when() <= deadline:
+                return
+            timer.cancel()
+        self._timer = loop.call_at(deadline, self._on_timer)
+
+    def _cancel_timer(self) -> None:
+        """Drop the current deadline; a pending handle fires idle."""
+        self._deadline = None
+        self._on_deadline = None
+
+    def _on_timer(self) -> None:
+        """Timer handle fired: run the deadline callback once it is due."""
+        timer = self._timer
+        self._timer = None
+        deadline = self._deadline
+        if deadline is None or timer is None:
+            return
+        if deadline > timer.when():
+            # Re-armed after this handle was scheduled; wait the rest.
+            self._timer = asyncio.get_running_loop().call_at(
+                deadline, self._on_timer
+            )
+            return
+        callback = self._on_deadline
+        self._cancel_timer()
+        if callback is not None:
+            callback()
 
-    def _cancel_tip_timer(self) -> None:
-        if self._tip_timer is not None:
-            self._tip_timer.cancel()
-            self._tip_timer = None
+    # ---- tip timeout -------------------------------------------------
 
     def _on_tip_timeout(self) -> None:
         """Button held past tip threshold → start hold sequence."""
-        self._tip_timer = None
-        if self._state != _ClickState.PRESSED:
+        if self._state is not _ClickState.PRESSED:
             return
 
         self._state = _ClickState.HOLDING
@@ -424,82 +501,33 @@ class ClickDetector:
         else:
             self._emit(ButtonClickType.SHORT_SHORT_LONG, True)
 
-        self._schedule_hold_repeat_timer()
-
-    # ---- multi-click timer -------------------------------------------
-
-    def _schedule_multi_click_timer(self) -> None:
-        """Start the multi-click window timer."""
-        self._cancel_multi_click_timer()
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            return
-        self._multi_click_timer = loop.call_later(
-            self._multi_click_window, self._on_multi_click_timeout
+        self._start_timer(
+            self._hold_repeat_interval, self._on_hold_repeat_timeout
         )
 
-    def _cancel_multi_click_timer(self) -> None:
-        if self._multi_click_timer is not None:
-            self._multi_click_timer.cancel()
-            self._multi_click_timer = None
+    # ---- multi-click window ------------------------------------------
 
     def _on_multi_click_timeout(self) -> None:
         """Multi-click window expired → emit resolved click type."""
-        self._multi_click_timer = None
-        if self._state != _ClickState.TIP_WAIT:
+        if self._state is not _ClickState.TIP_WAIT:
             return
 
         self._state = _ClickState.IDLE
 
-        if self._use_tip_events:
-            click_map = {
-                1: ButtonClickType.TIP_1X,
-                2: ButtonClickType.TIP_2X,
-                3: ButtonClickType.TIP_3X,
-            }
-            ct = click_map.get(
-                self._tip_count, ButtonClickType.TIP_4X
-            )
-        else:
-            click_map = {
-                1: ButtonClickType.CLICK_1X,
-                2: ButtonClickType.CLICK_2X,
-                3: ButtonClickType.CLICK_3X,
-            }
-            ct = click_map.get(
-                self._tip_count, ButtonClickType.CLICK_3X
-            )
-
+        ct = self._click_types[min(self._tip_count, 4) - 1]
         self._emit(ct, False)
         self._tip_count = 0
 
-    # ---- hold repeat timer -------------------------------------------
-
-    def _schedule_hold_repeat_timer(self) -> None:
-        """Start the hold-repeat interval timer."""
-        self._cancel_hold_repeat_timer()
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            return
-        self._hold_repeat_timer = loop.call_later(
-            self._hold_repeat_interval,
-            self._on_hold_repeat_timeout,
-        )
-
-    def _cancel_hold_repeat_timer(self) -> None:
-        if self._hold_repeat_timer is not None:
-            self._hold_repeat_timer.cancel()
-            self._hold_repeat_timer = None
+    # ---- hold repeat -------------------------------------------------
 
     def _on_hold_repeat_timeout(self) -> None:
         """Emit HOLD_REPEAT and re-arm the timer."""
-        self._hold_repeat_timer = None
-        if self._state != _ClickState.HOLDING:
+        if self._state is not _ClickState.HOLDING:
             return
         self._emit(ButtonClickType.HOLD_REPEAT, True)
-        self._schedule_hold_repeat_timer()
+        self._start_timer(
+            self._hold_repeat_interval, self._on_hold_repeat_timeout
+        )
 
     # ---- event emission ----------------------------------------------
 
@@ -576,6 +604,33 @@ class ButtonInput:
         ``hold_repeat_interval``, ``use_tip_events``.
     """
 
+    __slots__ = (
+        "_vdsd",
+        "_ds_index",
+        "_name",
+        "_supports_local_key_mode",
+        "_button_id",
+        "_button_type",
+        "_button_element_id",
+        "_group",
+        "_function",
+        "_mode",
+        "_channel",
+        "_sets_local_priority",
+        "_calls_present",
+        "_value",
+        "_click_type",
+        "_action_id",
+        "_action_mode",
+        "_error",
+        "_last_update",
+        "_last_state_is_action",
+        "_session",
+        "_click_detector",
+        "_pushes_in_flight",
+        "_repeat_deferred",
+    )
+
     def __init__(
         self,
         *,
@@ -628,6 +683,10 @@ class ButtonInput:
 
         # ---- session reference (set on announcement) -----------------
         self._session: Optional[VdcSession] = None
+        #: Pushes currently awaiting ``send_notification``.
+        self._pushes_in_flight: int = 0
+        #: A HOLD_REPEAT arrived while a push was in flight.
+        self._repeat_deferred: bool = False
 
         # ---- click detector (state machine) --------------------------
         valid_keys = {
@@ -864,13 +923,14 @@ class ButtonInput:
             self._value = value
         self._last_update = time.monotonic()
         self._last_state_is_action = False
-        logger.debug(
-            "ButtonInput[%d] '%s' clickType → %s (value=%s)",
-            self._ds_index,
-            self._name,
-            self._click_type.name,
-            self._value,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "ButtonInput[%d] '%s' clickType → %s (value=%s)",
+                self._ds_index,
+                self._name,
+                self._click_type.name,
+                self._value,
+            )
         await self._push_state(session or self._session)
 
     # ---- direct action update ----------------------------------------
@@ -948,13 +1008,24 @@ class ButtonInput:
         self._value = value
         self._last_update = time.monotonic()
         self._last_state_is_action = False
-        logger.debug(
-            "ButtonInput[%d] '%s' click detected: %s (value=%s)",
-            self._ds_index,
-            self._name,
-            click_type.name,
-            value,
-        )
+        # Guarded: HOLD_REPEAT makes this a per-second path, and
+        # ``.name`` on an enum member is not free.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "ButtonInput[%d] '%s' click detected: %s (value=%s)",
+                self._ds_index,
+                self._name,
+                click_type.name,
+                value,
+            )
+        if (
+            self._pushes_in_flight
+            and click_type is ButtonClickType.HOLD_REPEAT
+        ):
+            # The session is still busy with an earlier push; the
+            # repeat goes out once it drains (see _push_state).
+            self._repeat_deferred = True
+            return
         await self._push_state(self._session)
 
     # ---- property dicts (for getProperty responses) ------------------
@@ -1138,8 +1209,29 @@ class ButtonInput:
 
         Unlike binary/sensor inputs, button events are pushed
         immediately without throttling (no ``minPushInterval`` or
-        ``changesOnlyInterval``).
+        ``changesOnlyInterval``).  The one exception is HOLD_REPEAT:
+        repeats that arrive while a push is still in flight are
+        coalesced into a single push of the latest state, sent once
+        the session has drained.
         """
+        while True:
+            await self._send_state(session)
+            if not self._repeat_deferred or self._pushes_in_flight:
+                return
+            self._repeat_deferred = False
+            if (
+                self._last_state_is_action
+                or self._click_type is not ButtonClickType.HOLD_REPEAT
+            ):
+                # A later event superseded the repeat and was pushed
+                # on its own.
+                return
+
+    async def _send_state(
+        self,
+        session: Optional[VdcSession],
+    ) -> None:
+        """Build and send one push notification with the current state."""
         if session is None:
             return
         if not self._vdsd.is_announced:
@@ -1163,6 +1255,7 @@ class ButtonInput:
         for elem in dict_to_elements(push_tree):
             msg.vdc_send_push_notification.changedproperties.append(elem)
 
+        self._pushes_in_flight += 1
         try:
             await session.send_notification(msg)
             logger.debug(
@@ -1179,6 +1272,8 @@ class ButtonInput:
                 self._name,
                 exc,
             )
+        finally:
+            self._pushes_in_flight -= 1
 
     # ---- session management ------------------------------------------
     #
@@ -1246,7 +1341,7 @@ def get_required_elements(
         Element IDs required for that type.  Empty for
         ``UNDEFINED`` (layout is application-defined).
     """
-    return list(BUTTON_TYPE_ELEMENTS.get(button_type, []))
+    return list(BUTTON_TYPE_ELEMENTS.get(button_type, ()))
 
 
 def create_button_group(
@@ -1308,31 +1403,37 @@ def create_button_group(
         If *button_type* is ``UNDEFINED`` (which has no standard
         element layout).
     """
-    elements = get_required_elements(button_type)
+    # Iterate the immutable layout directly; no copy is needed here.
+    elements = BUTTON_TYPE_ELEMENTS.get(button_type, ())
     if not elements:
         raise ValueError(
             f"ButtonType.{button_type.name} has no standard element "
             f"layout — create ButtonInput instances manually."
         )
 
-    buttons: List[ButtonInput] = []
-    for i, element_id in enumerate(elements):
-        element_label = element_id.name.replace("_", " ").title()
-        btn = ButtonInput(
-            vdsd=vdsd,
+    # Arguments shared by every element, built once for the group.
+    common: Dict[str, Any] = {
+        "vdsd": vdsd,
+        "supports_local_key_mode": supports_local_key_mode,
+        "button_id": button_id,
+        "button_type": button_type,
+        "group": group,
+        "function": function,
+        "mode": mode,
+        "channel": channel,
+        "sets_local_priority": sets_local_priority,
+        "calls_present": calls_present,
+        "click_detector_config": click_detector_config,
+    }
+    return [
+        ButtonInput(
             ds_index=start_index + i,
-            name=f"{name_prefix} {element_label}",
-            supports_local_key_mode=supports_local_key_mode,
-            button_id=button_id,
-            button_type=button_type,
+            name=(
+                f"{name_prefix} "
+                f"{element_id.name.replace('_', ' ').title()}"
+            ),
             button_element_id=element_id,
-            group=group,
-            function=function,
-            mode=mode,
-            channel=channel,
-            sets_local_priority=sets_local_priority,
-            calls_present=calls_present,
-            click_detector_config=click_detector_config,
+            **common,
         )
-        buttons.append(btn)
-    return buttons
+        for i, element_id in enumerate(elements)
+    ]
@@ -27,7 +27,7 @@ import hashlib
 import os
 import uuid
 from enum import IntEnum, unique
-from typing import Union
+from typing import Optional, Union
 
 
 # ---------------------------------------------------------------------------
@@ -95,13 +95,16 @@ class DsUid:
     (e.g. ``"198C033E330755E78015F97AD093DD1C00"``).
     """
 
-    __slots__ = ("_raw", "_id_type")
+    __slots__ = ("_raw", "_id_type", "_str")
 
     # ---- construction helpers (private) -----------------------------------
 
     def __init__(self) -> None:  # noqa: D107
         self._raw = bytearray(DSUID_BYTES)
         self._id_type = DsUidType.UNDEFINED
+        # Canonical string, computed on first str(); safe to cache since
+        # _raw is only written by the constructors before they return.
+        self._str: Optional[str] = None
 
     def _detect_subtype(self) -> None:
         """Detect whether the raw bytes represent SGTIN-96, GID-96 or UUID."""
@@ -618,7 +621,10 @@ class DsUid:
 
     def __str__(self) -> str:
         """Return the canonical 34-character upper-case hex representation."""
-        return self._raw.hex().upper()
+        text = self._str
+        if text is None:
+            text = self._str = self._raw.hex().upper()
+        return text
 
     def __repr__(self) -> str:
         return f"DsUid('{self}')"
@@ -5,10 +5,15 @@ vdSDs) in a human-readable YAML file.  A backup copy (``<file>.bak``) is
 maintained automatically so that a corrupt primary file can be recovered.
 
 Write strategy (atomic with backup):
+  0. Serialise the tree; if it is byte-identical to what this store
+     last wrote and the file on disk is unchanged since, skip the write.
   1. If the current YAML file exists, copy it to ``<file>.bak``.
-  2. Write a *new* temporary file (``<file>.tmp``) next to the target.
+  2. Write a *new* temporary file (``<file>.tmp``) next to the target
+     and ``fsync`` it, so the data is durable before it becomes visible.
   3. ``os.replace`` the temporary file onto the target — this is an
      atomic operation on POSIX systems (and best-effort on Windows).
+     The containing directory is then synced (POSIX only) so that the
+     rename itself survives a power loss.
 
 Load strategy (with fallback):
   1. Try to load the primary YAML file.
@@ -31,14 +36,23 @@ Usage example::
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import shutil
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 
+try:
+    # libyaml C bindings — several times faster than pure Python.
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Type alias for a nested property tree.
@@ -48,6 +62,8 @@ PropertyTree = Dict[str, Any]
 _BACKUP_SUFFIX = ".bak"
 # Suffix for the temporary file used during atomic writes.
 _TMP_SUFFIX = ".tmp"
+# Keep Windows from translating newlines in the raw os.open() write.
+_O_BINARY = getattr(os, "O_BINARY", 0)
 
 
 class PropertyStore:
@@ -68,6 +84,8 @@ class PropertyStore:
         self._tmp_path = self._path.with_suffix(
             self._path.suffix + _TMP_SUFFIX
         )
+        # (digest, st_size, st_mtime_ns) of the last file this store wrote.
+        self._last_written: Optional[Tuple[bytes, int, int]] = None
 
     # ---- public properties -------------------------------------------
 
@@ -96,6 +114,18 @@ class PropertyStore:
         OSError
             If the file cannot be written.
         """
+        payload = yaml.dump(
+            tree,
+            Dumper=_SafeDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        ).encode("utf-8")
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if self._is_unchanged(digest):
+            logger.debug("Property tree unchanged — skipping write.")
+            return
+
         # Ensure the parent directory exists.
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -110,16 +140,20 @@ class PropertyStore:
                     self._backup_path,
                 )
 
-        # 2. Write to a temporary file first.
+        # 2. Write to a temporary file first and make it durable.
         try:
-            with open(self._tmp_path, "w", encoding="utf-8") as fh:
-                yaml.dump(
-                    tree,
-                    fh,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                    sort_keys=False,
-                )
+            fd = os.open(
+                self._tmp_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY,
+                0o644,
+            )
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
         except OSError:
             logger.error("Failed to write temporary file %s", self._tmp_path)
             raise
@@ -132,7 +166,10 @@ class PropertyStore:
                 "Failed to replace %s with %s", self._path, self._tmp_path
             )
             raise
+        self._sync_directory()
 
+        st = os.stat(self._path)
+        self._last_written = (digest, st.st_size, st.st_mtime_ns)
         logger.info("Saved property tree to %s", self._path)
 
     # ---- load ---------------------------------------------------------
@@ -187,6 +224,35 @@ class PropertyStore:
 
     # ---- helpers ------------------------------------------------------
 
+    def _sync_directory(self) -> None:
+        """Flush the parent directory entry after a rename (best effort)."""
+        if os.name != "posix":
+            return
+        try:
+            fd = os.open(self._path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            logger.debug("Could not fsync directory %s", self._path.parent)
+        finally:
+            os.close(fd)
+
+    def _is_unchanged(self, digest: bytes) -> bool:
+        """Return ``True`` if *digest* matches the last write and the
+        primary file has not been touched since."""
+        if self._last_written is None:
+            return False
+        last_digest, size, mtime_ns = self._last_written
+        if digest != last_digest:
+            return False
+        try:
+            st = os.stat(self._path)
+        except OSError:
+            return False
+        return st.st_size == size and st.st_mtime_ns == mtime_ns
+
     @staticmethod
     def _try_load(path: Path) -> Optional[PropertyTree]:
         """Attempt to load and parse a single YAML file.
@@ -196,8 +262,10 @@ class PropertyStore:
         if not path.is_file():
             return None
         try:
-            with open(path, "r", encoding="utf-8") as fh:
-                data = yaml.safe_load(fh)
+            # Hand libyaml the raw byte stream: it detects the encoding
+            # and decodes incrementally, so no intermediate str is built.
+            with open(path, "rb") as fh:
+                data = yaml.load(fh, Loader=_SafeLoader)
         except (OSError, yaml.YAMLError) as exc:
             logger.warning("Failed to load %s: %s", path, exc)
             return None
@@ -228,9 +228,14 @@ class SensorInput:
         # ---- push throttling / alive timer state ---------------------
         self._session: Optional[VdcSession] = None
         self._last_push_time: Optional[float] = None
-        self._last_pushed_state: Optional[tuple] = None
+        # Value at the last successful push (see _current_state_key).
+        self._last_pushed_state: Optional[float] = None
         self._alive_timer_handle: Optional[asyncio.TimerHandle] = None
         self._deferred_push_handle: Optional[asyncio.TimerHandle] = None
+        #: Session the pending deferred push is sent on; the latest
+        #: caller's, so a push coalesced across a reconnect uses the
+        #: new session.
+        self._deferred_push_session: Optional[VdcSession] = None
 
         # ---- value converter (optional, persisted) -------------------
         self._uplink_converter_code: Optional[str] = None
@@ -665,12 +670,14 @@ class SensorInput:
 
     # ---- push notification -------------------------------------------
 
-    def _current_state_key(self) -> tuple:
-        """Return a hashable key representing the current value state.
+    def _current_state_key(self) -> Optional[float]:
+        """Return the key representing the current value state.
 
         Used by ``changesOnlyInterval`` to detect unchanged values.
+        The value alone is the state, so it is returned as-is rather
+        than wrapped in a tuple.
         """
-        return (self._value,)
+        return self._value
 
     async def _push_state(
         self,
@@ -704,10 +711,14 @@ class SensorInput:
         if not force and self._last_push_time is not None:
             elapsed = now - self._last_push_time
 
-            # changesOnlyInterval: suppress same-value pushes.
+            # changesOnlyInterval: suppress same-value pushes.  Identity
+            # is checked first so a repeated NaN object still matches.
             if (
                 self._changes_only_interval > 0
-                and current_key == self._last_pushed_state
+                and (
+                    current_key is self._last_pushed_state
+                    or current_key == self._last_pushed_state
+                )
                 and elapsed < self._changes_only_interval
             ):
                 logger.debug(
@@ -741,6 +752,9 @@ class SensorInput:
         internal tracking state (last push time, last value key,
         alive timer reschedule).
         """
+        # This push carries the latest state; a pending deferred push
+        # would only repeat it.
+        self._cancel_deferred_push()
         state_dict = self.get_state_properties()
 
         push_tree: Dict[str, Any] = {
@@ -780,17 +794,24 @@ class SensorInput:
     ) -> None:
         """Schedule a push to fire after *delay* seconds.
 
-        Replaces any previously scheduled deferred push.
+        If a deferred push is already pending it is kept: it fires at
+        the end of the same ``minPushInterval`` and reads the state
+        only then, so it already carries this update.  A burst of
+        updates therefore costs one timer, not one per update.  Only
+        the session is replaced, so the push goes out on the one
+        passed most recently.
         """
-        self._cancel_deferred_push()
+        if self._deferred_push_handle is not None:
+            self._deferred_push_session = session
+            return
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
             return
+        self._deferred_push_session = session
         self._deferred_push_handle = loop.call_later(
             delay,
             self._on_deferred_push_fired,
-            session,
         )
 
     def _cancel_deferred_push(self) -> None:
@@ -798,13 +819,14 @@ class SensorInput:
         if self._deferred_push_handle is not None:
             self._deferred_push_handle.cancel()
             self._deferred_push_handle = None
+        self._deferred_push_session = None
 
-    def _on_deferred_push_fired(
-        self, session: VdcSession
-    ) -> None:
+    def _on_deferred_push_fired(self) -> None:
         """Callback for :meth:`_schedule_deferred_push`."""
+        session = self._deferred_push_session
         self._deferred_push_handle = None
-        if self._vdsd.is_announced:
+        self._deferred_push_session = None
+        if session is not None and self._vdsd.is_announced:
             asyncio.ensure_future(self._do_push(session))
 
     # ---- alive timer (periodic heartbeat push) -----------------------
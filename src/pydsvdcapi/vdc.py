@@ -598,7 +598,7 @@ class Vdc:
             / f"{name}.yaml"
         )
 
-        with file_path.open("r", encoding="utf-8") as fh:
+        with file_path.open("rb") as fh:
             data = yaml.safe_load(fh)
 
         template = DeviceTemplate.from_dict(data)
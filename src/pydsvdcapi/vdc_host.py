@@ -29,12 +29,26 @@ Usage example::
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
 import platform
 import socket
 import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Any, Awaitable, Callable, ClassVar, Dict, Optional, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from zeroconf import ServiceInfo
 from zeroconf.asyncio import AsyncZeroconf
@@ -112,6 +126,62 @@ AUTO_SAVE_DELAY: float = 1.0
 # Helpers
 # ---------------------------------------------------------------------------
 
+
+class _AutoSaveScheduler:
+    """Debounce timer shared by all :class:`VdcHost` instances.
+
+    One daemon thread waits on a heap of ``(deadline, seq, generation,
+    host_ref)`` entries and calls ``host._do_auto_save(generation)``
+    when an entry comes due.  Rescheduling or cancelling only bumps the
+    host's generation; stale entries are discarded when popped.  Hosts
+    are held by weak reference so pending saves do not keep them alive.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[float, int, int, "weakref.ref[VdcHost]"]] = []
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, host: VdcHost, deadline: float, generation: int) -> None:
+        """Queue a save of *host* at monotonic time *deadline*."""
+        entry = (deadline, next(self._seq), generation, weakref.ref(host))
+        with self._cond:
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="pydsvdcapi-auto-save",
+                    daemon=True,
+                )
+                self._thread.start()
+            if self._heap[0] is entry:
+                self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                deadline, _, generation, host_ref = self._heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+            host = host_ref()
+            if host is None:
+                continue
+            try:
+                host._do_auto_save(generation)
+            except Exception:  # noqa: BLE001
+                logger.exception("Auto-save failed for %r", host)
+            del host
+
+
+_AUTO_SAVE_SCHEDULER = _AutoSaveScheduler()
+
+
 def _get_default_mac() -> str:
     """Return the MAC address of the primary network interface.
 
@@ -344,7 +414,12 @@ class VdcHost:
         self._vdcs: Dict[str, Vdc] = {}  # keyed by dSUID string
 
         # --- auto-save ------------------------------------------------
-        self._save_timer: Optional[threading.Timer] = None
+        # Monotonic time at which the pending save is due (None = idle).
+        # The generation identifies the latest scheduling request; the
+        # shared scheduler drops entries carrying an older one.
+        self._save_deadline: Optional[float] = None
+        self._save_generation: int = 0
+        self._save_lock = threading.Lock()
         self._auto_save_enabled: bool = self._store is not None
 
         # --- restore vDCs from persisted state ------------------------
@@ -608,30 +683,53 @@ class VdcHost:
     def _schedule_auto_save(self) -> None:
         """Schedule a debounced save after :data:`AUTO_SAVE_DELAY` seconds.
 
-        If a timer is already running it is cancelled and restarted so
-        that rapid successive changes are coalesced into one write.
+        Each call pushes the deadline back so that rapid successive
+        changes are coalesced into one write.  The save itself runs on
+        the auto-save thread shared by all hosts.
         """
-        if self._save_timer is not None:
-            self._save_timer.cancel()
-        timer = threading.Timer(AUTO_SAVE_DELAY, self._do_auto_save)
-        timer.daemon = True
-        timer.start()
-        self._save_timer = timer
+        with self._save_lock:
+            self._save_generation += 1
+            generation = self._save_generation
+            deadline = time.monotonic() + AUTO_SAVE_DELAY
+            self._save_deadline = deadline
+        _AUTO_SAVE_SCHEDULER.schedule(self, deadline, generation)
 
     def _cancel_auto_save(self) -> None:
-        """Cancel a pending auto-save timer without performing a save."""
-        timer = getattr(self, "_save_timer", None)
-        if timer is not None:
-            timer.cancel()
-            self._save_timer = None
-
-    def _do_auto_save(self) -> None:
-        """Execute the auto-save (called by the debounce timer thread)."""
-        self._save_timer = None
+        """Cancel a pending auto-save without performing a save."""
+        lock = getattr(self, "_save_lock", None)
+        if lock is None:
+            return
+        with lock:
+            self._save_generation += 1
+            self._save_deadline = None
+
+    def _do_auto_save(self, generation: int) -> None:
+        """Execute the auto-save (called by the auto-save thread).
+
+        Does nothing if the save scheduled as *generation* was cancelled
+        or superseded in the meantime.
+        """
+        with self._save_lock:
+            if (
+                generation != self._save_generation
+                or self._save_deadline is None
+            ):
+                return
+            self._save_deadline = None
         logger.debug("Auto-saving property tree.")
         if self._store is not None:
             self._store.save(self.get_property_tree())
 
+    def _fire_autosave_now(self) -> None:
+        """Run a pending auto-save right away instead of at its deadline.
+
+        Testing hook: lets tests check *that* a save was scheduled
+        without sleeping through :data:`AUTO_SAVE_DELAY`.
+        """
+        with self._save_lock:
+            generation = self._save_generation
+        self._do_auto_save(generation)
+
     def flush(self) -> None:
         """Save immediately if there is a pending auto-save.
 
@@ -639,9 +737,9 @@ class VdcHost:
         synchronously.  Call this before shutdown to ensure no
         property changes are lost.
         """
-        if self._save_timer is not None:
-            self._save_timer.cancel()
-            self._save_timer = None
+        with self._save_lock:
+            pending = self._save_deadline is not None
+        if pending:
             self.save()
 
     def load(self) -> bool:
@@ -1233,177 +1331,201 @@ class VdcHost:
     ) -> None:
         """Apply writable properties to a vdSD.
 
+        Keys are applied in the order of :attr:`_VDSD_SET_PROPERTY`,
+        whatever their order in the request; unknown keys are ignored.
+
         Supports wildcard expansion per §7.1.2: if a container property
         (e.g. ``buttonInputSettings``, ``scenes``) contains an
         empty-name entry (``""`` key from the protobuf wildcard), the
         value is applied to all existing items at that level.
         """
-        if "name" in incoming:
-            vdsd.name = incoming["name"]
-            logger.info(
-                "vdSD '%s' name set to '%s'", vdsd.dsuid, vdsd.name
-            )
-        if "zoneID" in incoming:
-            vdsd.zone_id = int(incoming["zoneID"])
-            logger.info(
-                "vdSD '%s' zoneID set to %d", vdsd.dsuid, vdsd.zone_id
-            )
-        if "progMode" in incoming:
-            val = incoming["progMode"]
-            vdsd.prog_mode = bool(val) if val is not None else None
-            logger.info(
-                "vdSD '%s' progMode set to %s", vdsd.dsuid, vdsd.prog_mode
-            )
+        for key, setter in self._VDSD_SET_PROPERTY.items():
+            if key in incoming:
+                setter(self, vdsd, incoming[key])
+
+    def _set_vdsd_name(self, vdsd: Any, value: Any) -> None:
+        vdsd.name = value
+        logger.info("vdSD '%s' name set to '%s'", vdsd.dsuid, vdsd.name)
+
+    def _set_vdsd_zone_id(self, vdsd: Any, value: Any) -> None:
+        vdsd.zone_id = int(value)
+        logger.info(
+            "vdSD '%s' zoneID set to %d", vdsd.dsuid, vdsd.zone_id
+        )
+
+    def _set_vdsd_prog_mode(self, vdsd: Any, value: Any) -> None:
+        vdsd.prog_mode = bool(value) if value is not None else None
+        logger.info(
+            "vdSD '%s' progMode set to %s", vdsd.dsuid, vdsd.prog_mode
+        )
+
+    def _set_vdsd_button_input_settings(
+        self, vdsd: Any, value: Any
+    ) -> None:
         # Button input settings (§4.2.2).
-        if "buttonInputSettings" in incoming:
-            btn_settings = incoming["buttonInputSettings"]
-            if isinstance(btn_settings, dict):
-                btn_settings = expand_setproperty_wildcards(
-                    btn_settings, vdsd._button_inputs.keys(),
-                )
-                for idx_str, settings in btn_settings.items():
-                    if isinstance(settings, dict):
-                        idx = int(idx_str)
-                        btn = vdsd.get_button_input(idx)
-                        if btn is not None:
-                            btn.apply_settings(settings)
-                            logger.info(
-                                "vdSD '%s' buttonInputSettings[%d] "
-                                "updated",
-                                vdsd.dsuid, idx,
-                            )
+        if not isinstance(value, dict):
+            return
+        value = expand_setproperty_wildcards(
+            value, vdsd._button_inputs.keys(),
+        )
+        for idx_str, settings in value.items():
+            if isinstance(settings, dict):
+                idx = int(idx_str)
+                btn = vdsd.get_button_input(idx)
+                if btn is not None:
+                    btn.apply_settings(settings)
+                    logger.info(
+                        "vdSD '%s' buttonInputSettings[%d] updated",
+                        vdsd.dsuid, idx,
+                    )
+
+    def _set_vdsd_binary_input_settings(
+        self, vdsd: Any, value: Any
+    ) -> None:
         # Binary input settings (§4.3.2).
-        if "binaryInputSettings" in incoming:
-            bi_settings = incoming["binaryInputSettings"]
-            if isinstance(bi_settings, dict):
-                bi_settings = expand_setproperty_wildcards(
-                    bi_settings, vdsd._binary_inputs.keys(),
-                )
-                for idx_str, settings in bi_settings.items():
-                    if isinstance(settings, dict):
-                        idx = int(idx_str)
-                        bi = vdsd.get_binary_input(idx)
-                        if bi is not None:
-                            bi.apply_settings(settings)
-                            logger.info(
-                                "vdSD '%s' binaryInputSettings[%d] "
-                                "updated",
-                                vdsd.dsuid, idx,
-                            )
+        if not isinstance(value, dict):
+            return
+        value = expand_setproperty_wildcards(
+            value, vdsd._binary_inputs.keys(),
+        )
+        for idx_str, settings in value.items():
+            if isinstance(settings, dict):
+                idx = int(idx_str)
+                bi = vdsd.get_binary_input(idx)
+                if bi is not None:
+                    bi.apply_settings(settings)
+                    logger.info(
+                        "vdSD '%s' binaryInputSettings[%d] updated",
+                        vdsd.dsuid, idx,
+                    )
+
+    def _set_vdsd_sensor_settings(self, vdsd: Any, value: Any) -> None:
         # Sensor input settings (§4.3.2).
-        if "sensorSettings" in incoming:
-            si_settings = incoming["sensorSettings"]
-            if isinstance(si_settings, dict):
-                si_settings = expand_setproperty_wildcards(
-                    si_settings, vdsd._sensor_inputs.keys(),
-                )
-                for idx_str, settings in si_settings.items():
-                    if isinstance(settings, dict):
-                        idx = int(idx_str)
-                        si = vdsd.get_sensor_input(idx)
-                        if si is not None:
-                            si.apply_settings(settings)
-                            logger.info(
-                                "vdSD '%s' sensorSettings[%d] "
-                                "updated",
-                                vdsd.dsuid, idx,
-                            )
-        # Output settings (§4.8.2).
-        if "outputSettings" in incoming:
-            out_settings = incoming["outputSettings"]
-            if isinstance(out_settings, dict):
-                output = getattr(vdsd, "output", None)
-                if output is not None:
-                    output.apply_settings(out_settings)
+        if not isinstance(value, dict):
+            return
+        value = expand_setproperty_wildcards(
+            value, vdsd._sensor_inputs.keys(),
+        )
+        for idx_str, settings in value.items():
+            if isinstance(settings, dict):
+                idx = int(idx_str)
+                si = vdsd.get_sensor_input(idx)
+                if si is not None:
+                    si.apply_settings(settings)
                     logger.info(
-                        "vdSD '%s' outputSettings updated",
-                        vdsd.dsuid,
+                        "vdSD '%s' sensorSettings[%d] updated",
+                        vdsd.dsuid, idx,
                     )
+
+    def _set_vdsd_output_settings(self, vdsd: Any, value: Any) -> None:
+        # Output settings (§4.8.2).
+        if not isinstance(value, dict):
+            return
+        output = getattr(vdsd, "output", None)
+        if output is not None:
+            output.apply_settings(value)
+            logger.info("vdSD '%s' outputSettings updated", vdsd.dsuid)
+
+    def _set_vdsd_output_state(self, vdsd: Any, value: Any) -> None:
         # Output state (§4.8.3) — only localPriority is writable.
-        if "outputState" in incoming:
-            out_state = incoming["outputState"]
-            if isinstance(out_state, dict):
-                output = getattr(vdsd, "output", None)
-                if output is not None:
-                    output.apply_state(out_state)
+        if not isinstance(value, dict):
+            return
+        output = getattr(vdsd, "output", None)
+        if output is not None:
+            output.apply_state(value)
+            logger.info("vdSD '%s' outputState updated", vdsd.dsuid)
+
+    def _set_vdsd_custom_actions(self, vdsd: Any, value: Any) -> None:
+        # Custom actions (§4.5.3) — user-writable.
+        if not isinstance(value, dict):
+            return
+        value = expand_setproperty_wildcards(
+            value, vdsd._custom_actions.keys(),
+        )
+        for idx_str, settings in value.items():
+            if isinstance(settings, dict):
+                idx = int(idx_str)
+                cust = vdsd.get_custom_action(idx)
+                if cust is not None:
+                    cust.apply_settings(settings)
                     logger.info(
-                        "vdSD '%s' outputState updated",
-                        vdsd.dsuid,
+                        "vdSD '%s' customActions[%d] updated",
+                        vdsd.dsuid, idx,
                     )
-        # Custom actions (§4.5.3) — user-writable.
-        if "customActions" in incoming:
-            ca_data = incoming["customActions"]
-            if isinstance(ca_data, dict):
-                ca_data = expand_setproperty_wildcards(
-                    ca_data, vdsd._custom_actions.keys(),
-                )
-                for idx_str, settings in ca_data.items():
-                    if isinstance(settings, dict):
-                        idx = int(idx_str)
-                        cust = vdsd.get_custom_action(idx)
-                        if cust is not None:
-                            cust.apply_settings(settings)
-                            logger.info(
-                                "vdSD '%s' customActions[%d] updated",
-                                vdsd.dsuid, idx,
-                            )
+
+    def _set_vdsd_channel_states(self, vdsd: Any, value: Any) -> None:
         # Channel states (§4.9.3) — dSS sends this via setProperty when
         # the user or JSON API sets an output channel value directly
         # (setVdcDeviceOutputChannelValues path).  Each child element is
         # named by the channel name string (e.g. "brightness") and
         # contains a "value" child with the new double.
-        if "channelStates" in incoming:
-            ch_states = incoming["channelStates"]
-            if isinstance(ch_states, dict):
-                output = getattr(vdsd, "output", None)
-                if output is not None:
-                    for ch_name, ch_data in ch_states.items():
-                        if not isinstance(ch_data, dict):
-                            continue
-                        new_val = ch_data.get("value")
-                        if new_val is None:
-                            continue
-                        # Locate channel by name.
-                        channel_obj = None
-                        for ch in output.channels.values():
-                            if ch.name == ch_name:
-                                channel_obj = ch
-                                break
-                        if channel_obj is None:
-                            logger.warning(
-                                "setProperty channelStates: channel '%s' "
-                                "not found on vdSD %s",
-                                ch_name, vdsd.dsuid,
-                            )
-                            continue
-                        output.buffer_channel_value(channel_obj, float(new_val))
-                        logger.debug(
-                            "setProperty channelStates: vdSD %s ch='%s' "
-                            "val=%s (buffered)",
-                            vdsd.dsuid, ch_name, new_val,
-                        )
-                    # apply_pending_channels is async; schedule it.
-                    import asyncio
-                    asyncio.ensure_future(output.apply_pending_channels())
-                    logger.info(
-                        "vdSD '%s' channelStates updated via setProperty",
-                        vdsd.dsuid,
-                    )
+        if not isinstance(value, dict):
+            return
+        output = getattr(vdsd, "output", None)
+        if output is None:
+            return
+        for ch_name, ch_data in value.items():
+            if not isinstance(ch_data, dict):
+                continue
+            new_val = ch_data.get("value")
+            if new_val is None:
+                continue
+            # Locate channel by name.
+            channel_obj = None
+            for ch in output.channels.values():
+                if ch.name == ch_name:
+                    channel_obj = ch
+                    break
+            if channel_obj is None:
+                logger.warning(
+                    "setProperty channelStates: channel '%s' "
+                    "not found on vdSD %s",
+                    ch_name, vdsd.dsuid,
+                )
+                continue
+            output.buffer_channel_value(channel_obj, float(new_val))
+            logger.debug(
+                "setProperty channelStates: vdSD %s ch='%s' "
+                "val=%s (buffered)",
+                vdsd.dsuid, ch_name, new_val,
+            )
+        # apply_pending_channels is async; schedule it.
+        asyncio.ensure_future(output.apply_pending_channels())
+        logger.info(
+            "vdSD '%s' channelStates updated via setProperty",
+            vdsd.dsuid,
+        )
+
+    def _set_vdsd_scenes(self, vdsd: Any, value: Any) -> None:
         # Scene settings (§4.1.4 / §4.10).
-        if "scenes" in incoming:
-            scene_data = incoming["scenes"]
-            if isinstance(scene_data, dict):
-                output = getattr(vdsd, "output", None)
-                if output is not None:
-                    # Expand wildcards to all known scene numbers.
-                    scene_data = expand_setproperty_wildcards(
-                        scene_data, output.scene_numbers,
-                    )
-                    output.apply_scenes(scene_data)
-                    logger.info(
-                        "vdSD '%s' scenes updated",
-                        vdsd.dsuid,
-                    )
+        if not isinstance(value, dict):
+            return
+        output = getattr(vdsd, "output", None)
+        if output is not None:
+            # Expand wildcards to all known scene numbers.
+            value = expand_setproperty_wildcards(
+                value, output.scene_numbers,
+            )
+            output.apply_scenes(value)
+            logger.info("vdSD '%s' scenes updated", vdsd.dsuid)
+
+    #: Writable vdSD property name → setter, built once with the class.
+    #: The order is the order in which the keys of a request are applied.
+    _VDSD_SET_PROPERTY: ClassVar[
+        Dict[str, Callable[["VdcHost", Any, Any], None]]
+    ] = {
+        "name": _set_vdsd_name,
+        "zoneID": _set_vdsd_zone_id,
+        "progMode": _set_vdsd_prog_mode,
+        "buttonInputSettings": _set_vdsd_button_input_settings,
+        "binaryInputSettings": _set_vdsd_binary_input_settings,
+        "sensorSettings": _set_vdsd_sensor_settings,
+        "outputSettings": _set_vdsd_output_settings,
+        "outputState": _set_vdsd_output_state,
+        "customActions": _set_vdsd_custom_actions,
+        "channelStates": _set_vdsd_channel_states,
+        "scenes": _set_vdsd_scenes,
+    }
 
     # ---- GenericRequest handler (§7.3.10+) -------------------------
 
@@ -2126,11 +2248,6 @@ class VdcHost:
         )
 
     def __del__(self) -> None:
-        # Cancel any pending auto-save timer.
-        timer = getattr(self, "_save_timer", None)
-        if timer is not None:
-            timer.cancel()
-
         # Best-effort cleanup hint.  Async resources should be released
         # via ``await host.stop()`` before the object is dropped.
         if self._zeroconf is not None:
@@ -65,7 +65,11 @@ Usage example::
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import operator
+import time
+from collections import deque
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -76,12 +80,14 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     Union,
 )
 
 from pydsvdcapi import vdc_messages_pb2 as pb
 from pydsvdcapi.dsuid import DsUid
 from pydsvdcapi.enums import ColorClass, ColorGroup
+from pydsvdcapi.property_handling import dict_to_elements
 
 if TYPE_CHECKING:
     from pydsvdcapi.actions import (
@@ -109,6 +115,25 @@ logger = logging.getLogger(__name__)
 #: Entity type string for a vdSD (common property ``type``).
 ENTITY_TYPE_VDSD: str = "vdSD"
 
+#: Highest sub-device index; it is the last byte of a vdSD's dSUID.
+_MAX_SUBDEVICE_INDEX: int = 0xFF
+
+_RESET_ANNOUNCEMENT = operator.methodcaller("reset_announcement")
+
+#: vdSD properties ignored when :meth:`Device.update` checks whether a
+#: callback only renamed vdSDs: the name itself, and volatile state
+#: that is pushed on its own.
+_RENAME_IGNORED_PROPERTIES: frozenset = frozenset({
+    "name",
+    "buttonInputStates",
+    "binaryInputStates",
+    "sensorStates",
+    "deviceStates",
+    "outputState",
+    "channelStates",
+    "controlValues",
+})
+
 #: Type alias for the control-value callback.
 #:
 #: Signature::
@@ -1582,8 +1607,9 @@ class Vdsd:
                 str(bi.ds_index): bi.get_settings_properties()
                 for bi in self._binary_inputs.values()
             }
+            now = time.monotonic()
             props["binaryInputStates"] = {
-                str(bi.ds_index): bi.get_state_properties()
+                str(bi.ds_index): bi.get_state_properties(now)
                 for bi in self._binary_inputs.values()
             }
 
@@ -2146,6 +2172,23 @@ class Vdsd:
             "vdSD '%s' vanished (dSUID %s)", self.name, self._dsuid
         )
 
+    async def _push_properties(
+        self, session: VdcSession, props: Dict[str, Any]
+    ) -> None:
+        """Push changed properties of this announced vdSD to the vdSM."""
+        msg = pb.Message()
+        msg.type = pb.VDC_SEND_PUSH_NOTIFICATION
+        msg.vdc_send_push_notification.dSUID = str(self._dsuid)
+        for elem in dict_to_elements(props):
+            msg.vdc_send_push_notification.changedproperties.append(elem)
+        try:
+            await session.send_notification(msg)
+        except (ConnectionError, OSError) as exc:
+            logger.warning(
+                "vdSD '%s': failed to push %s: %s",
+                self.name, sorted(props), exc,
+            )
+
     def reset_announcement(self) -> None:
         """Mark this vdSD as unannounced (e.g. on session disconnect)."""
         self._announced = False
@@ -2204,13 +2247,16 @@ class Device:
         self._vdc: Vdc = vdc
         # Store the device-level base dSUID (sub-device index 0).
         self._dsuid: DsUid = dsuid.device_base()
-        # Ordered list preserving insertion order.
-        self._vdsds: Dict[int, Vdsd] = {}  # keyed by subdevice_index
+        # Indexed by subdevice_index; unused indices hold None and the
+        # list never ends in None.  Sub-device indices are small and dense.
+        self._vdsds: List[Optional[Vdsd]] = []
         self._announced: bool = False
         # Required-callbacks manifest set by DeviceTemplate.instantiate().
         # None means no template was used; an empty dict means all callbacks
         # were already satisfied at template instantiation time.
         self._required_callbacks: Optional[Dict[str, None]] = None
+        # Serialises concurrent update() calls; created on first use.
+        self._update_lock: Optional[asyncio.Lock] = None
 
     # ---- accessors ---------------------------------------------------
 
@@ -2227,7 +2273,11 @@ class Device:
     @property
     def vdsds(self) -> Dict[int, Vdsd]:
         """All contained Vdsd instances keyed by sub-device index."""
-        return dict(self._vdsds)
+        return {
+            idx: vdsd
+            for idx, vdsd in enumerate(self._vdsds)
+            if vdsd is not None
+        }
 
     @property
     def is_announced(self) -> bool:
@@ -2269,7 +2319,10 @@ class Device:
                 f"base as device dSUID {self._dsuid}"
             )
         idx = vdsd.subdevice_index
-        self._vdsds[idx] = vdsd
+        vdsds = self._vdsds
+        if idx >= len(vdsds):
+            vdsds.extend([None] * (idx + 1 - len(vdsds)))
+        vdsds[idx] = vdsd
         logger.debug(
             "Added vdSD '%s' (sub-device %d) to device %s",
             vdsd.name, idx, self._dsuid,
@@ -2291,17 +2344,26 @@ class Device:
                 "Use device.update() to modify structure after "
                 "announcement."
             )
-        return self._vdsds.pop(subdevice_index, None)
+        vdsd = self.get_vdsd(subdevice_index)
+        if vdsd is None:
+            return None
+        vdsds = self._vdsds
+        vdsds[subdevice_index] = None
+        while vdsds and vdsds[-1] is None:
+            vdsds.pop()
+        return vdsd
 
     def get_vdsd(self, subdevice_index: int) -> Optional[Vdsd]:
         """Look up a vdSD by sub-device index."""
-        return self._vdsds.get(subdevice_index)
+        if 0 <= subdevice_index < len(self._vdsds):
+            return self._vdsds[subdevice_index]
+        return None
 
     def get_vdsd_by_dsuid(self, dsuid: DsUid) -> Optional[Vdsd]:
         """Look up a vdSD by its full dSUID."""
         dsuid_str = str(dsuid)
-        for vdsd in self._vdsds.values():
-            if str(vdsd.dsuid) == dsuid_str:
+        for vdsd in self._vdsds:
+            if vdsd is not None and str(vdsd.dsuid) == dsuid_str:
                 return vdsd
         return None
 
@@ -2313,9 +2375,9 @@ class Device:
         Only called when ``self._required_callbacks`` is not ``None``
         (i.e. the device was created from a template).
         """
-        vdsds_by_index = {
-            idx: vdsd for idx, vdsd in enumerate(self._vdsds.values())
-        }
+        vdsds_by_index = dict(enumerate(
+            vdsd for vdsd in self._vdsds if vdsd is not None
+        ))
         missing: List[str] = []
         for path in (self._required_callbacks or {}):
             # Parse path: "vdsds[N].attr" or "vdsds[N].output.attr"
@@ -2382,8 +2444,10 @@ class Device:
         # visible to vdc.announce_devices() on reconnect.  Idempotent.
         self._vdc.add_device(self)
 
+        # Snapshot: vdSDs are announced one await at a time.
+        vdsds = [vdsd for vdsd in self._vdsds if vdsd is not None]
         count = 0
-        for vdsd in self._vdsds.values():
+        for vdsd in vdsds:
             try:
                 ok = await vdsd.announce(session)
                 if ok:
@@ -2393,26 +2457,40 @@ class Device:
                     "Failed to announce vdSD '%s'", vdsd.name
                 )
 
-        self._announced = count == len(self._vdsds)
+        self._announced = count == len(vdsds)
         logger.info(
             "Device %s: announced %d/%d vdSDs",
-            self._dsuid, count, len(self._vdsds),
+            self._dsuid, count, len(vdsds),
         )
         return count
 
+    @staticmethod
+    async def _vanish_vdsd(vdsd: Vdsd, session: VdcSession) -> None:
+        """Vanish a single vdSD, logging (not raising) on failure.
+
+        Cancellation is always propagated so that an enclosing
+        ``gather`` or task cancel is not swallowed.  The traceback is
+        only captured when ERROR logging is actually enabled.
+        """
+        try:
+            await vdsd.vanish(session)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Failed to vanish vdSD '%s': %r",
+                    vdsd.name, exc, exc_info=True,
+                )
+
     async def vanish(self, session: VdcSession) -> None:
         """Notify the vdSM that all vdSDs of this device have vanished.
 
         Sends ``VDC_SEND_VANISH`` for each announced vdSD.
         """
-        for vdsd in self._vdsds.values():
-            if vdsd.is_announced:
-                try:
-                    await vdsd.vanish(session)
-                except Exception:  # noqa: BLE001
-                    logger.exception(
-                        "Failed to vanish vdSD '%s'", vdsd.name
-                    )
+        for vdsd in self._vdsds:
+            if vdsd is not None and vdsd.is_announced:
+                await self._vanish_vdsd(vdsd, session)
         self._announced = False
         logger.info("Device %s: all vdSDs vanished", self._dsuid)
 
@@ -2428,6 +2506,15 @@ class Device:
         announced.  The dSS cannot handle in-place structural updates,
         so the device must vanish first.
 
+        The vanish notifications are sent once *modify* has returned.
+        If it did nothing but rename announced vdSDs, they are not sent
+        at all: the device stays announced and the new names are pushed
+        with ``VDC_SEND_PUSH_NOTIFICATION`` instead.  If *modify*
+        raises, the device is vanished and left unannounced, and the
+        exception propagates.
+
+        Concurrent calls on the same device are serialised.
+
         Parameters
         ----------
         session:
@@ -2440,7 +2527,7 @@ class Device:
         Returns
         -------
         int
-            Number of vdSDs successfully re-announced.
+            Number of vdSDs announced after the update.
 
         Example::
 
@@ -2451,15 +2538,60 @@ class Device:
 
             await device.update(session, reconfigure)
         """
-        # Step 1: Vanish all currently announced vdSDs.
-        if self._announced:
-            await self.vanish(session)
+        if self._update_lock is None:
+            self._update_lock = asyncio.Lock()
+        async with self._update_lock:
+            return await self._update(session, modify)
 
-        # Step 2: Mark as unannounced to allow structural modifications.
+    async def _update(
+        self,
+        session: VdcSession,
+        modify: Callable[[Device], None],
+    ) -> int:
+        """Body of :meth:`update`, run while holding the update lock."""
+        announced = [
+            vdsd for vdsd in self._vdsds
+            if vdsd is not None and vdsd.is_announced
+        ]
+        before = self._rename_snapshot() if self._announced else None
+
+        # Step 1: Mark everything as unannounced to allow structural
+        # modifications.  Nothing is sent yet, so a rename-only change
+        # can still be pushed in place below.
         self._announced = False
+        for vdsd in announced:
+            vdsd._announced = False
 
-        # Step 3: Let the caller modify the device.
-        modify(self)
+        # Step 2: Let the caller modify the device.
+        try:
+            modify(self)
+        except BaseException:
+            await self._vanish_all(session, announced)
+            raise
+
+        # Fast path: only the names of announced vdSDs changed.
+        if before is not None and len(announced) == len(before[0]):
+            after = self._rename_snapshot()
+            if after[0] == before[0] and after[2] == before[2]:
+                renamed = [
+                    vdsd
+                    for vdsd, old, new in zip(announced, before[1], after[1])
+                    if old != new
+                ]
+                if renamed:
+                    self._announced = True
+                    for vdsd in announced:
+                        vdsd._announced = True
+                    for vdsd in renamed:
+                        await vdsd._push_properties(
+                            session, {"name": vdsd.name}
+                        )
+                    self._vdc._schedule_auto_save()
+                    return len(announced)
+
+        # Step 3: Vanish every vdSD that was announced before the
+        # modification, including those removed by the callback.
+        await self._vanish_all(session, announced)
 
         # Step 4: Re-announce.
         count = await self.announce(session)
@@ -2469,13 +2601,46 @@ class Device:
 
         return count
 
+    def _rename_snapshot(
+        self,
+    ) -> Tuple[List[Vdsd], List[str], List[Dict[str, Any]]]:
+        """Return the vdSDs, their names and their remaining properties.
+
+        :meth:`update` compares two snapshots to tell a rename-only
+        callback from any other change.
+        """
+        vdsds = [vdsd for vdsd in self._vdsds if vdsd is not None]
+        ignored = _RENAME_IGNORED_PROPERTIES
+        return (
+            vdsds,
+            [vdsd.name for vdsd in vdsds],
+            [
+                {
+                    key: value
+                    for key, value in vdsd.get_properties().items()
+                    if key not in ignored
+                }
+                for vdsd in vdsds
+            ],
+        )
+
+    async def _vanish_all(
+        self, session: VdcSession, vdsds: List[Vdsd]
+    ) -> None:
+        """Vanish *vdsds* and leave the device unannounced."""
+        for vdsd in vdsds:
+            await self._vanish_vdsd(vdsd, session)
+        self._announced = False
+        logger.info("Device %s: all vdSDs vanished", self._dsuid)
+
     def reset_announcement(self) -> None:
         """Reset announcement state for this device and all vdSDs.
 
         Called by the vDC when the session ends.
         """
-        for vdsd in self._vdsds.values():
-            vdsd.reset_announcement()
+        # Runs for every device on each session end; drain the map in C.
+        # filter(None, ...) skips the unused slots; vdSDs are truthy.
+        deque(map(_RESET_ANNOUNCEMENT, filter(None, self._vdsds)), maxlen=0)
         self._announced = False
 
     # ---- persistence -------------------------------------------------
@@ -2514,7 +2679,8 @@ class Device:
             "baseDsUID": str(self._dsuid),
             "vdsds": [
                 vdsd.get_property_tree()
-                for vdsd in self._vdsds.values()
+                for vdsd in self._vdsds
+                if vdsd is not None
             ],
         }
 
@@ -2524,34 +2690,64 @@ class Device:
         Creates Vdsd instances for any entries in ``vdsds`` that do
         not already exist.  Existing vdSDs matched by sub-device
         index are updated in-place.
+
+        Raises
+        ------
+        ValueError
+            If a persisted ``subdeviceIndex`` is not an integer in
+            0-255.  Nothing is changed in that case.
         """
+        vdsd_states = state.get("vdsds", ())
+        # Reject bad indices before touching the index list: a negative
+        # one would overwrite a vdSD counted from the end, a huge one
+        # would allocate a huge list.
+        for vdsd_state in vdsd_states:
+            idx = vdsd_state.get("subdeviceIndex", 0)
+            if (
+                not isinstance(idx, int)
+                or not 0 <= idx <= _MAX_SUBDEVICE_INDEX
+            ):
+                raise ValueError(
+                    f"Invalid persisted subdeviceIndex {idx!r} "
+                    f"(must be 0-{_MAX_SUBDEVICE_INDEX})"
+                )
+
         if "baseDsUID" in state:
             self._dsuid = DsUid.from_string(
                 state["baseDsUID"]
             ).device_base()
 
-        for vdsd_state in state.get("vdsds", []):
-            idx = vdsd_state.get("subdeviceIndex", 0)
-            vdsd = self._vdsds.get(idx)
+        vdsds = self._vdsds
+        # Grow the index list once for the highest persisted index.
+        size = max(
+            (s.get("subdeviceIndex", 0) + 1 for s in vdsd_states),
+            default=0,
+        )
+        if size > len(vdsds):
+            vdsds.extend([None] * (size - len(vdsds)))
+
+        # Bind loop invariants once; restored states can be large.
+        black = ColorClass.BLACK
+        for vdsd_state in vdsd_states:
+            get = vdsd_state.get
+            idx = get("subdeviceIndex", 0)
+            vdsd = vdsds[idx]
             if vdsd is None:
                 # Create a new Vdsd for this persisted entry.
-                primary_group = ColorClass(
-                    vdsd_state.get("primaryGroup", ColorClass.BLACK)
-                )
-                vdsd = Vdsd(
+                vdsd = vdsds[idx] = Vdsd(
                     device=self,
                     subdevice_index=idx,
-                    primary_group=primary_group,
-                    name=vdsd_state.get("name") or f"Device {idx}",
-                    model=vdsd_state.get("model") or "Restored vdSD",
+                    primary_group=ColorClass(get("primaryGroup", black)),
+                    name=get("name") or f"Device {idx}",
+                    model=get("model") or "Restored vdSD",
                 )
-                self._vdsds[idx] = vdsd
             vdsd._apply_state(vdsd_state)
 
     # ---- dunder -------------------------------------------------------
 
     def __repr__(self) -> str:
-        n = len(self._vdsds)
+        n = len(self._vdsds) - self._vdsds.count(None)
         return (
             f"Device(dsuid={self._dsuid!r}, vdsds={n})"
         )
+
@@ -8,7 +8,12 @@ from unittest.mock import patch
 import pytest
 import yaml
 
+from pydsvdcapi.dsuid import DsUid, DsUidNamespace
+from pydsvdcapi.enums import ColorClass, SensorType
+from pydsvdcapi.sensor_input import SensorInput
+from pydsvdcapi.vdc import Vdc
 from pydsvdcapi.vdc_host import AUTO_SAVE_DELAY, VdcHost
+from pydsvdcapi.vdsd import Device, Vdsd
 
 TEST_MAC = "AA:BB:CC:DD:EE:FF"
 
@@ -18,7 +23,11 @@ TEST_MAC = "AA:BB:CC:DD:EE:FF"
 # ---------------------------------------------------------------------------
 
 def _wait_for_auto_save(margin: float = 0.3) -> None:
-    """Sleep long enough for the debounce timer to fire."""
+    """Sleep long enough for the debounce timer to fire.
+
+    Only for tests that check the debounce timing itself; everything
+    else uses ``VdcHost._fire_autosave_now()``.
+    """
     time.sleep(AUTO_SAVE_DELAY + margin)
 
 
@@ -34,7 +43,7 @@ class TestAutoSaveTriggers:
         assert not path.exists()  # nothing saved yet
 
         host.name = "Changed"
-        _wait_for_auto_save()
+        host._fire_autosave_now()
 
         assert path.is_file()
         data = yaml.safe_load(path.read_text())
@@ -45,7 +54,7 @@ class TestAutoSaveTriggers:
         host = VdcHost(mac=TEST_MAC, state_path=path)
 
         host.model = "New Model"
-        _wait_for_auto_save()
+        host._fire_autosave_now()
 
         data = yaml.safe_load(path.read_text())
         assert data["vdcHost"]["model"] == "New Model"
@@ -55,7 +64,7 @@ class TestAutoSaveTriggers:
         host = VdcHost(mac=TEST_MAC, state_path=path)
 
         host.vendor_name = "AcmeCorp"
-        _wait_for_auto_save()
+        host._fire_autosave_now()
 
         data = yaml.safe_load(path.read_text())
         assert data["vdcHost"]["vendorName"] == "AcmeCorp"
@@ -66,7 +75,7 @@ class TestAutoSaveTriggers:
             p = tmp_path / f"{attr}.yaml"
             host = VdcHost(mac=TEST_MAC, state_path=p)
             setattr(host, attr, "test_value")
-            _wait_for_auto_save()
+            host._fire_autosave_now()
             assert p.is_file(), f"Auto-save not triggered for {attr}"
 
 
@@ -104,6 +113,26 @@ class TestAutoSaveDebounce:
 
             assert mock_save.call_count == 1
 
+    def test_hosts_share_one_worker_thread(self, tmp_path):
+        """Rescheduling must not spawn threads per change or per host."""
+        h1 = VdcHost(mac=TEST_MAC, state_path=tmp_path / "h1.yaml")
+        before = threading.active_count()
+
+        h2 = VdcHost(mac=TEST_MAC, state_path=tmp_path / "h2.yaml")
+        for i in range(20):
+            h1.name = f"N{i}"
+            h2.name = f"M{i}"
+        assert threading.active_count() == before
+        h1._cancel_auto_save()
+        h2._cancel_auto_save()
+
+    def test_cancelled_save_does_not_fire(self, tmp_path):
+        path = tmp_path / "host.yaml"
+        host = VdcHost(mac=TEST_MAC, state_path=path)
+        host._cancel_auto_save()
+        _wait_for_auto_save()
+        assert not path.exists()
+
 
 # ---------------------------------------------------------------------------
 # No auto-save without persistence
@@ -116,7 +145,7 @@ class TestNoAutoSaveWithoutStore:
         assert not host._auto_save_enabled
 
         host.name = "Changed"
-        assert host._save_timer is None
+        assert host._save_deadline is None
 
     def test_init_does_not_trigger_immediate_save(self, tmp_path):
         """Property assignments during __init__ must not trigger an
@@ -133,7 +162,7 @@ class TestNoAutoSaveWithoutStore:
         # has not fired yet.
         assert not path.exists()
         # But a timer IS scheduled for the initial save.
-        assert host._save_timer is not None
+        assert host._save_deadline is not None
         # Cancel it to avoid side effects.
         host._cancel_auto_save()
 
@@ -194,7 +223,7 @@ class TestFlush:
         assert path.is_file()
         data = yaml.safe_load(path.read_text())
         assert data["vdcHost"]["name"] == "After"
-        assert host._save_timer is None
+        assert host._save_deadline is None
 
     def test_flush_noop_when_nothing_pending(self, tmp_path):
         path = tmp_path / "host.yaml"
@@ -214,10 +243,10 @@ class TestFlush:
         host = VdcHost(mac=TEST_MAC, state_path=path)
 
         host.name = "Changed"
-        assert host._save_timer is not None
+        assert host._save_deadline is not None
 
         host.flush()
-        assert host._save_timer is None
+        assert host._save_deadline is None
 
 
 # ---------------------------------------------------------------------------
@@ -231,10 +260,10 @@ class TestManualSaveCancels:
         host = VdcHost(mac=TEST_MAC, state_path=path)
 
         host.name = "Changed"
-        assert host._save_timer is not None
+        assert host._save_deadline is not None
 
         host.save()
-        assert host._save_timer is None
+        assert host._save_deadline is None
 
     def test_no_spurious_auto_save_after_manual_save(self, tmp_path):
         """After manual save(), the debounce timer must not fire."""
@@ -267,5 +296,47 @@ class TestPrivateAttrsIgnored:
 
         host._active = False
         host._port = 9999
-        assert host._save_timer is None
+        assert host._save_deadline is None
         assert not path.exists()
+
+
+# ---------------------------------------------------------------------------
+# Auto-save sees changes that bypass the auto-save chain
+# ---------------------------------------------------------------------------
+
+class TestAutoSaveFreshTree:
+
+    def test_sensor_rename_reaches_auto_save(self, tmp_path):
+        """SensorInput.name does not report the change; the next
+        auto-save must still write the new name, not a cached tree."""
+        path = tmp_path / "host.yaml"
+        host = VdcHost(mac=TEST_MAC, state_path=path, name="Host")
+        vdc = Vdc(
+            host=host, implementation_id="x-test-as", name="vDC", model="m"
+        )
+        device = Device(
+            vdc=vdc,
+            dsuid=DsUid.from_name_in_space(
+                "auto-save-device", DsUidNamespace.VDC
+            ),
+        )
+        vdsd = Vdsd(
+            device=device, primary_group=ColorClass.BLACK,
+            name="vdSD", model="m",
+        )
+        vdsd.add_sensor_input(SensorInput(
+            vdsd=vdsd, name="Old Name", sensor_type=SensorType.TEMPERATURE,
+            min_value=-20.0, max_value=60.0, resolution=0.1,
+        ))
+        device.add_vdsd(vdsd)
+        vdc.add_device(device)
+        host.add_vdc(vdc)
+        host.save()
+
+        vdsd.get_sensor_input(0).name = "New Name"
+        host.name = "Host 2"
+        host._fire_autosave_now()
+
+        text = path.read_text()
+        assert "New Name" in text
+        assert "Old Name" not in text
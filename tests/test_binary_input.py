@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import time
 from typing import Any, Dict, Optional
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -33,6 +35,18 @@ from pydsvdcapi.vdsd import Device, Vdsd
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Wire (int) values of the enum members asserted below.
+_BATTERY_LOW = int(BinaryInputType.BATTERY_LOW)
+_MOTION = int(BinaryInputType.MOTION)
+_PRESENCE = int(BinaryInputType.PRESENCE)
+_SMOKE = int(BinaryInputType.SMOKE)
+_WIND = int(BinaryInputType.WIND)
+_USAGE_OUTDOOR_CLIMATE = int(BinaryInputUsage.OUTDOOR_CLIMATE)
+_USAGE_ROOM_CLIMATE = int(BinaryInputUsage.ROOM_CLIMATE)
+_ERROR_LOW_BATTERY = int(InputError.LOW_BATTERY)
+_ERROR_OK = int(InputError.OK)
+_ERROR_SHORT_CIRCUIT = int(InputError.SHORT_CIRCUIT)
+
 
 def _make_host(**kwargs: Any) -> VdcHost:
     kw: dict[str, Any] = {"name": "Test Host", "mac": "AA:BB:CC:DD:EE:FF"}
@@ -72,16 +86,50 @@ def _make_vdsd(device: Device, **kwargs: Any) -> Vdsd:
     return Vdsd(**defaults)
 
 
+_BI_DEFAULTS: Dict[str, Any] = {
+    "ds_index": 0,
+    "sensor_function": BinaryInputType.PRESENCE,
+    "input_usage": BinaryInputUsage.ROOM_CLIMATE,
+    "name": "PIR Sensor",
+}
+
+#: Never attached or mutated; default inputs are shallow copies of it.
+_BI_PROTOTYPE = BinaryInput(vdsd=None, **_BI_DEFAULTS)  # type: ignore[arg-type]
+
+
 def _make_binary_input(vdsd: Vdsd, **kwargs: Any) -> BinaryInput:
-    defaults: dict[str, Any] = {
-        "vdsd": vdsd,
-        "ds_index": 0,
-        "sensor_function": BinaryInputType.PRESENCE,
-        "input_usage": BinaryInputUsage.ROOM_CLIMATE,
-        "name": "PIR Sensor",
-    }
-    defaults.update(kwargs)
-    return BinaryInput(**defaults)
+    if not kwargs:
+        bi = copy.copy(_BI_PROTOTYPE)
+        bi._vdsd = vdsd
+        return bi
+    return BinaryInput(vdsd=vdsd, **{**_BI_DEFAULTS, **kwargs})
+
+
+@pytest.fixture(scope="module")
+def shared_vdc() -> Vdc:
+    """A host and vDC shared by the module's ``vdsd`` fixtures.
+
+    Devices built on it are never added to it, so tests cannot see
+    each other through the vDC.
+    """
+    return _make_vdc(_make_host())
+
+
+@pytest.fixture
+def vdsd(shared_vdc: Vdc) -> Vdsd:
+    """A fresh, unattached device → vdSD pair for a single test."""
+    return _make_vdsd(_make_device(shared_vdc))
+
+
+def _touch(bi: BinaryInput, value: Optional[bool]) -> None:
+    """Record *value* as just reported, without the async push path.
+
+    For tests that only need a timestamped value; anything checking
+    :meth:`BinaryInput.update_value` itself must await it.
+    """
+    bi._value = value
+    bi._extended_value = None
+    bi._last_update = time.monotonic()
 
 
 def _make_mock_session() -> MagicMock:
@@ -91,6 +139,13 @@ def _make_mock_session() -> MagicMock:
     return session
 
 
+@pytest.fixture
+def session() -> MagicMock:
+    """A fresh mock session whose ``send_notification`` is an
+    ``AsyncMock``."""
+    return _make_mock_session()
+
+
 # ===========================================================================
 # Construction and defaults
 # ===========================================================================
@@ -99,11 +154,7 @@ def _make_mock_session() -> MagicMock:
 class TestBinaryInputConstruction:
     """Tests for BinaryInput creation and default values."""
 
-    def test_default_construction(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_default_construction(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         assert bi.ds_index == 0
@@ -116,12 +167,7 @@ class TestBinaryInputConstruction:
         assert bi.update_interval == 0.0
         assert bi.vdsd is vdsd
 
-    def test_custom_construction(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_custom_construction(self, vdsd):
         bi = BinaryInput(
             vdsd=vdsd,
             ds_index=2,
@@ -143,11 +189,7 @@ class TestBinaryInputConstruction:
         assert bi.group == 5
         assert bi.update_interval == 10.0
 
-    def test_repr(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_repr(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         r = repr(bi)
@@ -165,11 +207,7 @@ class TestBinaryInputConstruction:
 class TestBinaryInputStateDefaults:
     """Tests for initial state values."""
 
-    def test_initial_value_is_none(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_initial_value_is_none(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         assert bi.value is None
@@ -177,11 +215,7 @@ class TestBinaryInputStateDefaults:
         assert bi.age is None
         assert bi.error == InputError.OK
 
-    def test_error_setter(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_error_setter(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         bi.error = InputError.LOW_BATTERY
@@ -199,21 +233,13 @@ class TestBinaryInputStateDefaults:
 class TestBinaryInputSettings:
     """Tests for settings property accessors."""
 
-    def test_group_setter(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_group_setter(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         bi.group = 3
         assert bi.group == 3
 
-    def test_sensor_function_setter(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_sensor_function_setter(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         bi.sensor_function = BinaryInputType.WIND
@@ -222,11 +248,7 @@ class TestBinaryInputSettings:
         bi.sensor_function = 7  # SMOKE
         assert bi.sensor_function == BinaryInputType.SMOKE
 
-    def test_apply_settings(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_apply_settings(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         bi.apply_settings({"group": 4, "sensorFunction": 12})
@@ -234,11 +256,7 @@ class TestBinaryInputSettings:
         assert bi.group == 4
         assert bi.sensor_function == BinaryInputType.BATTERY_LOW
 
-    def test_apply_settings_partial(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_apply_settings_partial(self, vdsd):
         bi = _make_binary_input(vdsd, group=1)
 
         bi.apply_settings({"group": 9})
@@ -256,11 +274,7 @@ class TestBinaryInputSettings:
 class TestBinaryInputDescriptionProperties:
     """Tests for the description property dict."""
 
-    def test_description_dict(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_description_dict(self, vdsd):
         bi = _make_binary_input(
             vdsd,
             hardwired_function=BinaryInputType.BATTERY_LOW,
@@ -272,10 +286,20 @@ class TestBinaryInputDescriptionProperties:
         assert desc["name"] == "PIR Sensor"
         assert desc["dsIndex"] == 0
         assert desc["inputType"] == INPUT_TYPE_DETECTS_CHANGES
-        assert desc["inputUsage"] == int(BinaryInputUsage.ROOM_CLIMATE)
-        assert desc["sensorFunction"] == int(BinaryInputType.BATTERY_LOW)
+        assert desc["inputUsage"] == _USAGE_ROOM_CLIMATE
+        assert desc["sensorFunction"] == _BATTERY_LOW
         assert desc["updateInterval"] == 5.0
 
+    def test_description_dict_tracks_name_change(self, vdsd):
+        bi = _make_binary_input(vdsd)
+
+        desc = bi.get_description_properties()
+        desc["name"] = "mutated"
+        assert bi.get_description_properties()["name"] == "PIR Sensor"
+
+        bi.name = "Hallway"
+        assert bi.get_description_properties()["name"] == "Hallway"
+
 
 # ===========================================================================
 # Settings properties dict
@@ -285,19 +309,22 @@ class TestBinaryInputDescriptionProperties:
 class TestBinaryInputSettingsProperties:
     """Tests for the settings property dict."""
 
-    def test_settings_dict(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_settings_dict(self, vdsd):
         bi = _make_binary_input(vdsd, group=3)
 
         settings = bi.get_settings_properties()
 
         assert settings["group"] == 3
-        assert settings["sensorFunction"] == int(
-            BinaryInputType.PRESENCE
-        )
+        assert settings["sensorFunction"] == _PRESENCE
+
+    def test_settings_dict_tracks_changes(self, vdsd):
+        bi = _make_binary_input(vdsd, group=3)
+
+        assert bi.get_settings_properties()["group"] == 3
+        bi.group = 5
+        assert bi.get_settings_properties()["group"] == 5
+        bi.apply_settings({"sensorFunction": _SMOKE})
+        assert bi.get_settings_properties()["sensorFunction"] == _SMOKE
 
 
 # ===========================================================================
@@ -308,11 +335,7 @@ class TestBinaryInputSettingsProperties:
 class TestBinaryInputStateProperties:
     """Tests for the state property dict."""
 
-    def test_state_dict_initial(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_state_dict_initial(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         state = bi.get_state_properties()
@@ -320,14 +343,10 @@ class TestBinaryInputStateProperties:
         # Initially no value and no age.
         assert state["value"] is None
         assert state["age"] is None
-        assert state["error"] == int(InputError.OK)
+        assert state["error"] == _ERROR_OK
         assert "extendedValue" not in state
 
-    def test_state_dict_with_bool_value(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_state_dict_with_bool_value(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         # Manually set value.
@@ -341,11 +360,7 @@ class TestBinaryInputStateProperties:
         assert state["age"] >= 0.0
         assert "extendedValue" not in state
 
-    def test_state_dict_with_extended_value(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_state_dict_with_extended_value(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         bi._extended_value = 2  # e.g. tilted
@@ -357,17 +372,13 @@ class TestBinaryInputStateProperties:
         assert "value" not in state  # extendedValue takes precedence
         assert state["age"] is not None
 
-    def test_state_dict_with_error(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_state_dict_with_error(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         bi.error = InputError.LOW_BATTERY
 
         state = bi.get_state_properties()
-        assert state["error"] == int(InputError.LOW_BATTERY)
+        assert state["error"] == _ERROR_LOW_BATTERY
 
 
 # ===========================================================================
@@ -378,12 +389,7 @@ class TestBinaryInputStateProperties:
 class TestBinaryInputValueUpdate:
     """Tests for update_value / update_extended_value."""
 
-    @pytest.mark.asyncio
-    async def test_update_value_sets_value(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_value_sets_value(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         await bi.update_value(True)
@@ -393,12 +399,7 @@ class TestBinaryInputValueUpdate:
         assert bi.age is not None
         assert bi.age < 1.0
 
-    @pytest.mark.asyncio
-    async def test_update_value_clears_extended(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_value_clears_extended(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         bi._extended_value = 5
@@ -407,12 +408,7 @@ class TestBinaryInputValueUpdate:
         assert bi.value is False
         assert bi.extended_value is None
 
-    @pytest.mark.asyncio
-    async def test_update_extended_value_sets_extended(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_extended_value_sets_extended(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         await bi.update_extended_value(2)
@@ -420,12 +416,7 @@ class TestBinaryInputValueUpdate:
         assert bi.extended_value == 2
         assert bi.value is None
 
-    @pytest.mark.asyncio
-    async def test_update_extended_value_clears_bool(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_extended_value_clears_bool(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         bi._value = True
@@ -434,23 +425,13 @@ class TestBinaryInputValueUpdate:
         assert bi.value is None
         assert bi.extended_value == 1
 
-    @pytest.mark.asyncio
-    async def test_update_value_none(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_value_none(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         await bi.update_value(None)
         assert bi.value is None
 
-    @pytest.mark.asyncio
-    async def test_update_error(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_error(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         await bi.update_error(InputError.OPEN_CIRCUIT)
@@ -465,22 +446,16 @@ class TestBinaryInputValueUpdate:
 class TestBinaryInputPushNotification:
     """Tests for the push notification logic."""
 
-    @pytest.mark.asyncio
-    async def test_push_sent_when_announced(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_sent_when_announced(self, vdsd, session):
         bi = _make_binary_input(vdsd)
         vdsd.add_binary_input(bi)
 
-        session = _make_mock_session()
         vdsd._announced = True  # simulate announced state
 
         await bi.update_value(True, session)
 
-        session.send_notification.assert_called_once()
-        msg = session.send_notification.call_args[0][0]
+        session.send_notification.assert_awaited_once()
+        (msg,) = session.send_notification.await_args.args
         assert msg.type == pb.VDC_SEND_PUSH_NOTIFICATION
         assert msg.vdc_send_push_notification.dSUID == str(vdsd.dsuid)
 
@@ -493,27 +468,16 @@ class TestBinaryInputPushNotification:
         assert "0" in states
         assert states["0"]["value"] is True
 
-    @pytest.mark.asyncio
-    async def test_push_not_sent_when_not_announced(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_not_sent_when_not_announced(self, vdsd, session):
         bi = _make_binary_input(vdsd)
 
-        session = _make_mock_session()
         # vdsd._announced is False by default
 
         await bi.update_value(True, session)
 
-        session.send_notification.assert_not_called()
+        session.send_notification.assert_not_awaited()
 
-    @pytest.mark.asyncio
-    async def test_push_not_sent_when_no_session(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_not_sent_when_no_session(self, vdsd):
         bi = _make_binary_input(vdsd)
         vdsd._announced = True
 
@@ -521,21 +485,14 @@ class TestBinaryInputPushNotification:
         await bi.update_value(True)
         # Should not raise.
 
-    @pytest.mark.asyncio
-    async def test_push_extended_value(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_extended_value(self, vdsd, session):
         bi = _make_binary_input(vdsd)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await bi.update_extended_value(2, session)
 
-        session.send_notification.assert_called_once()
-        msg = session.send_notification.call_args[0][0]
+        session.send_notification.assert_awaited_once()
+        (msg,) = session.send_notification.await_args.args
         props = elements_to_dict(
             msg.vdc_send_push_notification.changedproperties
         )
@@ -543,53 +500,107 @@ class TestBinaryInputPushNotification:
         assert states["extendedValue"] == 2
         assert "value" not in states
 
-    @pytest.mark.asyncio
-    async def test_push_error_update(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_error_update(self, vdsd, session):
+        bi = _make_binary_input(vdsd)
+        vdsd._announced = True
+
+        await bi.update_error(InputError.SHORT_CIRCUIT, session)
+
+        session.send_notification.assert_awaited_once()
+        (msg,) = session.send_notification.await_args.args
+        props = elements_to_dict(
+            msg.vdc_send_push_notification.changedproperties
+        )
+        assert props["binaryInputStates"]["0"]["error"] == _ERROR_SHORT_CIRCUIT
+
+    async def test_unchanged_value_not_pushed_again(self, vdsd, session):
         bi = _make_binary_input(vdsd)
         vdsd._announced = True
 
-        session = _make_mock_session()
+        await bi.update_value(True, session)
+        first_update = bi._last_update
+        await bi.update_value(True, session)
+        await bi.update_extended_value(2, session)
+        await bi.update_extended_value(2, session)
+        await bi.update_error(InputError.OK, session)
+
+        assert session.send_notification.await_count == 2
+        # The repeated report still refreshes the age.
+        assert bi._last_update >= first_update
+
+    async def test_force_pushes_unchanged_value(self, vdsd, session):
+        bi = _make_binary_input(vdsd)
+        vdsd._announced = True
+
+        await bi.update_value(False, session)
+        await bi.update_value(False, session, force=True)
+        await bi.update_error(InputError.OK, session, force=True)
+
+        assert session.send_notification.await_count == 3
+
+    async def test_value_held_before_announce_pushed_after(
+        self, vdsd, session
+    ):
+        """A value stored while unannounced is pushed when re-reported."""
+        bi = _make_binary_input(vdsd)
+
+        await bi.update_value(True, session)
+        await bi.update_extended_value(2, session)
+        session.send_notification.assert_not_awaited()
+
+        vdsd._announced = True
+        await bi.update_extended_value(2, session)
+
+        session.send_notification.assert_awaited_once()
+
+    async def test_error_held_before_announce_pushed_after(
+        self, vdsd, session
+    ):
+        """An error stored while unannounced is pushed when re-reported."""
+        bi = _make_binary_input(vdsd)
 
         await bi.update_error(InputError.SHORT_CIRCUIT, session)
+        session.send_notification.assert_not_awaited()
 
-        session.send_notification.assert_called_once()
-        msg = session.send_notification.call_args[0][0]
+        vdsd._announced = True
+        await bi.update_error(InputError.SHORT_CIRCUIT, session)
+        await bi.update_error(InputError.SHORT_CIRCUIT, session)
+
+        session.send_notification.assert_awaited_once()
+        (msg,) = session.send_notification.await_args.args
         props = elements_to_dict(
             msg.vdc_send_push_notification.changedproperties
         )
-        assert props["binaryInputStates"]["0"]["error"] == int(
-            InputError.SHORT_CIRCUIT
+        assert props["binaryInputStates"]["0"]["error"] == _ERROR_SHORT_CIRCUIT
+
+    async def test_failed_push_retried_for_same_value(self, vdsd, session):
+        bi = _make_binary_input(vdsd)
+        vdsd._announced = True
+        session.send_notification.side_effect = ConnectionError(
+            "disconnected"
         )
+        await bi.update_value(True, session)
 
-    @pytest.mark.asyncio
-    async def test_push_handles_connection_error(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+        session.send_notification.side_effect = None
+        await bi.update_value(True, session)
+        await bi.update_value(True, session)
+
+        assert session.send_notification.await_count == 2
+
+    async def test_push_handles_connection_error(self, vdsd, session):
         bi = _make_binary_input(vdsd)
         vdsd._announced = True
 
-        session = _make_mock_session()
-        session.send_notification = AsyncMock(
-            side_effect=ConnectionError("disconnected")
+        session.send_notification.side_effect = ConnectionError(
+            "disconnected"
         )
 
         # Should not raise despite connection error.
         await bi.update_value(True, session)
         assert bi.value is True
 
-    @pytest.mark.asyncio
-    async def test_push_for_multiple_inputs(self):
+    async def test_push_for_multiple_inputs(self, vdsd, session):
         """Each binary input pushes its own state independently."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
 
         bi0 = BinaryInput(
             vdsd=vdsd, ds_index=0, name="Presence",
@@ -603,26 +614,23 @@ class TestBinaryInputPushNotification:
         vdsd.add_binary_input(bi1)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
-        await bi0.update_value(True, session)
-        await bi1.update_extended_value(2, session)
-
-        assert session.send_notification.call_count == 2
-
-        # First call pushes index 0.
-        msg0 = session.send_notification.call_args_list[0][0][0]
-        props0 = elements_to_dict(
-            msg0.vdc_send_push_notification.changedproperties
+        await asyncio.gather(
+            bi0.update_value(True, session),
+            bi1.update_extended_value(2, session),
         )
-        assert "0" in props0["binaryInputStates"]
 
-        # Second call pushes index 1.
-        msg1 = session.send_notification.call_args_list[1][0][0]
-        props1 = elements_to_dict(
-            msg1.vdc_send_push_notification.changedproperties
-        )
-        assert "1" in props1["binaryInputStates"]
+        assert session.send_notification.await_count == 2
+
+        # One push per input; completion order is not guaranteed.
+        pushed = {}
+        for call in session.send_notification.await_args_list:
+            (msg,) = call.args
+            props = elements_to_dict(
+                msg.vdc_send_push_notification.changedproperties
+            )
+            pushed.update(props["binaryInputStates"])
+        assert pushed["0"]["value"] is True
+        assert pushed["1"]["extendedValue"] == 2
 
 
 # ===========================================================================
@@ -633,11 +641,7 @@ class TestBinaryInputPushNotification:
 class TestVdsdBinaryInputManagement:
     """Tests for add/remove/get binary input methods on Vdsd."""
 
-    def test_add_binary_input(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_add_binary_input(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         vdsd.add_binary_input(bi)
@@ -657,11 +661,7 @@ class TestVdsdBinaryInputManagement:
         with pytest.raises(ValueError, match="different vdSD"):
             vdsd2.add_binary_input(bi)
 
-    def test_remove_binary_input(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_remove_binary_input(self, vdsd):
         bi = _make_binary_input(vdsd)
         vdsd.add_binary_input(bi)
 
@@ -669,27 +669,13 @@ class TestVdsdBinaryInputManagement:
         assert removed is bi
         assert vdsd.get_binary_input(0) is None
 
-    def test_remove_nonexistent(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_remove_nonexistent(self, vdsd):
         assert vdsd.remove_binary_input(99) is None
 
-    def test_get_binary_input_nonexistent(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_get_binary_input_nonexistent(self, vdsd):
         assert vdsd.get_binary_input(0) is None
 
-    def test_binary_inputs_dict_is_copy(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_binary_inputs_dict_is_copy(self, vdsd):
         bi = _make_binary_input(vdsd)
         vdsd.add_binary_input(bi)
 
@@ -697,12 +683,7 @@ class TestVdsdBinaryInputManagement:
         inputs.clear()  # Should not affect internal state.
         assert len(vdsd.binary_inputs) == 1
 
-    def test_replace_existing_index(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_replace_existing_index(self, vdsd):
         bi_old = _make_binary_input(vdsd, name="Old")
         bi_new = _make_binary_input(vdsd, name="New")
 
@@ -723,23 +704,14 @@ class TestVdsdBinaryInputManagement:
 class TestVdsdBinaryInputProperties:
     """Tests for binary input properties in Vdsd.get_properties()."""
 
-    def test_no_binary_inputs_no_properties(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_no_binary_inputs_no_properties(self, vdsd):
         props = vdsd.get_properties()
 
         assert "binaryInputDescriptions" not in props
         assert "binaryInputSettings" not in props
         assert "binaryInputStates" not in props
 
-    def test_binary_input_properties_exposed(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_binary_input_properties_exposed(self, vdsd):
         bi = _make_binary_input(vdsd)
         vdsd.add_binary_input(bi)
 
@@ -765,12 +737,7 @@ class TestVdsdBinaryInputProperties:
         assert "0" in states
         assert states["0"]["value"] is None
 
-    def test_multiple_binary_inputs(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_multiple_binary_inputs(self, vdsd):
         bi0 = BinaryInput(
             vdsd=vdsd, ds_index=0, name="PIR",
             sensor_function=BinaryInputType.PRESENCE,
@@ -798,11 +765,7 @@ class TestVdsdBinaryInputProperties:
 class TestBinaryInputPersistence:
     """Tests for BinaryInput persistence."""
 
-    def test_get_property_tree(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_get_property_tree(self, vdsd):
         bi = _make_binary_input(
             vdsd,
             group=5,
@@ -815,30 +778,42 @@ class TestBinaryInputPersistence:
         assert tree["dsIndex"] == 0
         assert tree["name"] == "PIR Sensor"
         assert tree["inputType"] == INPUT_TYPE_DETECTS_CHANGES
-        assert tree["inputUsage"] == int(BinaryInputUsage.ROOM_CLIMATE)
-        assert tree["hardwiredFunction"] == int(
-            BinaryInputType.BATTERY_LOW
-        )
+        assert tree["inputUsage"] == _USAGE_ROOM_CLIMATE
+        assert tree["hardwiredFunction"] == _BATTERY_LOW
         assert tree["updateInterval"] == 30.0
         assert tree["group"] == 5
-        assert tree["sensorFunction"] == int(BinaryInputType.PRESENCE)
+        assert tree["sensorFunction"] == _PRESENCE
 
-    def test_apply_state(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_property_tree_cached_until_change(self, vdsd):
+        bi = _make_binary_input(vdsd)
+        vdsd.add_binary_input(bi)
+
+        tree = bi.get_property_tree()
+        assert bi.get_property_tree() is tree
+
+        vdsd_tree = vdsd.get_property_tree()
+        bi.name = "Renamed"
+        assert bi.get_property_tree()["name"] == "Renamed"
+        # The owning vdSD's cached tree is dropped as well.
+        assert vdsd.get_property_tree() is not vdsd_tree
+
+        bi.set_uplink_converter("value = not value")
+        assert bi.get_property_tree()["uplinkConverter"] == (
+            "value = not value"
+        )
+
+    def test_apply_state(self, vdsd):
         bi = BinaryInput(vdsd=vdsd, ds_index=0)
 
         bi._apply_state({
             "dsIndex": 3,
             "name": "Restored Sensor",
             "inputType": INPUT_TYPE_POLL_ONLY,
-            "inputUsage": int(BinaryInputUsage.OUTDOOR_CLIMATE),
-            "hardwiredFunction": int(BinaryInputType.SMOKE),
+            "inputUsage": _USAGE_OUTDOOR_CLIMATE,
+            "hardwiredFunction": _SMOKE,
             "updateInterval": 15.0,
             "group": 7,
-            "sensorFunction": int(BinaryInputType.WIND),
+            "sensorFunction": _WIND,
         })
 
         assert bi.ds_index == 3
@@ -850,12 +825,8 @@ class TestBinaryInputPersistence:
         assert bi.group == 7
         assert bi.sensor_function == BinaryInputType.WIND
 
-    def test_round_trip(self):
+    def test_round_trip(self, vdsd):
         """Save → restore should yield identical properties."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
 
         original = BinaryInput(
             vdsd=vdsd,
@@ -883,12 +854,8 @@ class TestBinaryInputPersistence:
         assert restored.group == original.group
         assert restored.sensor_function == original.sensor_function
 
-    def test_state_not_persisted(self):
+    def test_state_not_persisted(self, vdsd):
         """State values must NOT appear in the property tree."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
         bi = _make_binary_input(vdsd)
 
         bi._value = True
@@ -912,11 +879,7 @@ class TestBinaryInputPersistence:
 class TestVdsdBinaryInputPersistence:
     """Tests for binary inputs in Vdsd property tree persistence."""
 
-    def test_vdsd_tree_includes_binary_inputs(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_vdsd_tree_includes_binary_inputs(self, vdsd):
         bi = _make_binary_input(vdsd, group=2)
         vdsd.add_binary_input(bi)
 
@@ -927,12 +890,7 @@ class TestVdsdBinaryInputPersistence:
         assert tree["binaryInputs"][0]["dsIndex"] == 0
         assert tree["binaryInputs"][0]["group"] == 2
 
-    def test_vdsd_tree_no_binary_inputs(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_vdsd_tree_no_binary_inputs(self, vdsd):
         tree = vdsd.get_property_tree()
         assert "binaryInputs" not in tree
 
@@ -958,12 +916,7 @@ class TestVdsdBinaryInputPersistence:
         assert restored_bi.group == 4
         assert restored_bi.sensor_function == BinaryInputType.PRESENCE
 
-    def test_vdsd_apply_state_updates_existing_binary_input(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_vdsd_apply_state_updates_existing_binary_input(self, vdsd):
         # Pre-create a binary input.
         bi = _make_binary_input(vdsd, group=0)
         vdsd.add_binary_input(bi)
@@ -974,7 +927,7 @@ class TestVdsdBinaryInputPersistence:
                 "dsIndex": 0,
                 "name": "Updated PIR",
                 "group": 9,
-                "sensorFunction": int(BinaryInputType.MOTION),
+                "sensorFunction": _MOTION,
             }],
         })
 
@@ -1011,20 +964,14 @@ class TestVdsdBinaryInputPersistence:
         vdsd2 = _make_vdsd(device, subdevice_index=0)
         vdsd2._apply_state(tree)
 
-        assert len(vdsd2.binary_inputs) == 2
-
-        r0 = vdsd2.get_binary_input(0)
-        assert r0 is not None
-        assert r0.name == "PIR"
-        assert r0.sensor_function == BinaryInputType.PRESENCE
-        assert r0.group == 1
-
-        r1 = vdsd2.get_binary_input(1)
-        assert r1 is not None
-        assert r1.name == "Window"
-        assert r1.sensor_function == BinaryInputType.WINDOW_OPEN
-        assert r1.group == 3
-        assert r1.update_interval == 5.0
+        restored = {
+            idx: bi.get_property_tree()
+            for idx, bi in vdsd2.binary_inputs.items()
+        }
+        assert restored == {
+            0: bi0.get_property_tree(),
+            1: bi1.get_property_tree(),
+        }
 
 
 # ===========================================================================
@@ -1033,9 +980,16 @@ class TestVdsdBinaryInputPersistence:
 
 
 class TestVdcHostBinaryInputSetProperty:
-    """Tests for setProperty handling of binaryInputSettings."""
+    """Tests for setProperty handling of binaryInputSettings.
+
+    The host graph is built once for the class; only the binary
+    input's settings are mutated, and those are restored after each
+    test.
+    """
 
-    def _setup(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def graph(cls):
         host = _make_host()
         vdc = _make_vdc(host)
         device = _make_device(vdc)
@@ -1045,16 +999,26 @@ class TestVdcHostBinaryInputSetProperty:
         device.add_vdsd(vdsd)
         host.add_vdc(vdc)
         vdc.add_device(device)
-        return host, vdc, device, vdsd, bi
+        yield host, vdc, device, vdsd, bi
+        host._cancel_auto_save()
+
+    @pytest.fixture(autouse=True)
+    def _restore_settings(self, graph):
+        bi = graph[-1]
+        group, sensor_function = bi.group, bi.sensor_function
+        yield
+        bi.apply_settings(
+            {"group": group, "sensorFunction": int(sensor_function)}
+        )
 
-    def test_set_binary_input_settings(self):
-        host, vdc, device, vdsd, bi = self._setup()
+    def test_set_binary_input_settings(self, graph):
+        host, vdc, device, vdsd, bi = graph
 
         incoming = {
             "binaryInputSettings": {
                 "0": {
                     "group": 5,
-                    "sensorFunction": int(BinaryInputType.SMOKE),
+                    "sensorFunction": _SMOKE,
                 },
             },
         }
@@ -1064,8 +1028,8 @@ class TestVdcHostBinaryInputSetProperty:
         assert bi.group == 5
         assert bi.sensor_function == BinaryInputType.SMOKE
 
-    def test_set_binary_input_settings_partial(self):
-        host, vdc, device, vdsd, bi = self._setup()
+    def test_set_binary_input_settings_partial(self, graph):
+        host, vdc, device, vdsd, bi = graph
 
         incoming = {
             "binaryInputSettings": {
@@ -1078,8 +1042,8 @@ class TestVdcHostBinaryInputSetProperty:
         assert bi.group == 8
         assert bi.sensor_function == BinaryInputType.PRESENCE  # unchanged
 
-    def test_set_binary_input_unknown_index(self):
-        host, vdc, device, vdsd, bi = self._setup()
+    def test_set_binary_input_unknown_index(self, graph):
+        host, vdc, device, vdsd, bi = graph
 
         incoming = {
             "binaryInputSettings": {
@@ -1091,9 +1055,9 @@ class TestVdcHostBinaryInputSetProperty:
         host._apply_vdsd_set_property(vdsd, incoming)
         assert bi.group == 0  # unchanged
 
-    def test_set_property_via_message(self):
+    def test_set_property_via_message(self, graph):
         """Full message dispatch for setProperty binaryInputSettings."""
-        host, vdc, device, vdsd, bi = self._setup()
+        host, vdc, device, vdsd, bi = graph
 
         msg = pb.Message()
         msg.type = pb.VDSM_REQUEST_SET_PROPERTY
@@ -1123,7 +1087,16 @@ class TestVdcHostBinaryInputSetProperty:
 class TestBinaryInputAutoSave:
     """Tests that settings changes trigger auto-save."""
 
-    def test_group_setter_triggers_auto_save(self):
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda bi: setattr(bi, "group", 5),
+            lambda bi: setattr(bi, "sensor_function", BinaryInputType.RAIN),
+            lambda bi: bi.apply_settings({"group": 3}),
+        ],
+        ids=["group_setter", "sensor_function_setter", "apply_settings"],
+    )
+    def test_change_triggers_auto_save(self, monkeypatch, change):
         host = _make_host()
         vdc = _make_vdc(host)
         device = _make_device(vdc)
@@ -1134,39 +1107,12 @@ class TestBinaryInputAutoSave:
         vdc.add_device(device)
         host.add_vdc(vdc)
 
-        with patch.object(host, "_schedule_auto_save") as mock_save:
-            bi.group = 5
-            mock_save.assert_called()
-
-    def test_sensor_function_setter_triggers_auto_save(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-        bi = _make_binary_input(vdsd)
-        vdsd.add_binary_input(bi)
-        device.add_vdsd(vdsd)
-        vdc.add_device(device)
-        host.add_vdc(vdc)
-
-        with patch.object(host, "_schedule_auto_save") as mock_save:
-            bi.sensor_function = BinaryInputType.RAIN
-            mock_save.assert_called()
-
-    def test_apply_settings_triggers_auto_save(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-        bi = _make_binary_input(vdsd)
-        vdsd.add_binary_input(bi)
-        device.add_vdsd(vdsd)
-        vdc.add_device(device)
-        host.add_vdc(vdc)
-
-        with patch.object(host, "_schedule_auto_save") as mock_save:
-            bi.apply_settings({"group": 3})
-            mock_save.assert_called()
+        calls = []
+        monkeypatch.setattr(
+            host, "_schedule_auto_save", lambda: calls.append(1)
+        )
+        change(bi)
+        assert calls
 
 
 # ===========================================================================
@@ -1177,21 +1123,12 @@ class TestBinaryInputAutoSave:
 class TestBinaryInputAge:
     """Tests for the age property."""
 
-    def test_age_none_initially(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_age_none_initially(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         assert bi.age is None
 
-    @pytest.mark.asyncio
-    async def test_age_after_update(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_age_after_update(self, vdsd):
         bi = _make_binary_input(vdsd)
 
         await bi.update_value(True)
@@ -1201,15 +1138,10 @@ class TestBinaryInputAge:
         assert age >= 0.0
         assert age < 1.0  # should be near-instant
 
-    @pytest.mark.asyncio
-    async def test_age_increases(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_age_increases(self, vdsd):
         bi = _make_binary_input(vdsd)
 
-        await bi.update_value(True)
+        _touch(bi, True)
         age1 = bi.age
         assert age1 is not None
 
@@ -1221,6 +1153,14 @@ class TestBinaryInputAge:
 
         assert age2 > age1
 
+    def test_state_age_uses_shared_snapshot(self, vdsd):
+        bi = _make_binary_input(vdsd)
+
+        _touch(bi, True)
+        assert bi._last_update is not None
+        now = bi._last_update + 5.0
+
+        assert bi.get_state_properties(now)["age"] == 5.0
 
 
 # ===========================================================================
@@ -1231,64 +1171,43 @@ class TestBinaryInputAge:
 class TestSessionFallback:
     """Tests that update methods use the stored session as fallback."""
 
-    @pytest.mark.asyncio
-    async def test_update_value_uses_stored_session(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_value_uses_stored_session(self, vdsd, session):
         bi = _make_binary_input(vdsd)
         vdsd.add_binary_input(bi)
         vdsd._announced = True
 
-        session = _make_mock_session()
         bi.start_alive_timer(session)
 
         # No session passed — should use stored session.
         await bi.update_value(True)
 
-        session.send_notification.assert_called_once()
+        session.send_notification.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_update_extended_value_uses_stored_session(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_extended_value_uses_stored_session(
+        self, vdsd, session
+    ):
         bi = _make_binary_input(vdsd)
         vdsd.add_binary_input(bi)
         vdsd._announced = True
 
-        session = _make_mock_session()
         bi.start_alive_timer(session)
 
         await bi.update_extended_value(2)
 
-        session.send_notification.assert_called_once()
+        session.send_notification.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_update_error_uses_stored_session(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_error_uses_stored_session(self, vdsd, session):
         bi = _make_binary_input(vdsd)
         vdsd.add_binary_input(bi)
         vdsd._announced = True
 
-        session = _make_mock_session()
         bi.start_alive_timer(session)
 
         await bi.update_error(InputError.LOW_BATTERY)
 
-        session.send_notification.assert_called_once()
+        session.send_notification.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_explicit_session_overrides_stored(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_explicit_session_overrides_stored(self, vdsd):
         bi = _make_binary_input(vdsd)
         vdsd.add_binary_input(bi)
         vdsd._announced = True
@@ -1300,8 +1219,8 @@ class TestSessionFallback:
         # Explicit session takes precedence.
         await bi.update_value(True, explicit_session)
 
-        explicit_session.send_notification.assert_called_once()
-        stored_session.send_notification.assert_not_called()
+        explicit_session.send_notification.assert_awaited_once()
+        stored_session.send_notification.assert_not_awaited()
 
 
 # ===========================================================================
@@ -1312,13 +1231,7 @@ class TestSessionFallback:
 class TestVdsdAliveTimerLifecycle:
     """Tests that Vdsd announce/vanish/reset manage session storage."""
 
-    def test_add_binary_input_after_announce_starts_timer(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
-        session = _make_mock_session()
+    def test_add_binary_input_after_announce_starts_timer(self, vdsd, session):
         vdsd._announced = True
         vdsd._session = session
 
@@ -1327,12 +1240,7 @@ class TestVdsdAliveTimerLifecycle:
 
         assert bi._session is session
 
-    def test_reset_announcement_clears_all_sessions(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_reset_announcement_clears_all_sessions(self, vdsd, session):
         bi0 = BinaryInput(
             vdsd=vdsd, ds_index=0,
             sensor_function=BinaryInputType.PRESENCE,
@@ -1344,7 +1252,6 @@ class TestVdsdAliveTimerLifecycle:
         vdsd.add_binary_input(bi0)
         vdsd.add_binary_input(bi1)
 
-        session = _make_mock_session()
         bi0.start_alive_timer(session)
         bi1.start_alive_timer(session)
 
@@ -1353,14 +1260,9 @@ class TestVdsdAliveTimerLifecycle:
         assert bi0._session is None
         assert bi1._session is None
 
-    def test_vdsd_stores_session_on_announce(self):
+    def test_vdsd_stores_session_on_announce(self, vdsd, session):
         """When vdSD is announced, it stores the session."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
 
-        session = _make_mock_session()
         # Simulate announce() setting the session.
         vdsd._announced = True
         vdsd._session = session
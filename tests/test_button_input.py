@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import time
 from typing import Any, Dict, List, Optional, Tuple
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -40,6 +42,24 @@ from pydsvdcapi.vdsd import Device, Vdsd
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Wire (int) values of the enum members asserted below.
+_ACTION_FORCE = int(ActionMode.FORCE)
+_CLICK_1X = int(ButtonClickType.CLICK_1X)
+_HOLD_REPEAT = int(ButtonClickType.HOLD_REPEAT)
+_HOLD_START = int(ButtonClickType.HOLD_START)
+_IDLE = int(ButtonClickType.IDLE)
+_ELEMENT_CENTER = int(ButtonElementID.CENTER)
+_ELEMENT_DOWN = int(ButtonElementID.DOWN)
+_FUNCTION_AREA_1 = int(ButtonFunction.AREA_1)
+_FUNCTION_AREA_2 = int(ButtonFunction.AREA_2)
+_FUNCTION_ROOM = int(ButtonFunction.ROOM)
+_MODE_STANDARD = int(ButtonMode.STANDARD)
+_MODE_SWITCHED = int(ButtonMode.SWITCHED)
+_SINGLE_PUSHBUTTON = int(ButtonType.SINGLE_PUSHBUTTON)
+_TWO_WAY_PUSHBUTTON = int(ButtonType.TWO_WAY_PUSHBUTTON)
+_ERROR_LOW_BATTERY = int(InputError.LOW_BATTERY)
+_ERROR_OK = int(InputError.OK)
+
 
 def _make_host(**kwargs: Any) -> VdcHost:
     kw: dict[str, Any] = {"name": "Test Host", "mac": "AA:BB:CC:DD:EE:FF"}
@@ -60,12 +80,12 @@ def _make_vdc(host: VdcHost, **kwargs: Any) -> Vdc:
     return Vdc(**defaults)
 
 
-def _base_dsuid() -> DsUid:
-    return DsUid.from_name_in_space("btn-test-device", DsUidNamespace.VDC)
+# DsUid exposes no mutators, so one instance can back every device.
+_BASE_DSUID = DsUid.from_name_in_space("btn-test-device", DsUidNamespace.VDC)
 
 
 def _make_device(vdc: Vdc, dsuid: Optional[DsUid] = None) -> Device:
-    return Device(vdc=vdc, dsuid=dsuid or _base_dsuid())
+    return Device(vdc=vdc, dsuid=dsuid or _BASE_DSUID)
 
 
 def _make_vdsd(device: Device, **kwargs: Any) -> Vdsd:
@@ -99,6 +119,29 @@ def _make_mock_session() -> MagicMock:
     return session
 
 
+@pytest.fixture
+def session() -> MagicMock:
+    """A fresh mock session whose ``send_notification`` is an
+    ``AsyncMock``."""
+    return _make_mock_session()
+
+
+def _last_push(session: MagicMock) -> pb.Message:
+    """Assert exactly one push was sent and return its message."""
+    session.send_notification.assert_awaited_once()
+    return session.send_notification.await_args.args[0]
+
+
+def _pushed_state(
+    session: MagicMock, ds_index: str = "0"
+) -> Dict[str, Any]:
+    """Decode the single push once and return one button's state dict."""
+    msg = _last_push(session)
+    assert msg.type == pb.VDC_SEND_PUSH_NOTIFICATION
+    props = elements_to_dict(msg.vdc_send_push_notification.changedproperties)
+    return props["buttonInputStates"][ds_index]
+
+
 def _scaffold() -> Tuple[VdcHost, Vdc, Device, Vdsd]:
     """Create the full host → vdc → device → vdsd chain."""
     host = _make_host()
@@ -108,6 +151,51 @@ def _scaffold() -> Tuple[VdcHost, Vdc, Device, Vdsd]:
     return host, vdc, device, vdsd
 
 
+@pytest.fixture(scope="module")
+def wired_stack():
+    """A host → vdc → device → vdsd chain, wired once per module.
+
+    Tests only attach buttons to its vdSD (see :func:`wired_button`).
+    """
+    host, vdc, device, vdsd = _scaffold()
+    host.add_vdc(vdc)
+    vdc.add_device(device)
+    device.add_vdsd(vdsd)
+    yield host, vdc, device, vdsd
+    host._cancel_auto_save()
+
+
+@pytest.fixture
+def wired_button(wired_stack):
+    """A fresh button on the wired vdSD, detached again after the test."""
+    vdsd = wired_stack[3]
+    btn = _make_button_input(vdsd)
+    vdsd.add_button_input(btn)
+    yield btn
+    vdsd.remove_button_input(btn.ds_index)
+
+
+@pytest.fixture(scope="module")
+def shared_vdc() -> Vdc:
+    """A host and vDC shared by the module's ``vdsd`` fixtures.
+
+    Devices built on it are never added to it, so tests cannot see
+    each other through the vDC.  The host has nothing to persist, so
+    its auto-save is a no-op: settings setters in unrelated tests stop
+    at the host instead of scheduling saves.  Auto-save tests use
+    :func:`wired_stack`, whose host is untouched.
+    """
+    host = _make_host()
+    host._schedule_auto_save = lambda: None
+    return _make_vdc(host)
+
+
+@pytest.fixture
+def vdsd(shared_vdc: Vdc) -> Vdsd:
+    """A fresh, unattached device → vdSD pair for a single test."""
+    return _make_vdsd(_make_device(shared_vdc))
+
+
 # ===========================================================================
 # Construction and defaults
 # ===========================================================================
@@ -116,8 +204,7 @@ def _scaffold() -> Tuple[VdcHost, Vdc, Device, Vdsd]:
 class TestButtonInputConstruction:
     """Tests for ButtonInput creation and default values."""
 
-    def test_default_construction(self):
-        _, _, _, vdsd = _scaffold()
+    def test_default_construction(self, vdsd):
         btn = _make_button_input(vdsd)
 
         assert btn.ds_index == 0
@@ -128,8 +215,7 @@ class TestButtonInputConstruction:
         assert btn.button_element_id == ButtonElementID.CENTER
         assert btn.vdsd is vdsd
 
-    def test_custom_construction(self):
-        _, _, _, vdsd = _scaffold()
+    def test_custom_construction(self, vdsd):
         btn = ButtonInput(
             vdsd=vdsd,
             ds_index=3,
@@ -159,15 +245,13 @@ class TestButtonInputConstruction:
         assert btn.sets_local_priority is True
         assert btn.calls_present is True
 
-    def test_no_button_id(self):
-        _, _, _, vdsd = _scaffold()
+    def test_no_button_id(self, vdsd):
         btn = ButtonInput(
             vdsd=vdsd, ds_index=0, button_id=None, name="No ID"
         )
         assert btn.button_id is None
 
-    def test_click_detector_config(self):
-        _, _, _, vdsd = _scaffold()
+    def test_click_detector_config(self, vdsd):
         btn = ButtonInput(
             vdsd=vdsd,
             ds_index=0,
@@ -186,8 +270,7 @@ class TestButtonInputConstruction:
         assert cd.hold_repeat_interval == 2.0
         assert cd.use_tip_events is True
 
-    def test_repr(self):
-        _, _, _, vdsd = _scaffold()
+    def test_repr(self, vdsd):
         btn = _make_button_input(vdsd, name="MyBtn")
         r = repr(btn)
         assert "ButtonInput" in r
@@ -204,33 +287,27 @@ class TestButtonInputConstruction:
 class TestButtonInputStateDefaults:
     """State properties start at unknown / IDLE / OK."""
 
-    def test_value_none(self):
-        _, _, _, vdsd = _scaffold()
+    def test_value_none(self, vdsd):
         btn = _make_button_input(vdsd)
         assert btn.value is None
 
-    def test_click_type_idle(self):
-        _, _, _, vdsd = _scaffold()
+    def test_click_type_idle(self, vdsd):
         btn = _make_button_input(vdsd)
         assert btn.click_type == ButtonClickType.IDLE
 
-    def test_action_id_none(self):
-        _, _, _, vdsd = _scaffold()
+    def test_action_id_none(self, vdsd):
         btn = _make_button_input(vdsd)
         assert btn.action_id is None
 
-    def test_action_mode_none(self):
-        _, _, _, vdsd = _scaffold()
+    def test_action_mode_none(self, vdsd):
         btn = _make_button_input(vdsd)
         assert btn.action_mode is None
 
-    def test_age_none(self):
-        _, _, _, vdsd = _scaffold()
+    def test_age_none(self, vdsd):
         btn = _make_button_input(vdsd)
         assert btn.age is None
 
-    def test_error_ok(self):
-        _, _, _, vdsd = _scaffold()
+    def test_error_ok(self, vdsd):
         btn = _make_button_input(vdsd)
         assert btn.error == InputError.OK
 
@@ -243,59 +320,35 @@ class TestButtonInputStateDefaults:
 class TestButtonInputSettings:
     """Writable settings properties."""
 
-    def test_group_setter(self):
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        btn.group = 3
-        assert btn.group == 3
-
-    def test_function_setter(self):
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        btn.function = ButtonFunction.ROOM
-        assert btn.function == ButtonFunction.ROOM
-
-    def test_function_from_int(self):
-        _, _, _, vdsd = _scaffold()
+    @pytest.mark.parametrize(
+        ("attr", "value", "expected"),
+        [
+            ("group", 3, 3),
+            ("function", ButtonFunction.ROOM, ButtonFunction.ROOM),
+            ("function", 5, ButtonFunction.ROOM),
+            ("mode", ButtonMode.SWITCHED, ButtonMode.SWITCHED),
+            ("channel", 42, 42),
+            ("sets_local_priority", True, True),
+            ("calls_present", True, True),
+            ("error", InputError.LOW_BATTERY, InputError.LOW_BATTERY),
+            ("name", "New Name", "New Name"),
+        ],
+        ids=[
+            "group",
+            "function",
+            "function_from_int",
+            "mode",
+            "channel",
+            "sets_local_priority",
+            "calls_present",
+            "error",
+            "name",
+        ],
+    )
+    def test_setter(self, vdsd, attr, value, expected):
         btn = _make_button_input(vdsd)
-        btn.function = 5  # type: ignore[assignment]
-        assert btn.function == ButtonFunction.ROOM
-
-    def test_mode_setter(self):
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        btn.mode = ButtonMode.SWITCHED
-        assert btn.mode == ButtonMode.SWITCHED
-
-    def test_channel_setter(self):
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        btn.channel = 42
-        assert btn.channel == 42
-
-    def test_sets_local_priority_setter(self):
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        btn.sets_local_priority = True
-        assert btn.sets_local_priority is True
-
-    def test_calls_present_setter(self):
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        btn.calls_present = True
-        assert btn.calls_present is True
-
-    def test_error_setter(self):
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        btn.error = InputError.LOW_BATTERY
-        assert btn.error == InputError.LOW_BATTERY
-
-    def test_name_setter(self):
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        btn.name = "New Name"
-        assert btn.name == "New Name"
+        setattr(btn, attr, value)
+        assert getattr(btn, attr) == expected
 
 
 # ===========================================================================
@@ -306,19 +359,17 @@ class TestButtonInputSettings:
 class TestButtonInputDescriptionProperties:
     """Description property dict for getProperty responses."""
 
-    def test_description_keys(self):
-        _, _, _, vdsd = _scaffold()
+    def test_description_keys(self, vdsd):
         btn = _make_button_input(vdsd, button_id=2)
         desc = btn.get_description_properties()
         assert desc["name"] == "Test Button"
         assert desc["dsIndex"] == 0
         assert desc["supportsLocalKeyMode"] is False
-        assert desc["buttonType"] == int(ButtonType.SINGLE_PUSHBUTTON)
-        assert desc["buttonElementID"] == int(ButtonElementID.CENTER)
+        assert desc["buttonType"] == _SINGLE_PUSHBUTTON
+        assert desc["buttonElementID"] == _ELEMENT_CENTER
         assert desc["buttonID"] == 2
 
-    def test_description_without_button_id(self):
-        _, _, _, vdsd = _scaffold()
+    def test_description_without_button_id(self, vdsd):
         btn = ButtonInput(
             vdsd=vdsd, ds_index=0, button_id=None, name="No ID"
         )
@@ -329,8 +380,7 @@ class TestButtonInputDescriptionProperties:
 class TestButtonInputSettingsProperties:
     """Settings property dict for getProperty responses."""
 
-    def test_settings_keys(self):
-        _, _, _, vdsd = _scaffold()
+    def test_settings_keys(self, vdsd):
         btn = ButtonInput(
             vdsd=vdsd,
             ds_index=0,
@@ -344,8 +394,8 @@ class TestButtonInputSettingsProperties:
         )
         s = btn.get_settings_properties()
         assert s["group"] == 2
-        assert s["function"] == int(ButtonFunction.AREA_1)
-        assert s["mode"] == int(ButtonMode.SWITCHED)
+        assert s["function"] == _FUNCTION_AREA_1
+        assert s["mode"] == _MODE_SWITCHED
         assert s["channel"] == 10
         assert s["setsLocalPriority"] is True
         assert s["callsPresent"] is True
@@ -354,45 +404,38 @@ class TestButtonInputSettingsProperties:
 class TestButtonInputStateProperties:
     """State property dict — click mode vs action mode."""
 
-    def test_click_mode_default(self):
+    def test_click_mode_default(self, vdsd):
         """Default state is click mode with value=None, clickType=IDLE."""
-        _, _, _, vdsd = _scaffold()
         btn = _make_button_input(vdsd)
         st = btn.get_state_properties()
         assert "value" in st
         assert st["value"] is None
-        assert st["clickType"] == int(ButtonClickType.IDLE)
+        assert st["clickType"] == _IDLE
         assert "actionId" not in st
         assert "actionMode" not in st
         assert st["age"] is None
-        assert st["error"] == int(InputError.OK)
+        assert st["error"] == _ERROR_OK
 
-    @pytest.mark.asyncio
-    async def test_click_mode_after_update_click(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_click_mode_after_update_click(self, vdsd):
         btn = _make_button_input(vdsd)
         await btn.update_click(ButtonClickType.CLICK_1X, value=False)
         st = btn.get_state_properties()
         assert st["value"] is False
-        assert st["clickType"] == int(ButtonClickType.CLICK_1X)
+        assert st["clickType"] == _CLICK_1X
         assert "actionId" not in st
 
-    @pytest.mark.asyncio
-    async def test_action_mode_after_update_action(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_action_mode_after_update_action(self, vdsd):
         btn = _make_button_input(vdsd)
         await btn.update_action(action_id=5, action_mode=ActionMode.FORCE)
         st = btn.get_state_properties()
         assert st["actionId"] == 5
-        assert st["actionMode"] == int(ActionMode.FORCE)
+        assert st["actionMode"] == _ACTION_FORCE
         assert "value" not in st
         assert "clickType" not in st
-        assert st["error"] == int(InputError.OK)
+        assert st["error"] == _ERROR_OK
 
-    @pytest.mark.asyncio
-    async def test_mode_switch_action_then_click(self):
+    async def test_mode_switch_action_then_click(self, vdsd):
         """Switching from action to click mode returns click properties."""
-        _, _, _, vdsd = _scaffold()
         btn = _make_button_input(vdsd)
         await btn.update_action(action_id=10)
         assert "actionId" in btn.get_state_properties()
@@ -402,9 +445,7 @@ class TestButtonInputStateProperties:
         assert "clickType" in st
         assert "actionId" not in st
 
-    @pytest.mark.asyncio
-    async def test_age_updates(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_age_updates(self, vdsd):
         btn = _make_button_input(vdsd)
         await btn.update_click(ButtonClickType.CLICK_1X)
         age = btn.age
@@ -420,40 +461,31 @@ class TestButtonInputStateProperties:
 class TestButtonInputUpdateClick:
     """Tests for update_click (direct click type reporting)."""
 
-    @pytest.mark.asyncio
-    async def test_update_click_basic(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_update_click_basic(self, vdsd):
         btn = _make_button_input(vdsd)
         await btn.update_click(ButtonClickType.CLICK_2X, value=False)
         assert btn.click_type == ButtonClickType.CLICK_2X
         assert btn.value is False
 
-    @pytest.mark.asyncio
-    async def test_update_click_from_int(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_update_click_from_int(self, vdsd):
         btn = _make_button_input(vdsd)
         await btn.update_click(7)  # CLICK_1X
         assert btn.click_type == ButtonClickType.CLICK_1X
 
-    @pytest.mark.asyncio
-    async def test_update_click_preserves_value(self):
+    async def test_update_click_preserves_value(self, vdsd):
         """When value=None, existing value is kept."""
-        _, _, _, vdsd = _scaffold()
         btn = _make_button_input(vdsd)
         btn._value = True
         await btn.update_click(ButtonClickType.HOLD_START)
         assert btn.value is True  # unchanged
 
-    @pytest.mark.asyncio
-    async def test_update_click_pushes(self):
+    async def test_update_click_pushes(self, vdsd, session):
         """update_click pushes state when vdSD is announced."""
-        _, _, _, vdsd = _scaffold()
         btn = _make_button_input(vdsd)
-        session = _make_mock_session()
         vdsd._announced = True
         btn._session = session
         await btn.update_click(ButtonClickType.CLICK_1X)
-        session.send_notification.assert_awaited_once()
+        assert _pushed_state(session)["clickType"] == _CLICK_1X
 
 
 # ===========================================================================
@@ -464,37 +496,28 @@ class TestButtonInputUpdateClick:
 class TestButtonInputUpdateAction:
     """Tests for update_action (direct scene call)."""
 
-    @pytest.mark.asyncio
-    async def test_update_action_basic(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_update_action_basic(self, vdsd):
         btn = _make_button_input(vdsd)
         await btn.update_action(action_id=14, action_mode=ActionMode.UNDO)
         assert btn.action_id == 14
         assert btn.action_mode == ActionMode.UNDO
 
-    @pytest.mark.asyncio
-    async def test_update_action_default_mode(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_update_action_default_mode(self, vdsd):
         btn = _make_button_input(vdsd)
         await btn.update_action(action_id=0)
         assert btn.action_mode == ActionMode.NORMAL
 
-    @pytest.mark.asyncio
-    async def test_update_action_from_int(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_update_action_from_int(self, vdsd):
         btn = _make_button_input(vdsd)
         await btn.update_action(action_id=5, action_mode=1)
         assert btn.action_mode == ActionMode.FORCE
 
-    @pytest.mark.asyncio
-    async def test_update_action_pushes(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_update_action_pushes(self, vdsd, session):
         btn = _make_button_input(vdsd)
-        session = _make_mock_session()
         vdsd._announced = True
         btn._session = session
         await btn.update_action(action_id=5)
-        session.send_notification.assert_awaited_once()
+        assert _pushed_state(session)["actionId"] == 5
 
 
 # ===========================================================================
@@ -505,16 +528,13 @@ class TestButtonInputUpdateAction:
 class TestButtonInputUpdateError:
     """Tests for update_error."""
 
-    @pytest.mark.asyncio
-    async def test_update_error(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_update_error(self, vdsd, session):
         btn = _make_button_input(vdsd)
-        session = _make_mock_session()
         vdsd._announced = True
         btn._session = session
         await btn.update_error(InputError.LOW_BATTERY)
         assert btn.error == InputError.LOW_BATTERY
-        session.send_notification.assert_awaited_once()
+        assert _pushed_state(session)["error"] == _ERROR_LOW_BATTERY
 
 
 # ===========================================================================
@@ -525,92 +545,98 @@ class TestButtonInputUpdateError:
 class TestButtonInputPushNotifications:
     """Push notification behaviour."""
 
-    @pytest.mark.asyncio
-    async def test_no_push_without_session(self):
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        vdsd._announced = True
-        # No session → no crash, no push.
-        await btn.update_click(ButtonClickType.CLICK_1X)
+    @pytest.fixture(
+        params=[
+            "announced_with_session",
+            "announced_no_session",
+            "not_announced",
+        ]
+    )
+    def push_env(self, request, vdsd, session):
+        """A button in one of the three announce/session combinations.
 
-    @pytest.mark.asyncio
-    async def test_no_push_when_not_announced(self):
-        _, _, _, vdsd = _scaffold()
+        Function-scoped: every update mutates the button and records
+        calls on the session, so the triple cannot be shared.
+        """
         btn = _make_button_input(vdsd)
-        session = _make_mock_session()
-        btn._session = session
-        vdsd._announced = False
+        vdsd._announced = request.param != "not_announced"
+        if request.param != "announced_no_session":
+            btn._session = session
+        return request.param, btn, session
+
+    async def test_push_only_when_announced_with_session(self, push_env):
+        variant, btn, session = push_env
+        # Without a session or announcement: no crash, no push.
         await btn.update_click(ButtonClickType.CLICK_1X)
-        session.send_notification.assert_not_awaited()
-
-    @pytest.mark.asyncio
-    async def test_push_click_state_format(self):
-        """Push carries buttonInputStates with click mode fields."""
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        session = _make_mock_session()
-        vdsd._announced = True
-        btn._session = session
-
-        await btn.update_click(ButtonClickType.CLICK_1X, value=False)
-
-        msg = session.send_notification.call_args[0][0]
-        assert msg.type == pb.VDC_SEND_PUSH_NOTIFICATION
-        props = elements_to_dict(
-            msg.vdc_send_push_notification.changedproperties
+        assert session.send_notification.await_count == (
+            1 if variant == "announced_with_session" else 0
         )
-        assert "buttonInputStates" in props
-        state = props["buttonInputStates"]["0"]
-        assert state["value"] is False
-        assert state["clickType"] == int(ButtonClickType.CLICK_1X)
-        assert "actionId" not in state
-
-    @pytest.mark.asyncio
-    async def test_push_action_state_format(self):
-        """Push carries buttonInputStates with action mode fields."""
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd)
-        session = _make_mock_session()
-        vdsd._announced = True
-        btn._session = session
-
-        await btn.update_action(action_id=42, action_mode=ActionMode.FORCE)
 
-        msg = session.send_notification.call_args[0][0]
-        props = elements_to_dict(
-            msg.vdc_send_push_notification.changedproperties
-        )
-        state = props["buttonInputStates"]["0"]
-        assert state["actionId"] == 42
-        assert state["actionMode"] == int(ActionMode.FORCE)
-        assert "value" not in state
-
-    @pytest.mark.asyncio
-    async def test_push_with_explicit_session(self):
-        """update_click with explicit session parameter works."""
-        _, _, _, vdsd = _scaffold()
+    @pytest.mark.parametrize(
+        ("update", "stored_session", "expected", "absent"),
+        [
+            (
+                lambda btn, **kw: btn.update_click(
+                    ButtonClickType.CLICK_1X, value=False, **kw
+                ),
+                True,
+                {"value": False, "clickType": _CLICK_1X},
+                "actionId",
+            ),
+            (
+                lambda btn, **kw: btn.update_action(
+                    action_id=42, action_mode=ActionMode.FORCE, **kw
+                ),
+                True,
+                {"actionId": 42, "actionMode": _ACTION_FORCE},
+                "value",
+            ),
+            (
+                lambda btn, **kw: btn.update_click(
+                    ButtonClickType.HOLD_START, value=True, **kw
+                ),
+                False,
+                {"value": True, "clickType": _HOLD_START},
+                "actionId",
+            ),
+        ],
+        ids=["click", "action", "explicit_session"],
+    )
+    async def test_push_state_format(
+        self, vdsd, session, update, stored_session, expected, absent
+    ):
+        """Push carries buttonInputStates with the mode's fields only."""
         btn = _make_button_input(vdsd)
-        session = _make_mock_session()
         vdsd._announced = True
-        # Not stored session — pass explicitly.
-        await btn.update_click(
-            ButtonClickType.HOLD_START, value=True, session=session
-        )
-        session.send_notification.assert_awaited_once()
-
-    @pytest.mark.asyncio
-    async def test_push_handles_connection_error(self):
-        """ConnectionError during push doesn't raise."""
-        _, _, _, vdsd = _scaffold()
+        if stored_session:
+            btn._session = session
+            await update(btn)
+        else:
+            await update(btn, session=session)
+
+        state = _pushed_state(session)
+        assert expected.items() <= state.items()
+        assert absent not in state
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            ConnectionError("gone"),
+            BrokenPipeError(32, "broken pipe"),
+            TimeoutError("slow"),
+            OSError(113, "no route to host"),
+        ],
+        ids=["connection", "broken_pipe", "timeout", "os_error"],
+    )
+    async def test_push_swallows_network_errors(self, vdsd, session, exc):
+        """Connection and OS errors during push don't raise."""
         btn = _make_button_input(vdsd)
-        session = _make_mock_session()
-        session.send_notification = AsyncMock(
-            side_effect=ConnectionError("gone")
-        )
+        session.send_notification.side_effect = exc
         vdsd._announced = True
         btn._session = session
         # Should not raise.
         await btn.update_click(ButtonClickType.CLICK_1X)
+        session.send_notification.assert_awaited_once()
 
 
 # ===========================================================================
@@ -621,14 +647,13 @@ class TestButtonInputPushNotifications:
 class TestButtonInputApplySettings:
     """apply_settings from vdc_host setProperty."""
 
-    def test_apply_all(self):
-        _, _, _, vdsd = _scaffold()
+    def test_apply_all(self, vdsd):
         btn = _make_button_input(vdsd)
         btn.apply_settings(
             {
                 "group": 4,
-                "function": int(ButtonFunction.AREA_2),
-                "mode": int(ButtonMode.SWITCHED),
+                "function": _FUNCTION_AREA_2,
+                "mode": _MODE_SWITCHED,
                 "channel": 20,
                 "setsLocalPriority": True,
                 "callsPresent": True,
@@ -641,15 +666,13 @@ class TestButtonInputApplySettings:
         assert btn.sets_local_priority is True
         assert btn.calls_present is True
 
-    def test_apply_partial(self):
-        _, _, _, vdsd = _scaffold()
+    def test_apply_partial(self, vdsd):
         btn = _make_button_input(vdsd)
         btn.apply_settings({"group": 7})
         assert btn.group == 7
         assert btn.function == ButtonFunction.DEVICE  # unchanged
 
-    def test_apply_empty(self):
-        _, _, _, vdsd = _scaffold()
+    def test_apply_empty(self, vdsd):
         btn = _make_button_input(vdsd)
         btn.apply_settings({})
         assert btn.group == 0
@@ -660,90 +683,98 @@ class TestButtonInputApplySettings:
 # ===========================================================================
 
 
+# ButtonInput constructor kwargs shared by the persistence tests, and
+# the full property tree _ROCKER_DOWN must persist to.
+_ROCKER_DOWN: Dict[str, Any] = {
+    "ds_index": 1,
+    "name": "Rocker Down",
+    "supports_local_key_mode": True,
+    "button_id": 3,
+    "button_type": ButtonType.TWO_WAY_PUSHBUTTON,
+    "button_element_id": ButtonElementID.DOWN,
+    "group": 2,
+    "function": ButtonFunction.ROOM,
+    "mode": ButtonMode.STANDARD,
+    "channel": 5,
+    "sets_local_priority": True,
+    "calls_present": True,
+}
+_ROCKER_DOWN_TREE: Dict[str, Any] = {
+    "dsIndex": 1,
+    "name": "Rocker Down",
+    "supportsLocalKeyMode": True,
+    "buttonID": 3,
+    "buttonType": _TWO_WAY_PUSHBUTTON,
+    "buttonElementID": _ELEMENT_DOWN,
+    "group": 2,
+    "function": _FUNCTION_ROOM,
+    "mode": _MODE_STANDARD,
+    "channel": 5,
+    "setsLocalPriority": True,
+    "callsPresent": True,
+}
+
+# Sets every persisted attribute; the keys double as attribute names
+# and as the ids of the parametrized round-trip test.
+_FOUR_WAY_LEFT: Dict[str, Any] = {
+    "ds_index": 2,
+    "name": "Original",
+    "supports_local_key_mode": True,
+    "button_id": 5,
+    "button_type": ButtonType.FOUR_WAY_WITH_CENTER,
+    "button_element_id": ButtonElementID.LEFT,
+    "group": 3,
+    "function": ButtonFunction.EXTENDED_1,
+    "mode": ButtonMode.TWO_WAY_DOWN_PAIRED_1,
+    "channel": 100,
+    "sets_local_priority": True,
+    "calls_present": True,
+}
+
+
 class TestButtonInputPersistence:
     """get_property_tree and _apply_state round-trip."""
 
-    def test_property_tree_keys(self):
-        _, _, _, vdsd = _scaffold()
-        btn = ButtonInput(
-            vdsd=vdsd,
-            ds_index=1,
-            name="Rocker Down",
-            supports_local_key_mode=True,
-            button_id=3,
-            button_type=ButtonType.TWO_WAY_PUSHBUTTON,
-            button_element_id=ButtonElementID.DOWN,
-            group=2,
-            function=ButtonFunction.ROOM,
-            mode=ButtonMode.STANDARD,
-            channel=5,
-            sets_local_priority=True,
-            calls_present=True,
-        )
-        tree = btn.get_property_tree()
-        assert tree["dsIndex"] == 1
-        assert tree["name"] == "Rocker Down"
-        assert tree["supportsLocalKeyMode"] is True
-        assert tree["buttonID"] == 3
-        assert tree["buttonType"] == int(ButtonType.TWO_WAY_PUSHBUTTON)
-        assert tree["buttonElementID"] == int(ButtonElementID.DOWN)
-        assert tree["group"] == 2
-        assert tree["function"] == int(ButtonFunction.ROOM)
-        assert tree["mode"] == int(ButtonMode.STANDARD)
-        assert tree["channel"] == 5
-        assert tree["setsLocalPriority"] is True
-        assert tree["callsPresent"] is True
-
-    def test_property_tree_no_button_id(self):
-        _, _, _, vdsd = _scaffold()
+    def test_property_tree_keys(self, vdsd):
+        btn = ButtonInput(vdsd=vdsd, **_ROCKER_DOWN)
+        assert btn.get_property_tree() == _ROCKER_DOWN_TREE
+
+    def test_property_tree_no_button_id(self, vdsd):
         btn = ButtonInput(
             vdsd=vdsd, ds_index=0, button_id=None, name="X"
         )
         tree = btn.get_property_tree()
         assert "buttonID" not in tree
 
-    def test_round_trip(self):
-        """Persist → restore → compare."""
-        _, _, _, vdsd = _scaffold()
-        original = ButtonInput(
-            vdsd=vdsd,
-            ds_index=2,
-            name="Original",
-            supports_local_key_mode=True,
-            button_id=5,
-            button_type=ButtonType.FOUR_WAY_WITH_CENTER,
-            button_element_id=ButtonElementID.LEFT,
-            group=3,
-            function=ButtonFunction.EXTENDED_1,
-            mode=ButtonMode.TWO_WAY_DOWN_PAIRED_1,
-            channel=100,
-            sets_local_priority=True,
-            calls_present=True,
-        )
-        tree = original.get_property_tree()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def restored(cls, shared_vdc):
+        """A blank button restored from _FOUR_WAY_LEFT's property tree.
 
+        Built once for the class; the round-trip tests only read it.
+        """
+        vdsd = _make_vdsd(_make_device(shared_vdc))
+        original = ButtonInput(vdsd=vdsd, **_FOUR_WAY_LEFT)
         restored = ButtonInput(vdsd=vdsd, ds_index=0, name="Blank")
-        restored._apply_state(tree)
-
-        assert restored.ds_index == 2
-        assert restored.name == "Original"
-        assert restored.supports_local_key_mode is True
-        assert restored.button_id == 5
-        assert restored.button_type == ButtonType.FOUR_WAY_WITH_CENTER
-        assert restored.button_element_id == ButtonElementID.LEFT
-        assert restored.group == 3
-        assert restored.function == ButtonFunction.EXTENDED_1
-        assert restored.mode == ButtonMode.TWO_WAY_DOWN_PAIRED_1
-        assert restored.channel == 100
-        assert restored.sets_local_priority is True
-        assert restored.calls_present is True
-        # State is NOT persisted.
+        restored._apply_state(original.get_property_tree())
+        return restored
+
+    @pytest.mark.parametrize(
+        ("attr", "value"),
+        list(_FOUR_WAY_LEFT.items()),
+        ids=list(_FOUR_WAY_LEFT),
+    )
+    def test_round_trip(self, restored, attr, value):
+        """Persist → restore → compare, one attribute per case."""
+        assert getattr(restored, attr) == value
+
+    def test_round_trip_skips_state(self, restored):
+        """State is NOT persisted."""
         assert restored.value is None
         assert restored.click_type == ButtonClickType.IDLE
 
-    def test_apply_state_partial(self):
+    def test_apply_state_partial(self, vdsd):
         """_apply_state with partial dict keeps other defaults."""
-        _, _, _, vdsd = _scaffold()
         btn = _make_button_input(vdsd)
         btn._apply_state({"group": 8, "channel": 50})
         assert btn.group == 8
@@ -759,48 +790,45 @@ class TestButtonInputPersistence:
 class TestVdsdButtonInputIntegration:
     """Integration of ButtonInput with Vdsd."""
 
-    def test_add_button_input(self):
-        _, _, _, vdsd = _scaffold()
-        btn = _make_button_input(vdsd, ds_index=0)
-        vdsd.add_button_input(btn)
-        assert len(vdsd.button_inputs) == 1
-        assert vdsd.get_button_input(0) is btn
-
-    def test_add_replaces_same_index(self):
-        _, _, _, vdsd = _scaffold()
-        btn1 = _make_button_input(vdsd, ds_index=0, name="First")
-        btn2 = _make_button_input(vdsd, ds_index=0, name="Second")
-        vdsd.add_button_input(btn1)
-        vdsd.add_button_input(btn2)
-        assert len(vdsd.button_inputs) == 1
-        assert vdsd.get_button_input(0).name == "Second"
-
-    def test_add_wrong_vdsd_raises(self):
-        _, _, _, vdsd1 = _scaffold()
-        _, _, _, vdsd2 = _scaffold()
-        btn = _make_button_input(vdsd1)
+    @pytest.mark.parametrize(
+        ("added", "expected"),
+        [
+            ([(0, "Btn")], {0: "Btn"}),
+            ([(0, "First"), (0, "Second")], {0: "Second"}),
+            ([(0, "Down"), (1, "Up")], {0: "Down", 1: "Up"}),
+        ],
+        ids=["single", "replaces_same_index", "multiple"],
+    )
+    def test_add_button_input(self, vdsd, added, expected):
+        buttons = {}
+        for ds_index, name in added:
+            btn = _make_button_input(vdsd, ds_index=ds_index, name=name)
+            vdsd.add_button_input(btn)
+            buttons[ds_index] = btn
+        assert vdsd.button_inputs == buttons
+        assert {i: b.name for i, b in vdsd.button_inputs.items()} == expected
+
+    def test_add_wrong_vdsd_raises(self, shared_vdc, vdsd):
+        other = _make_vdsd(_make_device(shared_vdc))
+        btn = _make_button_input(vdsd)
         with pytest.raises(ValueError, match="different vdSD"):
-            vdsd2.add_button_input(btn)
+            other.add_button_input(btn)
 
-    def test_remove_button_input(self):
-        _, _, _, vdsd = _scaffold()
+    def test_remove_button_input(self, vdsd):
         btn = _make_button_input(vdsd)
         vdsd.add_button_input(btn)
         removed = vdsd.remove_button_input(0)
         assert removed is btn
         assert vdsd.get_button_input(0) is None
 
-    def test_remove_nonexistent(self):
-        _, _, _, vdsd = _scaffold()
-        assert vdsd.remove_button_input(99) is None
+    @pytest.mark.parametrize(
+        "method", ["remove_button_input", "get_button_input"]
+    )
+    def test_nonexistent_index(self, vdsd, method):
+        assert getattr(vdsd, method)(99) is None
 
-    def test_get_nonexistent(self):
-        _, _, _, vdsd = _scaffold()
-        assert vdsd.get_button_input(99) is None
-
-    def test_button_input_in_properties(self):
+    def test_button_input_in_properties(self, vdsd):
         """get_properties includes button descriptions/settings/states."""
-        _, _, _, vdsd = _scaffold()
         btn = _make_button_input(vdsd)
         vdsd.add_button_input(btn)
         props = vdsd.get_properties()
@@ -809,23 +837,20 @@ class TestVdsdButtonInputIntegration:
         assert "buttonInputStates" in props
         assert "0" in props["buttonInputDescriptions"]
 
-    def test_button_input_not_in_properties_when_empty(self):
-        _, _, _, vdsd = _scaffold()
+    def test_button_input_not_in_properties_when_empty(self, vdsd):
         props = vdsd.get_properties()
         assert "buttonInputDescriptions" not in props
 
-    def test_button_input_in_property_tree(self):
+    def test_button_input_in_property_tree(self, vdsd):
         """get_property_tree includes buttonInputs."""
-        _, _, _, vdsd = _scaffold()
         btn = _make_button_input(vdsd)
         vdsd.add_button_input(btn)
         tree = vdsd.get_property_tree()
         assert "buttonInputs" in tree
         assert len(tree["buttonInputs"]) == 1
 
-    def test_button_input_persistence_round_trip(self):
+    def test_button_input_persistence_round_trip(self, shared_vdc, vdsd):
         """Vdsd persistence restores button inputs."""
-        _, _, _, vdsd = _scaffold()
         btn = ButtonInput(
             vdsd=vdsd,
             ds_index=0,
@@ -840,31 +865,14 @@ class TestVdsdButtonInputIntegration:
         tree = vdsd.get_property_tree()
 
         # Create new vdsd and restore.
-        _, _, device2, vdsd2 = _scaffold()
+        vdsd2 = _make_vdsd(_make_device(shared_vdc))
         vdsd2._apply_state(tree)
 
-        assert len(vdsd2.button_inputs) == 1
-        restored = vdsd2.get_button_input(0)
-        assert restored is not None
-        assert restored.name == "Persisted"
-        assert restored.group == 5
-        assert restored.function == ButtonFunction.ROOM
-
-    def test_multiple_button_inputs(self):
-        """Two button inputs can coexist on same vdSD."""
-        _, _, _, vdsd = _scaffold()
-        btn0 = _make_button_input(vdsd, ds_index=0, name="Down")
-        btn1 = _make_button_input(
-            vdsd,
-            ds_index=1,
-            name="Up",
-            button_element_id=ButtonElementID.UP,
-        )
-        vdsd.add_button_input(btn0)
-        vdsd.add_button_input(btn1)
-        assert len(vdsd.button_inputs) == 2
-        assert vdsd.get_button_input(0).name == "Down"
-        assert vdsd.get_button_input(1).name == "Up"
+        restored = {
+            idx: b.get_property_tree()
+            for idx, b in vdsd2.button_inputs.items()
+        }
+        assert restored == {0: btn.get_property_tree()}
 
 
 # ===========================================================================
@@ -875,38 +883,29 @@ class TestVdsdButtonInputIntegration:
 class TestButtonInputSessionManagement:
     """start_alive_timer / stop_alive_timer (session hooks)."""
 
-    def test_start_alive_timer_stores_session(self):
-        _, _, _, vdsd = _scaffold()
+    def test_start_alive_timer_stores_session(self, vdsd, session):
         btn = _make_button_input(vdsd)
-        session = _make_mock_session()
         btn.start_alive_timer(session)
         assert btn._session is session
 
-    def test_stop_alive_timer_clears_session(self):
-        _, _, _, vdsd = _scaffold()
+    def test_stop_alive_timer_clears_session(self, vdsd, session):
         btn = _make_button_input(vdsd)
-        session = _make_mock_session()
         btn.start_alive_timer(session)
         btn.stop_alive_timer()
         assert btn._session is None
 
-    def test_stop_alive_timer_stops_click_detector(self):
-        _, _, _, vdsd = _scaffold()
+    def test_stop_alive_timer_stops_click_detector(self, vdsd, session):
         btn = _make_button_input(vdsd)
-        session = _make_mock_session()
         btn.start_alive_timer(session)
         btn.stop_alive_timer()
         assert btn.click_detector.state == "idle"
 
-    @pytest.mark.asyncio
-    async def test_update_click_uses_stored_session(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_update_click_uses_stored_session(self, vdsd, session):
         btn = _make_button_input(vdsd)
-        session = _make_mock_session()
         vdsd._announced = True
         btn.start_alive_timer(session)
         await btn.update_click(ButtonClickType.CLICK_1X)
-        session.send_notification.assert_awaited_once()
+        assert _pushed_state(session)["clickType"] == _CLICK_1X
 
 
 # ===========================================================================
@@ -917,21 +916,16 @@ class TestButtonInputSessionManagement:
 class TestVdcHostButtonInputSetProperty:
     """buttonInputSettings via _apply_vdsd_set_property."""
 
-    def test_set_button_settings(self):
-        host, vdc, device, vdsd = _scaffold()
-        host.add_vdc(vdc)
-        vdc.add_device(device)
-        device.add_vdsd(vdsd)
-
-        btn = _make_button_input(vdsd)
-        vdsd.add_button_input(btn)
+    def test_set_button_settings(self, wired_stack, wired_button):
+        host, _, _, vdsd = wired_stack
+        btn = wired_button
 
         incoming = {
             "buttonInputSettings": {
                 "0": {
                     "group": 3,
-                    "function": int(ButtonFunction.AREA_1),
-                    "mode": int(ButtonMode.STANDARD),
+                    "function": _FUNCTION_AREA_1,
+                    "mode": _MODE_STANDARD,
                     "channel": 15,
                 },
             },
@@ -951,35 +945,96 @@ class TestVdcHostButtonInputSetProperty:
 class TestButtonInputAutoSave:
     """Settings changes trigger auto-save up the chain."""
 
-    def test_group_setter_triggers_auto_save(self):
-        host, vdc, device, vdsd = _scaffold()
-        host.add_vdc(vdc)
-        vdc.add_device(device)
-        device.add_vdsd(vdsd)
-        btn = _make_button_input(vdsd)
-        vdsd.add_button_input(btn)
-
-        with patch.object(device, "_schedule_auto_save") as mock_save:
-            btn.group = 5
-            mock_save.assert_called()
-
-    def test_function_setter_triggers_auto_save(self):
-        host, vdc, device, vdsd = _scaffold()
-        host.add_vdc(vdc)
-        vdc.add_device(device)
-        device.add_vdsd(vdsd)
-        btn = _make_button_input(vdsd)
-        vdsd.add_button_input(btn)
+    @pytest.mark.parametrize(
+        ("attr", "value"),
+        [
+            ("group", 5),
+            ("function", ButtonFunction.ROOM),
+            ("mode", ButtonMode.SWITCHED),
+            ("channel", 20),
+            ("sets_local_priority", True),
+            ("calls_present", True),
+        ],
+    )
+    def test_setter_triggers_auto_save(
+        self, monkeypatch, wired_stack, wired_button, attr, value
+    ):
+        _, _, device, _ = wired_stack
+        calls: List[int] = []
+        monkeypatch.setattr(
+            device, "_schedule_auto_save", lambda: calls.append(1)
+        )
 
-        with patch.object(device, "_schedule_auto_save") as mock_save:
-            btn.function = ButtonFunction.ROOM
-            mock_save.assert_called()
+        setattr(wired_button, attr, value)
+        assert calls
 
 
 # ===========================================================================
 # ClickDetector — state machine
 # ===========================================================================
 
+class _FakeTimer:
+    """Stand-in for :class:`asyncio.TimerHandle`."""
+
+    __slots__ = ("_when", "cancelled")
+
+    def __init__(self, when: float) -> None:
+        self._when = when
+        self.cancelled = False
+
+    def when(self) -> float:
+        return self._when
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class _FakeClock:
+    """Virtual time for ClickDetector's deadline timer.
+
+    Installed by the ``fake_clock`` fixture in place of the running
+    loop's ``time`` and ``call_at``; nothing fires until
+    :meth:`advance` moves the clock past a timer's deadline.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self._timers: List[Tuple[float, int, _FakeTimer, Any]] = []
+        self._seq = itertools.count()
+
+    def time(self) -> float:
+        return self.now
+
+    def call_at(self, when: float, callback: Any) -> _FakeTimer:
+        timer = _FakeTimer(when)
+        heapq.heappush(
+            self._timers, (when, next(self._seq), timer, callback)
+        )
+        return timer
+
+    async def advance(self, seconds: float) -> None:
+        """Move time forward, firing due timers in deadline order."""
+        target = self.now + seconds
+        while self._timers and self._timers[0][0] <= target:
+            when, _, timer, callback = heapq.heappop(self._timers)
+            self.now = when
+            if not timer.cancelled:
+                callback()
+                # Let the on_click coroutine the timer emitted run.
+                await asyncio.sleep(0)
+        self.now = target
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def fake_clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    clock = _FakeClock()
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(loop, "time", clock.time)
+    monkeypatch.setattr(loop, "call_at", clock.call_at)
+    return clock
+
+
 
 class TestClickDetectorConstruction:
     """ClickDetector creation and default values."""
@@ -1012,8 +1067,7 @@ class TestClickDetectorConstruction:
 class TestClickDetectorSingleClick:
     """Single click detection (press + release within tip_timeout)."""
 
-    @pytest.mark.asyncio
-    async def test_single_click_click_mode(self):
+    async def test_single_click_click_mode(self, fake_clock):
         """Short press → CLICK_1X after multi-click window."""
         events: List[Tuple[ButtonClickType, bool]] = []
 
@@ -1027,17 +1081,16 @@ class TestClickDetectorSingleClick:
         )
         cd.press()
         assert cd.state == "pressed"
-        await asyncio.sleep(0.02)  # within tip_timeout
+        await fake_clock.advance(0.02)  # within tip_timeout
         cd.release()
         assert cd.state == "tip_wait"
         assert cd.tip_count == 1
-        await asyncio.sleep(0.1)  # multi_click_window expires
+        await fake_clock.advance(0.1)  # multi_click_window expires
         assert cd.state == "idle"
         assert len(events) == 1
         assert events[0] == (ButtonClickType.CLICK_1X, False)
 
-    @pytest.mark.asyncio
-    async def test_single_click_tip_mode(self):
+    async def test_single_click_tip_mode(self, fake_clock):
         """Short press with use_tip_events → TIP_1X."""
         events: List[Tuple[ButtonClickType, bool]] = []
 
@@ -1051,17 +1104,16 @@ class TestClickDetectorSingleClick:
             use_tip_events=True,
         )
         cd.press()
-        await asyncio.sleep(0.02)
+        await fake_clock.advance(0.02)
         cd.release()
-        await asyncio.sleep(0.1)
+        await fake_clock.advance(0.1)
         assert events[-1] == (ButtonClickType.TIP_1X, False)
 
 
 class TestClickDetectorDoubleClick:
     """Double click detection."""
 
-    @pytest.mark.asyncio
-    async def test_double_click(self):
+    async def test_double_click(self, fake_clock):
         events: List[Tuple[ButtonClickType, bool]] = []
 
         async def on_click(ct, val):
@@ -1074,20 +1126,19 @@ class TestClickDetectorDoubleClick:
         )
         # First press/release
         cd.press()
-        await asyncio.sleep(0.02)
+        await fake_clock.advance(0.02)
         cd.release()
-        await asyncio.sleep(0.02)  # within multi-click window
+        await fake_clock.advance(0.02)  # within multi-click window
         # Second press/release
         cd.press()
-        await asyncio.sleep(0.02)
+        await fake_clock.advance(0.02)
         cd.release()
-        await asyncio.sleep(0.15)  # multi_click_window expires
+        await fake_clock.advance(0.15)  # multi_click_window expires
 
         assert len(events) == 1
         assert events[0] == (ButtonClickType.CLICK_2X, False)
 
-    @pytest.mark.asyncio
-    async def test_triple_click(self):
+    async def test_triple_click(self, fake_clock):
         events: List[Tuple[ButtonClickType, bool]] = []
 
         async def on_click(ct, val):
@@ -1100,16 +1151,15 @@ class TestClickDetectorDoubleClick:
         )
         for _ in range(3):
             cd.press()
-            await asyncio.sleep(0.02)
+            await fake_clock.advance(0.02)
             cd.release()
-            await asyncio.sleep(0.02)
-        await asyncio.sleep(0.15)
+            await fake_clock.advance(0.02)
+        await fake_clock.advance(0.15)
 
         assert len(events) == 1
         assert events[0] == (ButtonClickType.CLICK_3X, False)
 
-    @pytest.mark.asyncio
-    async def test_quad_click_caps_at_3x(self):
+    async def test_quad_click_caps_at_3x(self, fake_clock):
         """4+ clicks in click mode cap at CLICK_3X."""
         events: List[Tuple[ButtonClickType, bool]] = []
 
@@ -1123,15 +1173,14 @@ class TestClickDetectorDoubleClick:
         )
         for _ in range(4):
             cd.press()
-            await asyncio.sleep(0.02)
+            await fake_clock.advance(0.02)
             cd.release()
-            await asyncio.sleep(0.02)
-        await asyncio.sleep(0.15)
+            await fake_clock.advance(0.02)
+        await fake_clock.advance(0.15)
 
         assert events[-1][0] == ButtonClickType.CLICK_3X
 
-    @pytest.mark.asyncio
-    async def test_quad_click_tip_mode(self):
+    async def test_quad_click_tip_mode(self, fake_clock):
         """4+ clicks in tip mode emit TIP_4X."""
         events: List[Tuple[ButtonClickType, bool]] = []
 
@@ -1146,10 +1195,10 @@ class TestClickDetectorDoubleClick:
         )
         for _ in range(4):
             cd.press()
-            await asyncio.sleep(0.02)
+            await fake_clock.advance(0.02)
             cd.release()
-            await asyncio.sleep(0.02)
-        await asyncio.sleep(0.15)
+            await fake_clock.advance(0.02)
+        await fake_clock.advance(0.15)
 
         assert events[-1][0] == ButtonClickType.TIP_4X
 
@@ -1157,7 +1206,6 @@ class TestClickDetectorDoubleClick:
 class TestClickDetectorHold:
     """Hold detection (press held past tip_timeout)."""
 
-    @pytest.mark.asyncio
     async def test_hold_start(self):
         events: List[Tuple[ButtonClickType, bool]] = []
 
@@ -1175,7 +1223,6 @@ class TestClickDetectorHold:
         assert len(events) >= 1
         assert events[0] == (ButtonClickType.HOLD_START, True)
 
-    @pytest.mark.asyncio
     async def test_hold_end(self):
         events: List[Tuple[ButtonClickType, bool]] = []
 
@@ -1194,7 +1241,6 @@ class TestClickDetectorHold:
         assert cd.state == "idle"
         assert events[-1] == (ButtonClickType.HOLD_END, False)
 
-    @pytest.mark.asyncio
     async def test_hold_repeat(self):
         events: List[Tuple[ButtonClickType, bool]] = []
 
@@ -1212,7 +1258,7 @@ class TestClickDetectorHold:
         await asyncio.sleep(0)  # let ensure_future run
 
         repeat_events = [
-            e for e in events if e[0] == ButtonClickType.HOLD_REPEAT
+            e for e in events if e[0] is ButtonClickType.HOLD_REPEAT
         ]
         assert len(repeat_events) >= 1
         for ct, val in repeat_events:
@@ -1224,7 +1270,6 @@ class TestClickDetectorHold:
 class TestClickDetectorCombos:
     """Short-long and short-short-long combo detection."""
 
-    @pytest.mark.asyncio
     async def test_short_long(self):
         """One short press + hold → SHORT_LONG."""
         events: List[Tuple[ButtonClickType, bool]] = []
@@ -1249,7 +1294,7 @@ class TestClickDetectorCombos:
         assert cd.state == "holding"
 
         combo_events = [
-            e for e in events if e[0] == ButtonClickType.SHORT_LONG
+            e for e in events if e[0] is ButtonClickType.SHORT_LONG
         ]
         assert len(combo_events) == 1
         assert combo_events[0] == (ButtonClickType.SHORT_LONG, True)
@@ -1258,7 +1303,6 @@ class TestClickDetectorCombos:
         await asyncio.sleep(0)  # let ensure_future run
         assert events[-1] == (ButtonClickType.HOLD_END, False)
 
-    @pytest.mark.asyncio
     async def test_short_short_long(self):
         """Two short presses + hold → SHORT_SHORT_LONG."""
         events: List[Tuple[ButtonClickType, bool]] = []
@@ -1284,7 +1328,7 @@ class TestClickDetectorCombos:
 
         combo_events = [
             e for e in events
-            if e[0] == ButtonClickType.SHORT_SHORT_LONG
+            if e[0] is ButtonClickType.SHORT_SHORT_LONG
         ]
         assert len(combo_events) == 1
         assert combo_events[0] == (
@@ -1300,7 +1344,6 @@ class TestClickDetectorCombos:
 class TestClickDetectorEdgeCases:
     """Edge case handling in the state machine."""
 
-    @pytest.mark.asyncio
     async def test_double_press_ignored(self):
         """Pressing while already pressed is ignored."""
         cd = ClickDetector(on_click=MagicMock())
@@ -1309,14 +1352,12 @@ class TestClickDetectorEdgeCases:
         cd.press()  # duplicate — should be ignored
         assert cd.state == "pressed"
 
-    @pytest.mark.asyncio
     async def test_release_in_idle_ignored(self):
         """Release without press is ignored."""
         cd = ClickDetector(on_click=MagicMock())
         cd.release()  # no-op
         assert cd.state == "idle"
 
-    @pytest.mark.asyncio
     async def test_stop_resets(self):
         """stop() cancels timers and returns to idle."""
         cd = ClickDetector(
@@ -1329,6 +1370,61 @@ class TestClickDetectorEdgeCases:
         assert cd.state == "idle"
         assert cd.tip_count == 0
 
+    async def test_stop_when_idle_is_noop(self):
+        cd = ClickDetector(on_click=MagicMock())
+        cd.stop()
+        assert cd.state == "idle"
+        assert cd._timer is None
+
+    async def test_stop_cancels_handle_left_after_hold_end(
+        self, fake_clock
+    ):
+        """Back in IDLE after HOLD_END, the repeat handle is still
+        pending until stop() cancels it."""
+        cd = ClickDetector(
+            on_click=MagicMock(), tip_timeout=0.05, hold_repeat_interval=1.0
+        )
+        cd.press()
+        await fake_clock.advance(0.06)
+        cd.release()
+        timer = cd._timer
+        assert cd.state == "idle"
+        assert timer is not None
+
+        cd.stop()
+        assert timer.cancelled
+        assert cd._timer is None
+
+    async def test_later_deadline_keeps_pending_timer(self):
+        """Re-arming to a later deadline reuses the pending handle."""
+        cb = MagicMock()
+        cd = ClickDetector(
+            on_click=cb, tip_timeout=0.02, multi_click_window=0.05
+        )
+        cd.press()
+        tip_timer = cd._timer
+        cd.release()
+        assert cd._timer is tip_timer
+        assert not tip_timer.cancelled()
+        await asyncio.sleep(0.03)
+        # The tip handle fired early and re-armed for the window.
+        cb.assert_not_called()
+        await asyncio.sleep(0.05)
+        cb.assert_called_once_with(ButtonClickType.CLICK_1X, False)
+
+    async def test_earlier_deadline_replaces_pending_timer(self):
+        """Re-arming to an earlier deadline cancels the pending handle."""
+        cd = ClickDetector(
+            on_click=MagicMock(), tip_timeout=0.1, multi_click_window=0.01
+        )
+        cd.press()
+        tip_timer = cd._timer
+        cd.release()
+        assert tip_timer.cancelled()
+        assert cd._timer is not tip_timer
+        cd.stop()
+        assert cd._timer is None
+
     def test_press_without_event_loop(self):
         """press() without running event loop doesn't crash."""
         cd = ClickDetector(on_click=MagicMock())
@@ -1336,7 +1432,6 @@ class TestClickDetectorEdgeCases:
         cd.press()
         assert cd.state == "pressed"
 
-    @pytest.mark.asyncio
     async def test_callback_exception_logged(self):
         """Exception in callback is caught and logged."""
 
@@ -1364,25 +1459,19 @@ class TestClickDetectorEdgeCases:
 class TestButtonInputClickDetectorIntegration:
     """press() / release() on ButtonInput via ClickDetector."""
 
-    @pytest.mark.asyncio
-    async def test_press_sets_value_true(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_press_sets_value_true(self, vdsd):
         btn = _make_button_input(vdsd)
         btn.press()
         assert btn.value is True
 
-    @pytest.mark.asyncio
-    async def test_release_sets_value_false(self):
-        _, _, _, vdsd = _scaffold()
+    async def test_release_sets_value_false(self, vdsd):
         btn = _make_button_input(vdsd)
         btn.press()
         btn.release()
         assert btn.value is False
 
-    @pytest.mark.asyncio
-    async def test_single_click_pushes(self):
+    async def test_single_click_pushes(self, vdsd, session):
         """press+release resolves CLICK_1X and pushes."""
-        _, _, _, vdsd = _scaffold()
         btn = ButtonInput(
             vdsd=vdsd,
             ds_index=0,
@@ -1392,7 +1481,6 @@ class TestButtonInputClickDetectorIntegration:
                 "multi_click_window": 0.05,
             },
         )
-        session = _make_mock_session()
         vdsd._announced = True
         btn.start_alive_timer(session)
 
@@ -1405,10 +1493,8 @@ class TestButtonInputClickDetectorIntegration:
         assert btn.value is False
         session.send_notification.assert_awaited()
 
-    @pytest.mark.asyncio
-    async def test_hold_pushes_sequence(self):
+    async def test_hold_pushes_sequence(self, vdsd, session):
         """Long press pushes HOLD_START → HOLD_END."""
-        _, _, _, vdsd = _scaffold()
         btn = ButtonInput(
             vdsd=vdsd,
             ds_index=0,
@@ -1418,7 +1504,6 @@ class TestButtonInputClickDetectorIntegration:
                 "hold_repeat_interval": 10.0,
             },
         )
-        session = _make_mock_session()
         vdsd._announced = True
         btn.start_alive_timer(session)
 
@@ -1435,17 +1520,75 @@ class TestButtonInputClickDetectorIntegration:
         # At least 2 pushes: HOLD_START + HOLD_END.
         assert session.send_notification.await_count >= 2
 
-    @pytest.mark.asyncio
-    async def test_stop_session_stops_detector(self):
+    async def test_hold_repeats_coalesce_while_push_in_flight(
+        self, vdsd, session
+    ):
+        """Repeats during a slow push collapse into one later push."""
+        btn = _make_button_input(vdsd)
+        vdsd._announced = True
+        btn._session = session
+        gate = asyncio.Event()
+
+        async def slow_send(msg):
+            await gate.wait()
+
+        session.send_notification.side_effect = slow_send
+        first = asyncio.ensure_future(
+            btn._on_click_detected(ButtonClickType.HOLD_START, True)
+        )
+        await asyncio.sleep(0)
+        for _ in range(3):
+            await btn._on_click_detected(ButtonClickType.HOLD_REPEAT, True)
+        assert session.send_notification.await_count == 1
+
+        gate.set()
+        await first
+
+        assert session.send_notification.await_count == 2
+        msg = session.send_notification.await_args.args[0]
+        props = elements_to_dict(
+            msg.vdc_send_push_notification.changedproperties
+        )
+        assert props["buttonInputStates"]["0"]["clickType"] == _HOLD_REPEAT
+
+    async def test_deferred_repeat_dropped_after_hold_end(
+        self, vdsd, session
+    ):
+        """A repeat superseded by HOLD_END is not pushed afterwards."""
+        btn = _make_button_input(vdsd)
+        vdsd._announced = True
+        btn._session = session
+        gate = asyncio.Event()
+
+        async def slow_send(msg):
+            await gate.wait()
+
+        session.send_notification.side_effect = slow_send
+        first = asyncio.ensure_future(
+            btn._on_click_detected(ButtonClickType.HOLD_START, True)
+        )
+        await asyncio.sleep(0)
+        await btn._on_click_detected(ButtonClickType.HOLD_REPEAT, True)
+        end = asyncio.ensure_future(
+            btn._on_click_detected(ButtonClickType.HOLD_END, False)
+        )
+        await asyncio.sleep(0)
+
+        gate.set()
+        await asyncio.gather(first, end)
+
+        # HOLD_START and HOLD_END only.
+        assert session.send_notification.await_count == 2
+        assert btn.click_type == ButtonClickType.HOLD_END
+
+    async def test_stop_session_stops_detector(self, vdsd, session):
         """stop_alive_timer stops the click detector."""
-        _, _, _, vdsd = _scaffold()
         btn = ButtonInput(
             vdsd=vdsd,
             ds_index=0,
             name="StopTest",
             click_detector_config={"tip_timeout": 0.05},
         )
-        session = _make_mock_session()
         btn.start_alive_timer(session)
         btn.press()
         assert btn.click_detector.state == "pressed"
@@ -1497,12 +1640,19 @@ class TestGetRequiredElements:
         elems = get_required_elements(ButtonType.UNDEFINED)
         assert elems == []
 
+    def test_returns_mutable_copy(self):
+        elems = get_required_elements(ButtonType.TWO_WAY_PUSHBUTTON)
+        elems.append(ButtonElementID.CENTER)
+        assert BUTTON_TYPE_ELEMENTS[ButtonType.TWO_WAY_PUSHBUTTON] == (
+            ButtonElementID.DOWN,
+            ButtonElementID.UP,
+        )
+
 
 class TestCreateButtonGroup:
     """create_button_group factory helper."""
 
-    def test_single_pushbutton(self):
-        _, _, _, vdsd = _scaffold()
+    def test_single_pushbutton(self, vdsd):
         buttons = create_button_group(
             vdsd,
             button_id=0,
@@ -1515,8 +1665,7 @@ class TestCreateButtonGroup:
         assert buttons[0].ds_index == 0
         assert "Center" in buttons[0].name
 
-    def test_two_way_pushbutton(self):
-        _, _, _, vdsd = _scaffold()
+    def test_two_way_pushbutton(self, vdsd):
         buttons = create_button_group(
             vdsd,
             button_id=1,
@@ -1534,8 +1683,7 @@ class TestCreateButtonGroup:
             for b in buttons
         )
 
-    def test_settings_propagated(self):
-        _, _, _, vdsd = _scaffold()
+    def test_settings_propagated(self, vdsd):
         buttons = create_button_group(
             vdsd,
             button_id=0,
@@ -1555,8 +1703,7 @@ class TestCreateButtonGroup:
         assert btn.sets_local_priority is True
         assert btn.calls_present is True
 
-    def test_undefined_raises(self):
-        _, _, _, vdsd = _scaffold()
+    def test_undefined_raises(self, vdsd):
         with pytest.raises(ValueError, match="no standard element"):
             create_button_group(
                 vdsd,
@@ -1564,8 +1711,7 @@ class TestCreateButtonGroup:
                 button_type=ButtonType.UNDEFINED,
             )
 
-    def test_click_detector_config_propagated(self):
-        _, _, _, vdsd = _scaffold()
+    def test_click_detector_config_propagated(self, vdsd):
         buttons = create_button_group(
             vdsd,
             button_id=0,
@@ -1574,8 +1720,7 @@ class TestCreateButtonGroup:
         )
         assert buttons[0].click_detector.tip_timeout == 0.5
 
-    def test_eight_way_with_center_elements(self):
-        _, _, _, vdsd = _scaffold()
+    def test_eight_way_with_center_elements(self, vdsd):
         buttons = create_button_group(
             vdsd,
             button_id=0,
@@ -1597,53 +1742,87 @@ class TestCreateButtonGroup:
 class TestButtonEnumCompleteness:
     """Verify enum values against documentation."""
 
+    @staticmethod
+    def _values(enum_cls) -> Dict[str, int]:
+        return {m.name: m.value for m in enum_cls}
+
     def test_click_type_values(self):
-        assert ButtonClickType.TIP_1X == 0
-        assert ButtonClickType.TIP_4X == 3
-        assert ButtonClickType.HOLD_START == 4
-        assert ButtonClickType.HOLD_REPEAT == 5
-        assert ButtonClickType.HOLD_END == 6
-        assert ButtonClickType.CLICK_1X == 7
-        assert ButtonClickType.CLICK_3X == 9
-        assert ButtonClickType.SHORT_LONG == 10
-        assert ButtonClickType.SHORT_SHORT_LONG == 13
-        assert ButtonClickType.IDLE == 255
+        assert self._values(ButtonClickType) == {
+            "TIP_1X": 0,
+            "TIP_2X": 1,
+            "TIP_3X": 2,
+            "TIP_4X": 3,
+            "HOLD_START": 4,
+            "HOLD_REPEAT": 5,
+            "HOLD_END": 6,
+            "CLICK_1X": 7,
+            "CLICK_2X": 8,
+            "CLICK_3X": 9,
+            "SHORT_LONG": 10,
+            "LOCAL_OFF": 11,
+            "LOCAL_ON": 12,
+            "SHORT_SHORT_LONG": 13,
+            "LOCAL_STOP": 14,
+            "LOCAL_DIM": 15,
+            "IDLE": 255,
+        }
 
     def test_button_type_values(self):
-        assert ButtonType.UNDEFINED == 0
-        assert ButtonType.SINGLE_PUSHBUTTON == 1
-        assert ButtonType.TWO_WAY_PUSHBUTTON == 2
-        assert ButtonType.FOUR_WAY_NAVIGATION == 3
-        assert ButtonType.FOUR_WAY_WITH_CENTER == 4
-        assert ButtonType.EIGHT_WAY_WITH_CENTER == 5
-        assert ButtonType.ON_OFF_SWITCH == 6
+        assert self._values(ButtonType) == {
+            "UNDEFINED": 0,
+            "SINGLE_PUSHBUTTON": 1,
+            "TWO_WAY_PUSHBUTTON": 2,
+            "FOUR_WAY_NAVIGATION": 3,
+            "FOUR_WAY_WITH_CENTER": 4,
+            "EIGHT_WAY_WITH_CENTER": 5,
+            "ON_OFF_SWITCH": 6,
+        }
 
     def test_button_element_id_values(self):
-        assert ButtonElementID.CENTER == 0
-        assert ButtonElementID.DOWN == 1
-        assert ButtonElementID.UP == 2
-        assert ButtonElementID.LEFT == 3
-        assert ButtonElementID.RIGHT == 4
-        assert ButtonElementID.UPPER_LEFT == 5
-        assert ButtonElementID.LOWER_LEFT == 6
-        assert ButtonElementID.UPPER_RIGHT == 7
-        assert ButtonElementID.LOWER_RIGHT == 8
+        assert self._values(ButtonElementID) == {
+            "CENTER": 0,
+            "DOWN": 1,
+            "UP": 2,
+            "LEFT": 3,
+            "RIGHT": 4,
+            "UPPER_LEFT": 5,
+            "LOWER_LEFT": 6,
+            "UPPER_RIGHT": 7,
+            "LOWER_RIGHT": 8,
+        }
 
     def test_action_mode_values(self):
-        assert ActionMode.NORMAL == 0
-        assert ActionMode.FORCE == 1
-        assert ActionMode.UNDO == 2
+        assert self._values(ActionMode) == {
+            "NORMAL": 0,
+            "FORCE": 1,
+            "UNDO": 2,
+        }
 
     def test_button_function_values(self):
-        assert ButtonFunction.DEVICE == 0
-        assert ButtonFunction.ROOM == 5
-        assert ButtonFunction.APP == 15
+        assert self._values(ButtonFunction) == {
+            "DEVICE": 0,
+            "AREA_1": 1,
+            "AREA_2": 2,
+            "AREA_3": 3,
+            "AREA_4": 4,
+            "ROOM": 5,
+            "EXTENDED_1": 6,
+            "EXTENDED_2": 7,
+            "EXTENDED_3": 8,
+            "EXTENDED_4": 9,
+            "EXTENDED_AREA_1": 10,
+            "EXTENDED_AREA_2": 11,
+            "EXTENDED_AREA_3": 12,
+            "EXTENDED_AREA_4": 13,
+            "APARTMENT": 14,
+            "APP": 15,
+        }
 
     def test_button_type_elements_coverage(self):
         """Every non-UNDEFINED ButtonType has elements defined."""
         for bt in ButtonType:
             if bt == ButtonType.UNDEFINED:
-                assert BUTTON_TYPE_ELEMENTS[bt] == []
+                assert BUTTON_TYPE_ELEMENTS[bt] == ()
             else:
                 assert len(BUTTON_TYPE_ELEMENTS[bt]) >= 1
 
@@ -1695,35 +1874,28 @@ class TestExports:
 class TestAnnouncementLifecycle:
     """ButtonInput session hooks during vdSD announce/vanish/reset."""
 
-    @pytest.mark.asyncio
-    async def test_announce_starts_session(self):
+    async def test_announce_starts_session(self, vdsd, session):
         """When vdSD is announced, button inputs get the session."""
-        _, _, _, vdsd = _scaffold()
         btn = _make_button_input(vdsd)
         vdsd.add_button_input(btn)
 
-        session = _make_mock_session()
         # Simulate announcement response.
         response = pb.Message()
         response.generic_response.code = pb.ERR_OK
-        session.send_request = AsyncMock(return_value=response)
+        session.send_request.return_value = response
 
         await vdsd.announce(session)
 
         assert btn._session is session
 
-    @pytest.mark.asyncio
-    async def test_vanish_clears_session(self):
+    async def test_vanish_clears_session(self, vdsd, session):
         """Vanish stops the click detector and clears session."""
-        _, _, _, vdsd = _scaffold()
         btn = _make_button_input(vdsd)
         vdsd.add_button_input(btn)
 
-        session = _make_mock_session()
         response = pb.Message()
         response.generic_response.code = pb.ERR_OK
-        session.send_request = AsyncMock(return_value=response)
-        session.send_notification = AsyncMock()
+        session.send_request.return_value = response
 
         await vdsd.announce(session)
         assert btn._session is session
@@ -1731,23 +1903,19 @@ class TestAnnouncementLifecycle:
         await vdsd.vanish(session)
         assert btn._session is None
 
-    def test_reset_announcement_clears_session(self):
+    def test_reset_announcement_clears_session(self, vdsd, session):
         """reset_announcement stops buttons."""
-        _, _, _, vdsd = _scaffold()
         btn = _make_button_input(vdsd)
         vdsd.add_button_input(btn)
-        btn._session = _make_mock_session()
+        btn._session = session
         vdsd.reset_announcement()
         assert btn._session is None
 
-    @pytest.mark.asyncio
-    async def test_add_after_announce(self):
+    async def test_add_after_announce(self, vdsd, session):
         """Adding a button after announcement starts session hook."""
-        _, _, _, vdsd = _scaffold()
-        session = _make_mock_session()
         response = pb.Message()
         response.generic_response.code = pb.ERR_OK
-        session.send_request = AsyncMock(return_value=response)
+        session.send_request.return_value = response
 
         await vdsd.announce(session)
 
@@ -4,16 +4,49 @@ import asyncio
 import struct
 
 import pytest
+import pytest_asyncio
 
 from pydsvdcapi import vdc_messages_pb2 as pb
 from pydsvdcapi.connection import MAX_MESSAGE_LENGTH, VdcConnection
 
+_DSUID_A = "A" * 34
+_DSUID_B = "B" * 34
+_DSUID_SEQ = [f"{i:034d}" for i in range(5)]
+
+# Every test here is async and shares the module's event loop.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 # ---------------------------------------------------------------------------
 # Helpers — in-memory streams for testing without real sockets
 # ---------------------------------------------------------------------------
 
 
+class _MockWriter:
+    """Minimal StreamWriter that feeds written data into a peer reader."""
+
+    def __init__(self, peer_reader, peername):
+        self._peer = peer_reader
+        self._closed = False
+        self._extra = {"peername": peername}
+
+    def write(self, data):
+        self._peer.feed_data(data)
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self._closed = True
+        self._peer.feed_eof()
+
+    async def wait_closed(self):
+        pass
+
+    def get_extra_info(self, key, default=None):
+        return self._extra.get(key, default)
+
+
 def _make_pair():
     """Create paired VdcConnections using in-memory streams.
 
@@ -24,55 +57,37 @@ def _make_pair():
     client_reader = asyncio.StreamReader()
     server_reader = asyncio.StreamReader()
 
-    # We use a simple mock for StreamWriter that feeds data into the
-    # peer's StreamReader.
-    class MockWriter:
-        def __init__(self, peer_reader):
-            self._peer = peer_reader
-            self._closed = False
-            self._extra = {}
-
-        def write(self, data):
-            self._peer.feed_data(data)
-
-        async def drain(self):
-            pass
-
-        def close(self):
-            self._closed = True
-            self._peer.feed_eof()
-
-        async def wait_closed(self):
-            pass
-
-        def get_extra_info(self, key, default=None):
-            return self._extra.get(key, default)
-
-    client_writer = MockWriter(server_reader)
-    client_writer._extra["peername"] = ("127.0.0.1", 12345)
-
-    server_writer = MockWriter(client_reader)
-    server_writer._extra["peername"] = ("127.0.0.1", 54321)
+    client_writer = _MockWriter(server_reader, ("127.0.0.1", 12345))
+    server_writer = _MockWriter(client_reader, ("127.0.0.1", 54321))
 
     client_conn = VdcConnection(client_reader, client_writer)  # type: ignore[arg-type]
     server_conn = VdcConnection(server_reader, server_writer)  # type: ignore[arg-type]
     return client_conn, server_conn
 
 
+@pytest_asyncio.fixture(loop_scope="module")
+async def conn_pair():
+    """A fresh (client, server) pair, built inside the module's loop.
+
+    The streams are purely in-memory and no test leaves tasks behind,
+    so all tests share one event loop instead of creating one each.
+    """
+    return _make_pair()
+
+
 # ---------------------------------------------------------------------------
 # Framing round-trip
 # ---------------------------------------------------------------------------
 
 class TestFramingRoundtrip:
 
-    @pytest.mark.asyncio
-    async def test_send_receive_hello_request(self):
-        client, server = _make_pair()
+    async def test_send_receive_hello_request(self, conn_pair):
+        client, server = conn_pair
 
         msg = pb.Message()
         msg.type = pb.VDSM_REQUEST_HELLO
         msg.message_id = 1
-        msg.vdsm_request_hello.dSUID = "A" * 34
+        msg.vdsm_request_hello.dSUID = _DSUID_A
         msg.vdsm_request_hello.api_version = 2
 
         await client.send(msg)
@@ -81,12 +96,11 @@ class TestFramingRoundtrip:
         assert received is not None
         assert received.type == pb.VDSM_REQUEST_HELLO
         assert received.message_id == 1
-        assert received.vdsm_request_hello.dSUID == "A" * 34
+        assert received.vdsm_request_hello.dSUID == _DSUID_A
         assert received.vdsm_request_hello.api_version == 2
 
-    @pytest.mark.asyncio
-    async def test_send_receive_generic_response(self):
-        client, server = _make_pair()
+    async def test_send_receive_generic_response(self, conn_pair):
+        client, server = conn_pair
 
         msg = pb.Message()
         msg.type = pb.GENERIC_RESPONSE
@@ -100,14 +114,13 @@ class TestFramingRoundtrip:
         assert received.type == pb.GENERIC_RESPONSE
         assert received.generic_response.code == pb.ERR_OK
 
-    @pytest.mark.asyncio
-    async def test_bidirectional_communication(self):
-        client, server = _make_pair()
+    async def test_bidirectional_communication(self, conn_pair):
+        client, server = conn_pair
 
         # Client → Server
         ping = pb.Message()
         ping.type = pb.VDSM_SEND_PING
-        ping.vdsm_send_ping.dSUID = "B" * 34
+        ping.vdsm_send_ping.dSUID = _DSUID_B
         await client.send(ping)
 
         # Server reads ...
@@ -118,28 +131,30 @@ class TestFramingRoundtrip:
         # Server → Client
         pong = pb.Message()
         pong.type = pb.VDC_SEND_PONG
-        pong.vdc_send_pong.dSUID = "B" * 34
+        pong.vdc_send_pong.dSUID = _DSUID_B
         await server.send(pong)
 
         received_pong = await client.receive()
         assert received_pong is not None
         assert received_pong.type == pb.VDC_SEND_PONG
 
-    @pytest.mark.asyncio
-    async def test_multiple_messages_in_sequence(self):
-        client, server = _make_pair()
+    async def test_multiple_messages_in_sequence(self, conn_pair):
+        client, server = conn_pair
 
-        for i in range(5):
-            msg = pb.Message()
+        # send() serializes immediately, so one message can be reused.
+        msg = pb.Message()
+        for i, dsuid in enumerate(_DSUID_SEQ):
+            msg.Clear()
             msg.type = pb.VDSM_SEND_PING
             msg.message_id = i
-            msg.vdsm_send_ping.dSUID = f"{i:034d}"
+            msg.vdsm_send_ping.dSUID = dsuid
             await client.send(msg)
 
-        for i in range(5):
+        for i, dsuid in enumerate(_DSUID_SEQ):
             received = await server.receive()
             assert received is not None
             assert received.message_id == i
+            assert received.vdsm_send_ping.dSUID == dsuid
 
 
 # ---------------------------------------------------------------------------
@@ -148,22 +163,19 @@ class TestFramingRoundtrip:
 
 class TestEdgeCases:
 
-    @pytest.mark.asyncio
-    async def test_close_marks_connection(self):
-        client, server = _make_pair()
+    async def test_close_marks_connection(self, conn_pair):
+        client, server = conn_pair
         assert not client.is_closed
         await client.close()
         assert client.is_closed
 
-    @pytest.mark.asyncio
-    async def test_double_close_is_safe(self):
-        client, _ = _make_pair()
+    async def test_double_close_is_safe(self, conn_pair):
+        client, _ = conn_pair
         await client.close()
         await client.close()  # should not raise
 
-    @pytest.mark.asyncio
-    async def test_send_after_close_raises(self):
-        client, _ = _make_pair()
+    async def test_send_after_close_raises(self, conn_pair):
+        client, _ = conn_pair
         await client.close()
 
         msg = pb.Message()
@@ -171,26 +183,23 @@ class TestEdgeCases:
         with pytest.raises(ConnectionError):
             await client.send(msg)
 
-    @pytest.mark.asyncio
-    async def test_receive_after_close_raises(self):
-        client, _ = _make_pair()
+    async def test_receive_after_close_raises(self, conn_pair):
+        client, _ = conn_pair
         await client.close()
 
         with pytest.raises(ConnectionError):
             await client.receive()
 
-    @pytest.mark.asyncio
-    async def test_eof_returns_none(self):
+    async def test_eof_returns_none(self, conn_pair):
         """When the remote end closes, receive returns None (via IncompleteReadError)."""
-        client, server = _make_pair()
+        client, server = conn_pair
         await client.close()  # sends EOF to server's reader
 
         with pytest.raises(asyncio.IncompleteReadError):
             await server.receive()
 
-    @pytest.mark.asyncio
-    async def test_oversized_message_rejected(self):
-        client, _ = _make_pair()
+    async def test_oversized_message_rejected(self, conn_pair):
+        client, _ = conn_pair
 
         # Create a message with a very large payload by setting a big
         # string field.  We can't easily hit 16384 with protobuf, so
@@ -198,10 +207,9 @@ class TestEdgeCases:
         # Instead, we'll directly feed an invalid header.
         pass  # covered by test_oversized_header below
 
-    @pytest.mark.asyncio
-    async def test_oversized_header_rejected(self):
+    async def test_oversized_header_rejected(self, conn_pair):
         """A received length header > MAX_MESSAGE_LENGTH should raise."""
-        _, server = _make_pair()
+        _, server = conn_pair
 
         # Feed an invalid header: length = MAX_MESSAGE_LENGTH + 1
         bad_length = MAX_MESSAGE_LENGTH + 1
@@ -219,15 +227,13 @@ class TestEdgeCases:
 
 class TestRepr:
 
-    @pytest.mark.asyncio
-    async def test_repr_shows_state(self):
-        client, _ = _make_pair()
+    async def test_repr_shows_state(self, conn_pair):
+        client, _ = conn_pair
         assert "open" in repr(client)
         await client.close()
         assert "closed" in repr(client)
 
-    @pytest.mark.asyncio
-    async def test_peername(self):
-        client, server = _make_pair()
+    async def test_peername(self, conn_pair):
+        client, server = conn_pair
         assert "12345" in client.peername
         assert "54321" in server.peername
@@ -434,6 +434,16 @@ class TestRepr:
         d = DsUid.random()
         assert len(str(d)) == 34
 
+    def test_str_cached(self):
+        d = DsUid.from_string("198C033E330755E78015F97AD093DD1C00")
+        assert str(d) is str(d)
+
+    def test_derived_str_not_shared(self):
+        parent = DsUid.from_string("198C033E330755E78015F97AD093DD1C00")
+        str(parent)
+        child = parent.derive_subdevice(2)
+        assert str(child) == "198C033E330755E78015F97AD093DD1C02"
+
     def test_repr(self):
         d = DsUid.from_string("198C033E330755E78015F97AD093DD1C00")
         assert repr(d) == "DsUid('198C033E330755E78015F97AD093DD1C00')"
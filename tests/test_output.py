@@ -51,12 +51,13 @@ def _make_vdc(host: VdcHost, **kwargs: Any) -> Vdc:
     return Vdc(**defaults)
 
 
-def _base_dsuid() -> DsUid:
-    return DsUid.from_name_in_space("output-test-device", DsUidNamespace.VDC)
+_BASE_DSUID = DsUid.from_name_in_space(
+    "output-test-device", DsUidNamespace.VDC
+)
 
 
 def _make_device(vdc: Vdc, dsuid: Optional[DsUid] = None) -> Device:
-    return Device(vdc=vdc, dsuid=dsuid or _base_dsuid())
+    return Device(vdc=vdc, dsuid=dsuid or _BASE_DSUID)
 
 
 def _make_vdsd(device: Device, **kwargs: Any) -> Vdsd:
@@ -102,6 +103,34 @@ def _make_stack(**kwargs: Any):
     return host, vdc, device, vdsd
 
 
+@pytest.fixture(scope="module")
+def shared_vdc() -> Vdc:
+    """A host and vDC wired once and shared by the module's stacks.
+
+    The host has nothing to persist, so its auto-save is a no-op:
+    settings setters stop at the host instead of scheduling saves.
+    """
+    host = _make_host()
+    host._schedule_auto_save = lambda: None
+    vdc = _make_vdc(host)
+    host.add_vdc(vdc)
+    return vdc
+
+
+@pytest.fixture
+def stack(shared_vdc: Vdc):
+    """A fresh device → vdSD on the shared vDC, removed after the test.
+
+    Yields (host, vdc, device, vdsd) like :func:`_make_stack`.
+    """
+    device = _make_device(shared_vdc)
+    vdsd = _make_vdsd(device)
+    device.add_vdsd(vdsd)
+    shared_vdc.add_device(device)
+    yield shared_vdc.host, shared_vdc, device, vdsd
+    shared_vdc.remove_device(device.dsuid)
+
+
 # ===========================================================================
 # Construction and defaults
 # ===========================================================================
@@ -110,8 +139,8 @@ def _make_stack(**kwargs: Any):
 class TestOutputConstruction:
     """Tests for Output creation and default values."""
 
-    def test_default_construction(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_default_construction(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
 
         assert out.function == OutputFunction.DIMMER
@@ -123,8 +152,8 @@ class TestOutputConstruction:
         assert out.active_cooling_mode is None
         assert out.vdsd is vdsd
 
-    def test_default_settings(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_default_settings(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
 
         assert out.mode == OutputMode.DEFAULT
@@ -142,15 +171,15 @@ class TestOutputConstruction:
         assert out.heating_system_capability is None
         assert out.heating_system_type is None
 
-    def test_default_state(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_default_state(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
 
         assert out.local_priority is False
         assert out.error == OutputError.OK
 
-    def test_custom_construction(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_custom_construction(self, stack):
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.FULL_COLOR_DIMMER,
@@ -198,8 +227,8 @@ class TestOutputConstruction:
         assert out.heating_system_capability == HeatingSystemCapability.HEATING_AND_COOLING
         assert out.heating_system_type == HeatingSystemType.FLOOR_HEATING
 
-    def test_construction_with_int_enums(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_construction_with_int_enums(self, stack):
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=1,  # DIMMER
@@ -219,23 +248,35 @@ class TestOutputConstruction:
         assert out.heating_system_capability == HeatingSystemCapability.HEATING_ONLY
         assert out.heating_system_type == HeatingSystemType.WALL_HEATING
 
-    def test_all_output_functions(self):
-        host, vdc, device, vdsd = _make_stack()
-        for func in OutputFunction:
-            out = Output(vdsd=vdsd, function=func, name="test", default_group=1, active_group=1, groups={1})
-            assert out.function == func
+    @pytest.mark.parametrize(
+        "func", list(OutputFunction), ids=lambda m: m.name
+    )
+    def test_all_output_functions(self, stack, func):
+        out = Output(
+            vdsd=stack[3], function=func, name="test",
+            default_group=1, active_group=1, groups={1},
+        )
+        assert out.function == func
 
-    def test_all_output_modes(self):
-        host, vdc, device, vdsd = _make_stack()
-        for mode in OutputMode:
-            out = Output(vdsd=vdsd, mode=mode, name="test", default_group=1, active_group=1, groups={1})
-            assert out.mode == mode
+    @pytest.mark.parametrize(
+        "mode", list(OutputMode), ids=lambda m: m.name
+    )
+    def test_all_output_modes(self, stack, mode):
+        out = Output(
+            vdsd=stack[3], mode=mode, name="test",
+            default_group=1, active_group=1, groups={1},
+        )
+        assert out.mode == mode
 
-    def test_all_output_usages(self):
-        host, vdc, device, vdsd = _make_stack()
-        for usage in OutputUsage:
-            out = Output(vdsd=vdsd, output_usage=usage, name="test", default_group=1, active_group=1, groups={1})
-            assert out.output_usage == usage
+    @pytest.mark.parametrize(
+        "usage", list(OutputUsage), ids=lambda m: m.name
+    )
+    def test_all_output_usages(self, stack, usage):
+        out = Output(
+            vdsd=stack[3], output_usage=usage, name="test",
+            default_group=1, active_group=1, groups={1},
+        )
+        assert out.output_usage == usage
 
 
 # ===========================================================================
@@ -246,8 +287,8 @@ class TestOutputConstruction:
 class TestOutputRepr:
     """Test __repr__."""
 
-    def test_repr(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_repr(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         r = repr(out)
         assert "Output(" in r
@@ -263,82 +304,82 @@ class TestOutputRepr:
 class TestOutputSettingsMutators:
     """Test writable settings via property setters."""
 
-    def test_mode_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_mode_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.mode = OutputMode.BINARY
         assert out.mode == OutputMode.BINARY
 
-    def test_mode_setter_int(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_mode_setter_int(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.mode = 2
         assert out.mode == OutputMode.GRADUAL
 
-    def test_active_group_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_active_group_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.active_group = 5
         assert out.active_group == 5
 
-    def test_groups_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_groups_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.groups = {1, 3, 5}
         assert out.groups == {1, 3, 5}
 
-    def test_groups_returns_copy(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_groups_returns_copy(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups={1, 2})
         g = out.groups
         g.add(99)
         assert 99 not in out.groups
 
-    def test_add_group(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_add_group(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups=set())
         out.add_group(7)
         out.add_group(12)
         assert out.groups == {7, 12}
 
-    def test_remove_group(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_remove_group(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups={1, 2, 3})
         out.remove_group(2)
         assert out.groups == {1, 3}
 
-    def test_remove_group_absent(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_remove_group_absent(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups={1})
         out.remove_group(99)
         assert out.groups == {1}
 
-    def test_push_changes_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_push_changes_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.push_changes = True
         assert out.push_changes is True
 
-    def test_on_threshold_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_on_threshold_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.on_threshold = 33.5
         assert out.on_threshold == 33.5
 
-    def test_on_threshold_reset(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_on_threshold_reset(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, on_threshold=50.0)
         out.on_threshold = None
         assert out.on_threshold is None
 
-    def test_min_brightness_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_min_brightness_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.min_brightness = 5.0
         assert out.min_brightness == 5.0
 
-    def test_dim_time_setters(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_dim_time_setters(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.dim_time_up = 100
         out.dim_time_down = 80
@@ -353,26 +394,26 @@ class TestOutputSettingsMutators:
         assert out.dim_time_up_alt2 == 200
         assert out.dim_time_down_alt2 == 180
 
-    def test_dim_time_reset(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_dim_time_reset(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, dim_time_up=100)
         out.dim_time_up = None
         assert out.dim_time_up is None
 
-    def test_heating_system_capability_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_heating_system_capability_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.heating_system_capability = HeatingSystemCapability.COOLING_ONLY
         assert out.heating_system_capability == HeatingSystemCapability.COOLING_ONLY
 
-    def test_heating_system_capability_setter_int(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_heating_system_capability_setter_int(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.heating_system_capability = 3
         assert out.heating_system_capability == HeatingSystemCapability.HEATING_AND_COOLING
 
-    def test_heating_system_capability_reset(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_heating_system_capability_reset(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(
             vdsd,
             heating_system_capability=HeatingSystemCapability.HEATING_ONLY,
@@ -380,20 +421,20 @@ class TestOutputSettingsMutators:
         out.heating_system_capability = None
         assert out.heating_system_capability is None
 
-    def test_heating_system_type_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_heating_system_type_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.heating_system_type = HeatingSystemType.FLOOR_HEATING
         assert out.heating_system_type == HeatingSystemType.FLOOR_HEATING
 
-    def test_heating_system_type_setter_int(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_heating_system_type_setter_int(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.heating_system_type = 4
         assert out.heating_system_type == HeatingSystemType.CONVECTOR_PASSIVE
 
-    def test_heating_system_type_reset(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_heating_system_type_reset(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(
             vdsd,
             heating_system_type=HeatingSystemType.RADIATOR,
@@ -401,8 +442,8 @@ class TestOutputSettingsMutators:
         out.heating_system_type = None
         assert out.heating_system_type is None
 
-    def test_name_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_name_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.name = "New Name"
         assert out.name == "New Name"
@@ -416,26 +457,26 @@ class TestOutputSettingsMutators:
 class TestOutputStateMutators:
     """Test volatile state property setters."""
 
-    def test_local_priority_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_local_priority_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.local_priority = True
         assert out.local_priority is True
 
-    def test_error_setter(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_error_setter(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.error = OutputError.LAMP_BROKEN
         assert out.error == OutputError.LAMP_BROKEN
 
-    def test_error_setter_int(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_error_setter_int(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.error = 3
         assert out.error == OutputError.OVERLOAD
 
-    def test_all_error_values(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_all_error_values(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         for err in OutputError:
             out.error = err
@@ -450,8 +491,8 @@ class TestOutputStateMutators:
 class TestOutputDescriptionProperties:
     """Test get_description_properties()."""
 
-    def test_minimal(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_minimal(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         desc = out.get_description_properties()
 
@@ -463,8 +504,8 @@ class TestOutputDescriptionProperties:
         assert "maxPower" not in desc
         assert "activeCoolingMode" not in desc
 
-    def test_with_optional_fields(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_with_optional_fields(self, stack):
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.POSITIONAL,
@@ -492,8 +533,8 @@ class TestOutputDescriptionProperties:
 class TestOutputSettingsProperties:
     """Test get_settings_properties()."""
 
-    def test_minimal(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_minimal(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         settings = out.get_settings_properties()
 
@@ -504,16 +545,16 @@ class TestOutputSettingsProperties:
         assert "onThreshold" not in settings
         assert "minBrightness" not in settings
 
-    def test_with_groups(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_with_groups(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups={1, 3, 5})
         settings = out.get_settings_properties()
 
         assert "groups" in settings
         assert settings["groups"] == {"1": True, "3": True, "5": True}
 
-    def test_with_all_optional_fields(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_with_all_optional_fields(self, stack):
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.DIMMER,
@@ -563,16 +604,16 @@ class TestOutputSettingsProperties:
 class TestOutputStateProperties:
     """Test get_state_properties()."""
 
-    def test_defaults(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_defaults(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         state = out.get_state_properties()
 
         assert state["localPriority"] is False
         assert state["error"] == int(OutputError.OK)
 
-    def test_after_mutation(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_after_mutation(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.local_priority = True
         out.error = OutputError.SHORT_CIRCUIT
@@ -590,62 +631,62 @@ class TestOutputStateProperties:
 class TestOutputApplySettings:
     """Test apply_settings() from vdSM setProperty."""
 
-    def test_apply_mode(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_mode(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({"mode": 1})
         assert out.mode == OutputMode.BINARY
 
-    def test_apply_active_group(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_active_group(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({"activeGroup": 5})
         assert out.active_group == 5
 
-    def test_apply_push_changes(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_push_changes(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({"pushChanges": True})
         assert out.push_changes is True
 
-    def test_apply_groups_add(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_groups_add(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({"groups": {"1": True, "3": True, "5": True}})
         assert out.groups == {1, 3, 5}
 
-    def test_apply_groups_remove(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_groups_remove(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups={1, 2, 3})
         out.apply_settings({"groups": {"2": False}})
         assert out.groups == {1, 3}
 
-    def test_apply_groups_mixed(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_groups_mixed(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups={1, 2})
         out.apply_settings({"groups": {"2": False, "5": True}})
         assert out.groups == {1, 5}
 
-    def test_apply_on_threshold(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_on_threshold(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({"onThreshold": 42.0})
         assert out.on_threshold == 42.0
 
-    def test_apply_on_threshold_none(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_on_threshold_none(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, on_threshold=50.0)
         out.apply_settings({"onThreshold": None})
         assert out.on_threshold is None
 
-    def test_apply_min_brightness(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_min_brightness(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({"minBrightness": 8.0})
         assert out.min_brightness == 8.0
 
-    def test_apply_dim_times(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_dim_times(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({
             "dimTimeUp": 100,
@@ -662,20 +703,20 @@ class TestOutputApplySettings:
         assert out.dim_time_up_alt2 == 200
         assert out.dim_time_down_alt2 == 180
 
-    def test_apply_dim_time_reset(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_dim_time_reset(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, dim_time_up=100)
         out.apply_settings({"dimTimeUp": None})
         assert out.dim_time_up is None
 
-    def test_apply_heating_system_capability(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_heating_system_capability(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({"heatingSystemCapability": 2})
         assert out.heating_system_capability == HeatingSystemCapability.COOLING_ONLY
 
-    def test_apply_heating_system_capability_reset(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_heating_system_capability_reset(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(
             vdsd,
             heating_system_capability=HeatingSystemCapability.HEATING_ONLY,
@@ -683,14 +724,14 @@ class TestOutputApplySettings:
         out.apply_settings({"heatingSystemCapability": None})
         assert out.heating_system_capability is None
 
-    def test_apply_heating_system_type(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_heating_system_type(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({"heatingSystemType": 5})
         assert out.heating_system_type == HeatingSystemType.CONVECTOR_ACTIVE
 
-    def test_apply_heating_system_type_reset(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_heating_system_type_reset(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(
             vdsd,
             heating_system_type=HeatingSystemType.RADIATOR,
@@ -698,20 +739,20 @@ class TestOutputApplySettings:
         out.apply_settings({"heatingSystemType": None})
         assert out.heating_system_type is None
 
-    def test_apply_unknown_keys_ignored(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_unknown_keys_ignored(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({"unknownKey": 42, "mode": 1})
         assert out.mode == OutputMode.BINARY
 
-    def test_apply_empty_dict(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_empty_dict(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({})
         assert out.mode == OutputMode.DEFAULT
 
-    def test_apply_multiple_settings_at_once(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_multiple_settings_at_once(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_settings({
             "mode": 2,
@@ -735,22 +776,22 @@ class TestOutputApplySettings:
 class TestOutputApplyState:
     """Test apply_state() from vdSM setProperty."""
 
-    def test_apply_local_priority(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_local_priority(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_state({"localPriority": True})
         assert out.local_priority is True
 
-    def test_apply_state_ignores_error(self):
+    def test_apply_state_ignores_error(self, stack):
         """error is read-only from the vdSM perspective."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_state({"error": 3})
         # error should NOT be changed by apply_state
         assert out.error == OutputError.OK
 
-    def test_apply_state_empty(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_state_empty(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.apply_state({})
         assert out.local_priority is False
@@ -764,8 +805,8 @@ class TestOutputApplyState:
 class TestOutputPropertyTree:
     """Test get_property_tree() and _apply_state() round-trip."""
 
-    def test_minimal_tree(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_minimal_tree(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         tree = out.get_property_tree()
 
@@ -781,8 +822,8 @@ class TestOutputPropertyTree:
         assert "activeCoolingMode" not in tree
         assert tree["groups"] == [1]
 
-    def test_full_tree(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_full_tree(self, stack):
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.FULL_COLOR_DIMMER,
@@ -835,9 +876,9 @@ class TestOutputPropertyTree:
             HeatingSystemType.FLOOR_HEATING
         )
 
-    def test_state_not_in_tree(self):
+    def test_state_not_in_tree(self, stack):
         """Volatile state must NOT appear in the property tree."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         out.local_priority = True
         out.error = OutputError.SHORT_CIRCUIT
@@ -846,9 +887,9 @@ class TestOutputPropertyTree:
         assert "localPriority" not in tree
         assert "error" not in tree
 
-    def test_round_trip(self):
+    def test_round_trip(self, stack):
         """Serialize → _apply_state → verify all properties match."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         original = Output(
             vdsd=vdsd,
             function=OutputFunction.DIMMER_COLOR_TEMP,
@@ -901,23 +942,23 @@ class TestOutputPropertyTree:
         assert restored.heating_system_capability == original.heating_system_capability
         assert restored.heating_system_type == original.heating_system_type
 
-    def test_groups_sorted_in_persistence(self):
+    def test_groups_sorted_in_persistence(self, stack):
         """Verify groups are stored as sorted list for determinism."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups={30, 5, 15, 1})
         tree = out.get_property_tree()
         assert tree["groups"] == [1, 5, 15, 30]
 
-    def test_apply_state_groups_from_dict(self):
+    def test_apply_state_groups_from_dict(self, stack):
         """_apply_state also handles groups in dict format."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = Output(vdsd=vdsd, name="tmp", default_group=0, active_group=0, groups=set())
         out._apply_state({"groups": {"1": True, "5": True, "10": False}})
         assert out.groups == {1, 5}
 
-    def test_apply_state_partial(self):
+    def test_apply_state_partial(self, stack):
         """_apply_state with a subset of keys only modifies those."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.DIMMER,
@@ -941,22 +982,22 @@ class TestOutputPropertyTree:
 class TestVdsdOutputIntegration:
     """Test Output integration with Vdsd."""
 
-    def test_set_output(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_set_output(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         vdsd.set_output(out)
         assert vdsd.output is out
 
-    def test_set_output_replaces(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_set_output_replaces(self, stack):
+        host, vdc, device, vdsd = stack
         out1 = _make_output(vdsd, name="First")
         out2 = _make_output(vdsd, name="Second")
         vdsd.set_output(out1)
         vdsd.set_output(out2)
         assert vdsd.output is out2
 
-    def test_set_output_wrong_vdsd(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_set_output_wrong_vdsd(self, stack):
+        host, vdc, device, vdsd = stack
         other_device = Device(
             vdc=vdc,
             dsuid=DsUid.from_name_in_space("other", DsUidNamespace.VDC),
@@ -968,24 +1009,24 @@ class TestVdsdOutputIntegration:
         with pytest.raises(ValueError, match="different vdSD"):
             vdsd.set_output(out)
 
-    def test_remove_output(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_remove_output(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         vdsd.set_output(out)
         removed = vdsd.remove_output()
         assert removed is out
         assert vdsd.output is None
 
-    def test_remove_output_none(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_remove_output_none(self, stack):
+        host, vdc, device, vdsd = stack
         assert vdsd.remove_output() is None
 
-    def test_output_none_by_default(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_output_none_by_default(self, stack):
+        host, vdc, device, vdsd = stack
         assert vdsd.output is None
 
-    def test_output_in_get_properties(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_output_in_get_properties(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         vdsd.set_output(out)
         props = vdsd.get_properties()
@@ -995,16 +1036,16 @@ class TestVdsdOutputIntegration:
         assert "outputState" in props
         assert props["outputDescription"]["function"] == int(OutputFunction.DIMMER)
 
-    def test_no_output_in_get_properties(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_no_output_in_get_properties(self, stack):
+        host, vdc, device, vdsd = stack
         props = vdsd.get_properties()
 
         assert "outputDescription" not in props
         assert "outputSettings" not in props
         assert "outputState" not in props
 
-    def test_output_in_property_tree(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_output_in_property_tree(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         vdsd.set_output(out)
         tree = vdsd.get_property_tree()
@@ -1013,14 +1054,14 @@ class TestVdsdOutputIntegration:
         assert tree["output"]["function"] == int(OutputFunction.DIMMER)
         assert tree["output"]["name"] == "Test Dimmer"
 
-    def test_no_output_in_property_tree(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_no_output_in_property_tree(self, stack):
+        host, vdc, device, vdsd = stack
         tree = vdsd.get_property_tree()
         assert "output" not in tree
 
-    def test_output_restore_from_state(self):
+    def test_output_restore_from_state(self, stack):
         """Persist via property tree → restore via _apply_state."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.POSITIONAL,
@@ -1045,9 +1086,9 @@ class TestVdsdOutputIntegration:
         assert vdsd2.output.active_group == 9
         assert vdsd2.output.groups == {9}
 
-    def test_output_restore_merges_with_existing(self):
+    def test_output_restore_merges_with_existing(self, stack):
         """If output already exists, _apply_state updates it."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         existing = Output(vdsd=vdsd, name="Existing", default_group=1, active_group=1, groups={1})
         vdsd.set_output(existing)
 
@@ -1072,24 +1113,24 @@ class TestVdsdOutputIntegration:
 class TestOutputSessionManagement:
     """Test start_session / stop_session."""
 
-    def test_start_session(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_start_session(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         session = _make_mock_session()
         out.start_session(session)
         assert out._session is session
 
-    def test_stop_session(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_stop_session(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         session = _make_mock_session()
         out.start_session(session)
         out.stop_session()
         assert out._session is None
 
-    def test_set_output_while_announced(self):
+    def test_set_output_while_announced(self, stack):
         """Setting output on an already-announced vdSD starts session."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         session = _make_mock_session()
         # Simulate announced state.
         vdsd._announced = True
@@ -1099,8 +1140,8 @@ class TestOutputSessionManagement:
         vdsd.set_output(out)
         assert out._session is session
 
-    def test_remove_output_stops_session(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_remove_output_stops_session(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         session = _make_mock_session()
         out.start_session(session)
@@ -1117,8 +1158,8 @@ class TestOutputSessionManagement:
 class TestVdcHostOutputSetProperty:
     """Test VdcHost._apply_vdsd_set_property for outputSettings/outputState."""
 
-    def test_apply_output_settings(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_output_settings(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         vdsd.set_output(out)
 
@@ -1129,8 +1170,8 @@ class TestVdcHostOutputSetProperty:
         assert out.mode == OutputMode.GRADUAL
         assert out.push_changes is True
 
-    def test_apply_output_state(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_apply_output_state(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         vdsd.set_output(out)
 
@@ -1140,23 +1181,23 @@ class TestVdcHostOutputSetProperty:
 
         assert out.local_priority is True
 
-    def test_apply_output_settings_no_output(self):
+    def test_apply_output_settings_no_output(self, stack):
         """Settings for non-existing output should not crash."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         host._apply_vdsd_set_property(vdsd, {
             "outputSettings": {"mode": 1},
         })
 
-    def test_apply_output_state_no_output(self):
+    def test_apply_output_state_no_output(self, stack):
         """State for non-existing output should not crash."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         host._apply_vdsd_set_property(vdsd, {
             "outputState": {"localPriority": True},
         })
 
-    def test_apply_output_settings_not_dict(self):
+    def test_apply_output_settings_not_dict(self, stack):
         """Non-dict outputSettings should be silently ignored."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         vdsd.set_output(out)
         host._apply_vdsd_set_property(vdsd, {
@@ -1164,9 +1205,9 @@ class TestVdcHostOutputSetProperty:
         })
         assert out.mode == OutputMode.DEFAULT
 
-    def test_apply_output_state_not_dict(self):
+    def test_apply_output_state_not_dict(self, stack):
         """Non-dict outputState should be silently ignored."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         vdsd.set_output(out)
         host._apply_vdsd_set_property(vdsd, {
@@ -1174,9 +1215,9 @@ class TestVdcHostOutputSetProperty:
         })
         assert out.local_priority is False
 
-    def test_mixed_set_property(self):
+    def test_mixed_set_property(self, stack):
         """Verify output + other settings applied together."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         vdsd.set_output(out)
 
@@ -1201,93 +1242,95 @@ class TestVdcHostOutputSetProperty:
 class TestOutputAutoSave:
     """Verify that settings changes trigger auto-save via the Device chain."""
 
-    def _setup(self):
-        host, vdc, device, vdsd = _make_stack()
+    @pytest.fixture
+    def wired_output(self, stack):
+        """The stack plus a dimmer output on its vdSD."""
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd)
         vdsd.set_output(out)
         return host, vdc, device, vdsd, out
 
-    def test_mode_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_mode_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.mode = OutputMode.BINARY
         device._schedule_auto_save.assert_called()
 
-    def test_active_group_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_active_group_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.active_group = 5
         device._schedule_auto_save.assert_called()
 
-    def test_groups_setter_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_groups_setter_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.groups = {1, 2, 3}
         device._schedule_auto_save.assert_called()
 
-    def test_add_group_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_add_group_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.add_group(7)
         device._schedule_auto_save.assert_called()
 
-    def test_remove_group_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_remove_group_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.remove_group(7)
         device._schedule_auto_save.assert_called()
 
-    def test_push_changes_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_push_changes_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.push_changes = True
         device._schedule_auto_save.assert_called()
 
-    def test_name_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_name_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.name = "New Name"
         device._schedule_auto_save.assert_called()
 
-    def test_on_threshold_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_on_threshold_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.on_threshold = 50.0
         device._schedule_auto_save.assert_called()
 
-    def test_min_brightness_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_min_brightness_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.min_brightness = 5.0
         device._schedule_auto_save.assert_called()
 
-    def test_dim_time_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_dim_time_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.dim_time_up = 100
         device._schedule_auto_save.assert_called()
 
-    def test_heating_capability_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_heating_capability_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.heating_system_capability = HeatingSystemCapability.HEATING_ONLY
         device._schedule_auto_save.assert_called()
 
-    def test_heating_type_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_heating_type_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.heating_system_type = HeatingSystemType.RADIATOR
         device._schedule_auto_save.assert_called()
 
-    def test_apply_settings_triggers_auto_save(self):
-        host, vdc, device, vdsd, out = self._setup()
+    def test_apply_settings_triggers_auto_save(self, wired_output):
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.apply_settings({"mode": 2})
         device._schedule_auto_save.assert_called()
 
-    def test_state_does_not_trigger_auto_save(self):
+    def test_state_does_not_trigger_auto_save(self, wired_output):
         """Volatile state changes must NOT trigger auto-save."""
-        host, vdc, device, vdsd, out = self._setup()
+        host, vdc, device, vdsd, out = wired_output
         device._schedule_auto_save = MagicMock()
         out.local_priority = True
         out.error = OutputError.OVERLOAD
@@ -1319,34 +1362,34 @@ class TestOutputExport:
 class TestOutputEdgeCases:
     """Edge cases and boundary conditions."""
 
-    def test_empty_groups_returns_empty_dict(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_empty_groups_returns_empty_dict(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups=set())
         settings = out.get_settings_properties()
         assert settings["groups"] == {}
 
-    def test_empty_groups_not_in_tree(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_empty_groups_not_in_tree(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups=set())
         tree = out.get_property_tree()
         assert "groups" not in tree
 
-    def test_groups_sorted_in_tree(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_groups_sorted_in_tree(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups={10, 3, 7, 1})
         tree = out.get_property_tree()
         assert tree["groups"] == [1, 3, 7, 10]
 
-    def test_groups_sorted_in_settings(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_groups_sorted_in_settings(self, stack):
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, groups={10, 3, 7, 1})
         settings = out.get_settings_properties()
         keys = list(settings["groups"].keys())
         assert keys == ["1", "3", "7", "10"]
 
-    def test_on_off_output(self):
+    def test_on_off_output(self, stack):
         """Basic on/off output (relay, socket)."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.ON_OFF,
@@ -1359,9 +1402,9 @@ class TestOutputEdgeCases:
         assert out.function == OutputFunction.ON_OFF
         assert out.mode == OutputMode.BINARY
 
-    def test_bipolar_output(self):
+    def test_bipolar_output(self, stack):
         """Bipolar output (e.g. ventilation direction)."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.BIPOLAR,
@@ -1372,8 +1415,8 @@ class TestOutputEdgeCases:
         )
         assert out.function == OutputFunction.BIPOLAR
 
-    def test_internally_controlled_output(self):
-        host, vdc, device, vdsd = _make_stack()
+    def test_internally_controlled_output(self, stack):
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.INTERNALLY_CONTROLLED,
@@ -1384,9 +1427,9 @@ class TestOutputEdgeCases:
         )
         assert out.function == OutputFunction.INTERNALLY_CONTROLLED
 
-    def test_climate_output(self):
+    def test_climate_output(self, stack):
         """Climate control output with heating settings."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.ON_OFF,
@@ -1409,9 +1452,9 @@ class TestOutputEdgeCases:
             HeatingSystemType.CONVECTOR_PASSIVE
         )
 
-    def test_full_round_trip_through_vdsd(self):
+    def test_full_round_trip_through_vdsd(self, stack):
         """Complete persistence round-trip through the vdSD."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = Output(
             vdsd=vdsd,
             function=OutputFunction.DIMMER,
@@ -1459,10 +1502,10 @@ class TestOutputEdgeCases:
 class TestOutputScenes:
     """Tests for scene table management on Output."""
 
-    def test_default_scene_table_contains_standard_entries(self):
+    def test_default_scene_table_contains_standard_entries(self, stack):
         """After construction a dimmer output should have default
         scenes for all value-bearing SceneNumber entries."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1488,9 +1531,9 @@ class TestOutputScenes:
                         f"Channel {idx} missing in scene {sn.name}"
                     )
 
-    def test_off_scene_defaults_to_min(self):
+    def test_off_scene_defaults_to_min(self, stack):
         """Off scenes should default primary channel to min_value."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1504,9 +1547,9 @@ class TestOutputScenes:
         assert ch_vals[0]["value"] == 0.0
         assert ch_vals[0]["dontCare"] is False
 
-    def test_on_scene_defaults_to_max(self):
+    def test_on_scene_defaults_to_max(self, stack):
         """On scenes should default primary channel to max_value."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1519,9 +1562,9 @@ class TestOutputScenes:
         assert ch_vals[0]["value"] == 100.0  # brightness max
         assert ch_vals[0]["dontCare"] is False
 
-    def test_non_standard_scene_defaults_to_dont_care(self):
+    def test_non_standard_scene_defaults_to_dont_care(self, stack):
         """Non-standard scenes default to global dontCare=True."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1532,9 +1575,9 @@ class TestOutputScenes:
         assert entry is not None
         assert entry["dontCare"] is True
 
-    def test_call_scene_applies_values(self):
+    def test_call_scene_applies_values(self, stack):
         """call_scene should apply stored channel values."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1547,9 +1590,9 @@ class TestOutputScenes:
         out.call_scene(int(SceneNumber.PRESET_1))
         assert ch.value == 100.0
 
-    def test_call_scene_respects_global_dont_care(self):
+    def test_call_scene_respects_global_dont_care(self, stack):
         """If scene has global dontCare, call_scene does nothing."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1563,9 +1606,9 @@ class TestOutputScenes:
         out.call_scene(int(SceneNumber.PRESET_2))
         assert ch.value == 42.0  # unchanged
 
-    def test_call_scene_blocked_by_local_priority(self):
+    def test_call_scene_blocked_by_local_priority(self, stack):
         """Local priority blocks scene unless force or ignoreLP."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1584,9 +1627,9 @@ class TestOutputScenes:
         out.call_scene(int(SceneNumber.PRESET_0), force=True)
         assert ch.value == 0.0
 
-    def test_call_scene_ignore_local_priority_flag(self):
+    def test_call_scene_ignore_local_priority_flag(self, stack):
         """Alarm scenes with ignoreLocalPriority override LP."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1610,9 +1653,9 @@ class TestOutputScenes:
         out.call_scene(int(SceneNumber.PANIC))
         assert ch.value == 0.0  # applied despite LP
 
-    def test_call_scene_respects_channel_dont_care(self):
+    def test_call_scene_respects_channel_dont_care(self, stack):
         """Per-channel dontCare should skip that channel."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(
             vdsd, function=OutputFunction.DIMMER_COLOR_TEMP
         )
@@ -1636,9 +1679,9 @@ class TestOutputScenes:
         assert brightness.value == 100.0  # applied
         assert colortemp.value == 500.0  # unchanged (dontCare)
 
-    def test_save_scene_captures_current_values(self):
+    def test_save_scene_captures_current_values(self, stack):
         """save_scene should store current channel values."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1654,9 +1697,9 @@ class TestOutputScenes:
         assert entry["channels"][0]["value"] == 73.0
         assert entry["channels"][0]["dontCare"] is False
 
-    def test_undo_scene_restores_previous_values(self):
+    def test_undo_scene_restores_previous_values(self, stack):
         """undo_scene should restore the snapshot from before call."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1672,9 +1715,9 @@ class TestOutputScenes:
         out.undo_scene(int(SceneNumber.PRESET_0))
         assert ch.value == 42.0
 
-    def test_undo_scene_ignores_mismatch(self):
+    def test_undo_scene_ignores_mismatch(self, stack):
         """undo_scene with non-matching scene_nr does nothing."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1691,10 +1734,10 @@ class TestOutputScenes:
         out.undo_scene(int(SceneNumber.PRESET_1))
         assert ch.value == 0.0  # unchanged
 
-    def test_scenes_persist_and_restore(self):
+    def test_scenes_persist_and_restore(self, stack):
         """Scene data should survive a get_property_tree / _apply_state
         round-trip."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1718,9 +1761,9 @@ class TestOutputScenes:
         assert entry["dontCare"] is False
         assert entry["channels"][0]["value"] == 77.0
 
-    def test_scenes_exposed_in_vdsd_properties(self):
+    def test_scenes_exposed_in_vdsd_properties(self, stack):
         """vdsd.get_properties() should include scenes."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1737,9 +1780,9 @@ class TestOutputScenes:
         assert "effect" in scene_0
         assert "channels" in scene_0
 
-    def test_apply_scenes_from_vdsm(self):
+    def test_apply_scenes_from_vdsm(self, stack):
         """apply_scenes should update scene values from API format."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -1768,9 +1811,9 @@ class TestOutputScenes:
         assert entry["effect"] == 2
         assert entry["channels"][0]["value"] == 66.0
 
-    def test_add_channel_updates_scenes(self):
+    def test_add_channel_updates_scenes(self, stack):
         """Adding a channel should add entries in all existing scenes."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(
             vdsd, function=OutputFunction.POSITIONAL
         )
@@ -1796,9 +1839,9 @@ class TestVdcHostSceneDispatch:
     """Tests for VdcHost scene notification dispatch."""
 
     @pytest.mark.asyncio
-    async def test_dispatch_call_scene(self):
+    async def test_dispatch_call_scene(self, stack):
         """callScene notification routes to output.call_scene."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -1820,9 +1863,9 @@ class TestVdcHostSceneDispatch:
         assert ch.value == 0.0
 
     @pytest.mark.asyncio
-    async def test_dispatch_save_scene(self):
+    async def test_dispatch_save_scene(self, stack):
         """saveScene notification routes to output.save_scene."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -1845,9 +1888,9 @@ class TestVdcHostSceneDispatch:
         assert entry["channels"][0]["value"] == 88.0
 
     @pytest.mark.asyncio
-    async def test_dispatch_undo_scene(self):
+    async def test_dispatch_undo_scene(self, stack):
         """undoScene notification routes to output.undo_scene."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -1873,9 +1916,9 @@ class TestVdcHostSceneDispatch:
         assert ch.value == 42.0
 
     @pytest.mark.asyncio
-    async def test_dispatch_set_local_priority(self):
+    async def test_dispatch_set_local_priority(self, stack):
         """setLocalPriority sets LP when scene is not dontCare."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -1895,9 +1938,9 @@ class TestVdcHostSceneDispatch:
         assert out.local_priority is True
 
     @pytest.mark.asyncio
-    async def test_dispatch_set_local_priority_skips_dontcare(self):
+    async def test_dispatch_set_local_priority_skips_dontcare(self, stack):
         """setLocalPriority does NOT set LP when scene IS dontCare."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -1920,9 +1963,9 @@ class TestVdcHostSceneDispatch:
         assert out.local_priority is False
 
     @pytest.mark.asyncio
-    async def test_dispatch_call_min_scene(self):
+    async def test_dispatch_call_min_scene(self, stack):
         """callMinScene sets min-on when device is off."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -1947,9 +1990,9 @@ class TestVdcHostSceneDispatch:
         assert ch.value > 0.0
 
     @pytest.mark.asyncio
-    async def test_set_property_scenes(self):
+    async def test_set_property_scenes(self, stack):
         """setProperty with scenes key routes to output.apply_scenes."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -1994,32 +2037,32 @@ class TestVdcHostSceneDispatch:
 class TestDimChannel:
     """Tests for the Output.dim_channel method and on_dim_channel callback."""
 
-    def test_on_dim_channel_property_default_none(self):
+    def test_on_dim_channel_property_default_none(self, stack):
         """on_dim_channel defaults to None."""
-        host, _vdc, _device, vdsd = _make_stack()
+        host, _vdc, _device, vdsd = stack
         out = _make_output(vdsd)
         assert out.on_dim_channel is None
 
-    def test_on_dim_channel_property_set_get(self):
+    def test_on_dim_channel_property_set_get(self, stack):
         """on_dim_channel can be set and retrieved."""
-        host, _vdc, _device, vdsd = _make_stack()
+        host, _vdc, _device, vdsd = stack
         out = _make_output(vdsd)
         cb = AsyncMock()
         out.on_dim_channel = cb
         assert out.on_dim_channel is cb
 
-    def test_on_dim_channel_property_clear(self):
+    def test_on_dim_channel_property_clear(self, stack):
         """on_dim_channel can be cleared back to None."""
-        host, _vdc, _device, vdsd = _make_stack()
+        host, _vdc, _device, vdsd = stack
         out = _make_output(vdsd)
         out.on_dim_channel = AsyncMock()
         out.on_dim_channel = None
         assert out.on_dim_channel is None
 
     @pytest.mark.asyncio
-    async def test_dim_channel_calls_callback(self):
+    async def test_dim_channel_calls_callback(self, stack):
         """dim_channel() invokes the callback with correct arguments."""
-        host, _vdc, _device, vdsd = _make_stack()
+        host, _vdc, _device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         ch = out.get_channel(0)
@@ -2031,9 +2074,9 @@ class TestDimChannel:
         cb.assert_awaited_once_with(out, ch, 1, 2)
 
     @pytest.mark.asyncio
-    async def test_dim_channel_no_callback_no_error(self):
+    async def test_dim_channel_no_callback_no_error(self, stack):
         """dim_channel() with no callback does not raise."""
-        host, _vdc, _device, vdsd = _make_stack()
+        host, _vdc, _device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         ch = out.get_channel(0)
@@ -2041,9 +2084,9 @@ class TestDimChannel:
         await out.dim_channel(ch, mode=0, area=0)  # Should not raise
 
     @pytest.mark.asyncio
-    async def test_dim_channel_callback_exception_caught(self):
+    async def test_dim_channel_callback_exception_caught(self, stack):
         """dim_channel() catches exceptions from the callback."""
-        host, _vdc, _device, vdsd = _make_stack()
+        host, _vdc, _device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         ch = out.get_channel(0)
@@ -2072,9 +2115,9 @@ class TestVdcHostDimChannelDispatch:
         return msg
 
     @pytest.mark.asyncio
-    async def test_dispatch_dim_default_channel(self):
+    async def test_dispatch_dim_default_channel(self, stack):
         """dimChannel with channel=0 resolves to first (default) channel."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -2096,11 +2139,11 @@ class TestVdcHostDimChannelDispatch:
         assert args[3] == 0         # area
 
     @pytest.mark.asyncio
-    async def test_dispatch_dim_by_channel_type(self):
+    async def test_dispatch_dim_by_channel_type(self, stack):
         """dimChannel with numeric channel type resolves correctly."""
         from pydsvdcapi.enums import OutputChannelType
 
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -2125,9 +2168,9 @@ class TestVdcHostDimChannelDispatch:
         assert args[3] == 1
 
     @pytest.mark.asyncio
-    async def test_dispatch_dim_by_channel_id(self):
+    async def test_dispatch_dim_by_channel_id(self, stack):
         """dimChannel with channelId (API v3) resolves by name."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -2153,9 +2196,9 @@ class TestVdcHostDimChannelDispatch:
         assert args[2] == 0
 
     @pytest.mark.asyncio
-    async def test_dispatch_dim_unknown_dsuid_skipped(self):
+    async def test_dispatch_dim_unknown_dsuid_skipped(self, stack):
         """dimChannel for unknown dSUID is silently skipped."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -2173,9 +2216,9 @@ class TestVdcHostDimChannelDispatch:
         cb.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_dispatch_dim_no_output_skipped(self):
+    async def test_dispatch_dim_no_output_skipped(self, stack):
         """dimChannel for vdSD without output is silently skipped."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         # Do NOT set an output on the vdSD
         device.add_vdsd(vdsd)
         vdc.add_device(device)
@@ -2186,9 +2229,9 @@ class TestVdcHostDimChannelDispatch:
         await host._dispatch_message(session, msg)  # Should not raise
 
     @pytest.mark.asyncio
-    async def test_dispatch_dim_mode_stop(self):
+    async def test_dispatch_dim_mode_stop(self, stack):
         """dimChannel with mode=0 (stop) is dispatched correctly."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -2208,9 +2251,9 @@ class TestVdcHostDimChannelDispatch:
         assert args[3] == 3   # area
 
     @pytest.mark.asyncio
-    async def test_dispatch_dim_area_values(self):
+    async def test_dispatch_dim_area_values(self, stack):
         """dimChannel passes area values 1-4 through correctly."""
-        host, vdc, device, vdsd = _make_stack()
+        host, vdc, device, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
         device.add_vdsd(vdsd)
@@ -2238,10 +2281,10 @@ class TestVdcHostDimChannelDispatch:
 class TestSceneGroupUndoTracking:
     """Tests for per-group undo tracking in Output.call_scene / undo_scene."""
 
-    def test_call_scene_stores_undo_per_group(self):
+    def test_call_scene_stores_undo_per_group(self, stack):
         """Each call_scene with a different group should create a
         separate undo snapshot."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -2268,9 +2311,9 @@ class TestSceneGroupUndoTracking:
         out.undo_scene(0, group=1)
         assert ch.value == 50.0
 
-    def test_undo_wrong_group_ignored(self):
+    def test_undo_wrong_group_ignored(self, stack):
         """undo_scene with a non-matching group does nothing."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -2285,9 +2328,9 @@ class TestSceneGroupUndoTracking:
         out.undo_scene(0, group=2)
         assert ch.value == 0.0
 
-    def test_undo_default_group_zero(self):
+    def test_undo_default_group_zero(self, stack):
         """call_scene / undo_scene without explicit group uses group=0."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
@@ -2301,9 +2344,9 @@ class TestSceneGroupUndoTracking:
         out.undo_scene(0)
         assert ch.value == 42.0
 
-    def test_second_call_same_group_overwrites_snapshot(self):
+    def test_second_call_same_group_overwrites_snapshot(self, stack):
         """A second call_scene for the same group replaces the snapshot."""
-        _, _, _, vdsd = _make_stack()
+        _, _, _, vdsd = stack
         out = _make_output(vdsd, function=OutputFunction.DIMMER)
         vdsd.set_output(out)
 
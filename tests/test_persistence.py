@@ -51,6 +51,10 @@ class TestSaveLoad:
     def test_load_without_file_returns_none(self, store):
         assert store.load() is None
 
+    def test_load_decodes_utf8_from_bytes(self, store):
+        store.path.write_bytes("name: Küche ☀\n".encode("utf-8"))
+        assert store.load() == {"name": "Küche ☀"}
+
     def test_yaml_is_human_readable(self, store, sample_tree):
         store.save(sample_tree)
         content = store.path.read_text(encoding="utf-8")
@@ -195,6 +199,32 @@ class TestAtomicWrite:
         assert not tmp.is_file()
 
 
+# ---------------------------------------------------------------------------
+# Unchanged-tree skip
+# ---------------------------------------------------------------------------
+
+class TestSkipUnchanged:
+
+    def test_identical_tree_not_rewritten(self, store, sample_tree):
+        store.save(sample_tree)
+        mtime = store.path.stat().st_mtime_ns
+        store.save(sample_tree)
+        assert store.path.stat().st_mtime_ns == mtime
+        assert not store.backup_path.is_file()
+
+    def test_externally_modified_file_is_rewritten(self, store, sample_tree):
+        store.save(sample_tree)
+        store.path.write_text("corrupted", encoding="utf-8")
+        store.save(sample_tree)
+        assert store.load() == sample_tree
+
+    def test_deleted_file_is_rewritten(self, store, sample_tree):
+        store.save(sample_tree)
+        store.path.unlink()
+        store.save(sample_tree)
+        assert store.path.is_file()
+
+
 # ---------------------------------------------------------------------------
 # Directory creation
 # ---------------------------------------------------------------------------
@@ -216,7 +246,9 @@ class TestDelete:
 
     def test_delete_removes_files(self, store, sample_tree):
         store.save(sample_tree)
-        store.save(sample_tree)  # creates backup
+        store.save(
+            {"vdcHost": {**sample_tree["vdcHost"], "name": "V2"}}
+        )  # creates backup
         store.delete()
         assert not store.path.exists()
         assert not store.backup_path.exists()
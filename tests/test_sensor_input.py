@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import time
-from typing import Any, Dict, Optional
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 from pydsvdcapi import vdc_messages_pb2 as pb
 from pydsvdcapi.dsuid import DsUid, DsUidNamespace
@@ -19,6 +22,7 @@ from pydsvdcapi.enums import (
     SensorUsage,
 )
 from pydsvdcapi.property_handling import elements_to_dict
+from pydsvdcapi import sensor_input as sensor_input_module
 from pydsvdcapi.sensor_input import SensorInput
 from pydsvdcapi.session import VdcSession
 from pydsvdcapi.vdc import Vdc
@@ -26,6 +30,18 @@ from pydsvdcapi.vdc_host import VdcHost
 from pydsvdcapi.vdsd import Device, Vdsd
 
 
+# All async tests share one event loop; the ``vdsd`` fixture stops any
+# timers a test leaves behind.  The mark reaches the sync tests too,
+# which pytest-asyncio reports as a warning for each of them.
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.filterwarnings(
+        "ignore:The test <Function .*> is marked with '@pytest.mark.asyncio'"
+        ":pytest.PytestWarning"
+    ),
+]
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -84,6 +100,92 @@ def _make_sensor_input(vdsd: Vdsd, **kwargs: Any) -> SensorInput:
     return SensorInput(**defaults)
 
 
+@pytest.fixture(scope="module")
+def shared_vdc() -> Vdc:
+    """A host and vDC shared by the module's ``vdsd`` fixtures.
+
+    Devices built on it are never added to it, so tests cannot see
+    each other through the vDC.
+    """
+    return _make_vdc(_make_host())
+
+
+@pytest.fixture
+def vdsd(shared_vdc: Vdc) -> Iterator[Vdsd]:
+    """A fresh, unattached device → vdSD pair for a single test.
+
+    The event loop is shared by the whole module, so teardown stops
+    the timers of every sensor input added to the vdSD; an alive or
+    deferred-push handle left behind would otherwise fire during a
+    later test.
+    """
+    vdsd = _make_vdsd(_make_device(shared_vdc))
+    yield vdsd
+    vdsd.reset_announcement()
+
+
+class _FakeTimer:
+    """Stand-in for :class:`asyncio.TimerHandle`; only ``cancel()``."""
+
+    __slots__ = ("cancelled",)
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class _FakeClock:
+    """Virtual time for SensorInput's ``time.monotonic`` and timers.
+
+    Installed by the ``fake_clock`` fixture in place of the module's
+    ``time`` and of the running loop's ``call_later``; nothing fires
+    until :meth:`advance` moves the clock past a timer's deadline.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self._timers: List[Tuple[float, int, _FakeTimer, Any, tuple]] = []
+        self._seq = itertools.count()
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def call_later(
+        self, delay: float, callback: Any, *args: Any
+    ) -> _FakeTimer:
+        timer = _FakeTimer()
+        heapq.heappush(
+            self._timers,
+            (self.now + delay, next(self._seq), timer, callback, args),
+        )
+        return timer
+
+    async def advance(self, seconds: float) -> None:
+        """Move time forward, firing due timers in deadline order."""
+        target = self.now + seconds
+        while self._timers and self._timers[0][0] <= target:
+            when, _, timer, callback, args = heapq.heappop(self._timers)
+            self.now = when
+            if not timer.cancelled:
+                callback(*args)
+                # Let any push task the callback spawned run to completion.
+                await asyncio.sleep(0)
+        self.now = target
+        await asyncio.sleep(0)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def fake_clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    clock = _FakeClock()
+    monkeypatch.setattr(sensor_input_module, "time", clock)
+    monkeypatch.setattr(
+        asyncio.get_running_loop(), "call_later", clock.call_later
+    )
+    return clock
+
+
 def _make_mock_session() -> MagicMock:
     session = MagicMock(spec=VdcSession)
     session.is_active = True
@@ -91,6 +193,13 @@ def _make_mock_session() -> MagicMock:
     return session
 
 
+@pytest.fixture
+def session() -> MagicMock:
+    """A fresh mock session whose ``send_notification`` is an
+    ``AsyncMock``."""
+    return _make_mock_session()
+
+
 # ===========================================================================
 # Construction and defaults
 # ===========================================================================
@@ -99,11 +208,7 @@ def _make_mock_session() -> MagicMock:
 class TestSensorInputConstruction:
     """Tests for SensorInput creation and default values."""
 
-    def test_default_construction(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_default_construction(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         assert si.ds_index == 0
@@ -119,12 +224,7 @@ class TestSensorInputConstruction:
         assert si.changes_only_interval == 0.0
         assert si.vdsd is vdsd
 
-    def test_custom_construction(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_custom_construction(self, vdsd):
         si = SensorInput(
             vdsd=vdsd,
             ds_index=2,
@@ -154,11 +254,7 @@ class TestSensorInputConstruction:
         assert si.min_push_interval == 5.0
         assert si.changes_only_interval == 30.0
 
-    def test_repr(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_repr(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         r = repr(si)
@@ -176,11 +272,7 @@ class TestSensorInputConstruction:
 class TestSensorInputStateDefaults:
     """Tests for initial state values."""
 
-    def test_initial_value_is_none(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_initial_value_is_none(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         assert si.value is None
@@ -189,11 +281,7 @@ class TestSensorInputStateDefaults:
         assert si.context_msg is None
         assert si.error == InputError.OK
 
-    def test_error_setter(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_error_setter(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         si.error = InputError.LOW_BATTERY
@@ -211,41 +299,25 @@ class TestSensorInputStateDefaults:
 class TestSensorInputSettings:
     """Tests for settings property accessors."""
 
-    def test_group_setter(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_group_setter(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         si.group = 3
         assert si.group == 3
 
-    def test_min_push_interval_setter(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_min_push_interval_setter(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         si.min_push_interval = 5.0
         assert si.min_push_interval == 5.0
 
-    def test_changes_only_interval_setter(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_changes_only_interval_setter(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         si.changes_only_interval = 10.0
         assert si.changes_only_interval == 10.0
 
-    def test_apply_settings(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_apply_settings(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         si.apply_settings({
@@ -258,11 +330,7 @@ class TestSensorInputSettings:
         assert si.min_push_interval == 3.0
         assert si.changes_only_interval == 8.0
 
-    def test_apply_settings_partial(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_apply_settings_partial(self, vdsd):
         si = _make_sensor_input(vdsd, group=1)
 
         si.apply_settings({"group": 9})
@@ -281,11 +349,7 @@ class TestSensorInputSettings:
 class TestSensorInputDescriptionProperties:
     """Tests for the description property dict."""
 
-    def test_description_dict(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_description_dict(self, vdsd):
         si = _make_sensor_input(
             vdsd,
             update_interval=5.0,
@@ -313,11 +377,7 @@ class TestSensorInputDescriptionProperties:
 class TestSensorInputSettingsProperties:
     """Tests for the settings property dict."""
 
-    def test_settings_dict(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_settings_dict(self, vdsd):
         si = _make_sensor_input(
             vdsd,
             group=3,
@@ -340,11 +400,7 @@ class TestSensorInputSettingsProperties:
 class TestSensorInputStateProperties:
     """Tests for the state property dict."""
 
-    def test_state_dict_initial(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_state_dict_initial(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         state = si.get_state_properties()
@@ -355,11 +411,7 @@ class TestSensorInputStateProperties:
         assert "contextId" not in state
         assert "contextMsg" not in state
 
-    def test_state_dict_with_value(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_state_dict_with_value(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         si._value = 21.5
@@ -371,11 +423,7 @@ class TestSensorInputStateProperties:
         assert state["age"] is not None
         assert state["age"] >= 0.0
 
-    def test_state_dict_with_context(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_state_dict_with_context(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         si._value = 22.0
@@ -388,11 +436,7 @@ class TestSensorInputStateProperties:
         assert state["contextId"] == 42
         assert state["contextMsg"] == "calibrated"
 
-    def test_state_dict_with_error(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_state_dict_with_error(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         si.error = InputError.LOW_BATTERY
@@ -409,12 +453,7 @@ class TestSensorInputStateProperties:
 class TestSensorInputValueUpdate:
     """Tests for update_value."""
 
-    @pytest.mark.asyncio
-    async def test_update_value_sets_value(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_value_sets_value(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         await si.update_value(21.5)
@@ -423,12 +462,7 @@ class TestSensorInputValueUpdate:
         assert si.age is not None
         assert si.age < 1.0
 
-    @pytest.mark.asyncio
-    async def test_update_value_with_context(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_value_with_context(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         await si.update_value(
@@ -439,35 +473,20 @@ class TestSensorInputValueUpdate:
         assert si.context_id == 7
         assert si.context_msg == "calibrated"
 
-    @pytest.mark.asyncio
-    async def test_update_value_none(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_value_none(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         await si.update_value(None)
         assert si.value is None
 
-    @pytest.mark.asyncio
-    async def test_update_error(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_error(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         await si.update_error(InputError.OPEN_CIRCUIT)
         assert si.error == InputError.OPEN_CIRCUIT
 
-    @pytest.mark.asyncio
-    async def test_context_preserved_across_updates(self):
+    async def test_context_preserved_across_updates(self, vdsd):
         """Context fields are sticky — only overwritten if explicitly set."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
         si = _make_sensor_input(vdsd)
 
         await si.update_value(21.0, context_id=1, context_msg="first")
@@ -486,16 +505,10 @@ class TestSensorInputValueUpdate:
 class TestSensorInputPushNotification:
     """Tests for the push notification logic."""
 
-    @pytest.mark.asyncio
-    async def test_push_sent_when_announced(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_sent_when_announced(self, vdsd, session):
         si = _make_sensor_input(vdsd)
         vdsd.add_sensor_input(si)
 
-        session = _make_mock_session()
         vdsd._announced = True
 
         await si.update_value(21.5, session)
@@ -514,27 +527,16 @@ class TestSensorInputPushNotification:
         assert "0" in states
         assert states["0"]["value"] == 21.5
 
-    @pytest.mark.asyncio
-    async def test_push_not_sent_when_not_announced(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_not_sent_when_not_announced(self, vdsd, session):
         si = _make_sensor_input(vdsd)
 
-        session = _make_mock_session()
         # vdsd._announced is False by default
 
         await si.update_value(21.5, session)
 
         session.send_notification.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_push_not_sent_when_no_session(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_not_sent_when_no_session(self, vdsd):
         si = _make_sensor_input(vdsd)
         vdsd._announced = True
 
@@ -542,17 +544,10 @@ class TestSensorInputPushNotification:
         await si.update_value(21.5)
         # Should not raise.
 
-    @pytest.mark.asyncio
-    async def test_push_error_update(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_error_update(self, vdsd, session):
         si = _make_sensor_input(vdsd)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_error(InputError.SHORT_CIRCUIT, session)
 
         session.send_notification.assert_called_once()
@@ -564,31 +559,20 @@ class TestSensorInputPushNotification:
             InputError.SHORT_CIRCUIT
         )
 
-    @pytest.mark.asyncio
-    async def test_push_handles_connection_error(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_handles_connection_error(self, vdsd, session):
         si = _make_sensor_input(vdsd)
         vdsd._announced = True
 
-        session = _make_mock_session()
-        session.send_notification = AsyncMock(
-            side_effect=ConnectionError("disconnected")
+        session.send_notification.side_effect = ConnectionError(
+            "disconnected"
         )
 
         # Should not raise despite connection error.
         await si.update_value(21.5, session)
         assert si.value == 21.5
 
-    @pytest.mark.asyncio
-    async def test_push_for_multiple_sensors(self):
+    async def test_push_for_multiple_sensors(self, vdsd, session):
         """Each sensor pushes its own state independently."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
 
         si0 = SensorInput(
             vdsd=vdsd, ds_index=0, name="Temperature",
@@ -604,8 +588,6 @@ class TestSensorInputPushNotification:
         vdsd.add_sensor_input(si1)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si0.update_value(21.5, session)
         await si1.update_value(55.0, session)
 
@@ -625,19 +607,12 @@ class TestSensorInputPushNotification:
         )
         assert "1" in props1["sensorStates"]
 
-    @pytest.mark.asyncio
-    async def test_push_includes_context(self):
+    async def test_push_includes_context(self, vdsd, session):
         """Context data should appear in the pushed state."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
         si = _make_sensor_input(vdsd)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_value(
             21.5, session, context_id=99, context_msg="test"
         )
@@ -659,11 +634,7 @@ class TestSensorInputPushNotification:
 class TestVdsdSensorInputManagement:
     """Tests for add/remove/get sensor input methods on Vdsd."""
 
-    def test_add_sensor_input(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_add_sensor_input(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         vdsd.add_sensor_input(si)
@@ -683,11 +654,7 @@ class TestVdsdSensorInputManagement:
         with pytest.raises(ValueError, match="different vdSD"):
             vdsd2.add_sensor_input(si)
 
-    def test_remove_sensor_input(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_remove_sensor_input(self, vdsd):
         si = _make_sensor_input(vdsd)
         vdsd.add_sensor_input(si)
 
@@ -695,27 +662,13 @@ class TestVdsdSensorInputManagement:
         assert removed is si
         assert vdsd.get_sensor_input(0) is None
 
-    def test_remove_nonexistent(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_remove_nonexistent(self, vdsd):
         assert vdsd.remove_sensor_input(99) is None
 
-    def test_get_sensor_input_nonexistent(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_get_sensor_input_nonexistent(self, vdsd):
         assert vdsd.get_sensor_input(0) is None
 
-    def test_sensor_inputs_dict_is_copy(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_sensor_inputs_dict_is_copy(self, vdsd):
         si = _make_sensor_input(vdsd)
         vdsd.add_sensor_input(si)
 
@@ -723,12 +676,7 @@ class TestVdsdSensorInputManagement:
         inputs.clear()  # Should not affect internal state.
         assert len(vdsd.sensor_inputs) == 1
 
-    def test_replace_existing_index(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_replace_existing_index(self, vdsd):
         si_old = _make_sensor_input(vdsd, name="Old")
         si_new = _make_sensor_input(vdsd, name="New")
 
@@ -749,23 +697,14 @@ class TestVdsdSensorInputManagement:
 class TestVdsdSensorInputProperties:
     """Tests for sensor input properties in Vdsd.get_properties()."""
 
-    def test_no_sensor_inputs_no_properties(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_no_sensor_inputs_no_properties(self, vdsd):
         props = vdsd.get_properties()
 
         assert "sensorDescriptions" not in props
         assert "sensorSettings" not in props
         assert "sensorStates" not in props
 
-    def test_sensor_input_properties_exposed(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_sensor_input_properties_exposed(self, vdsd):
         si = _make_sensor_input(vdsd)
         vdsd.add_sensor_input(si)
 
@@ -795,12 +734,7 @@ class TestVdsdSensorInputProperties:
         assert "0" in states
         assert states["0"]["value"] is None
 
-    def test_multiple_sensor_inputs(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_multiple_sensor_inputs(self, vdsd):
         si0 = SensorInput(
             vdsd=vdsd, ds_index=0, name="Temperature",
             sensor_type=SensorType.TEMPERATURE,
@@ -830,11 +764,7 @@ class TestVdsdSensorInputProperties:
 class TestSensorInputPersistence:
     """Tests for SensorInput persistence."""
 
-    def test_get_property_tree(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_get_property_tree(self, vdsd):
         si = _make_sensor_input(
             vdsd,
             group=5,
@@ -859,11 +789,7 @@ class TestSensorInputPersistence:
         assert tree["minPushInterval"] == 3.0
         assert tree["changesOnlyInterval"] == 15.0
 
-    def test_apply_state(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_apply_state(self, vdsd):
         si = SensorInput._restore(vdsd=vdsd, ds_index=0)
 
         si._apply_state({
@@ -894,12 +820,8 @@ class TestSensorInputPersistence:
         assert si.min_push_interval == 4.0
         assert si.changes_only_interval == 20.0
 
-    def test_round_trip(self):
+    def test_round_trip(self, vdsd):
         """Save → restore should yield identical properties."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
 
         original = SensorInput(
             vdsd=vdsd,
@@ -935,12 +857,8 @@ class TestSensorInputPersistence:
         assert restored.min_push_interval == original.min_push_interval
         assert restored.changes_only_interval == original.changes_only_interval
 
-    def test_state_not_persisted(self):
+    def test_state_not_persisted(self, vdsd):
         """State values must NOT appear in the property tree."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
         si = _make_sensor_input(vdsd)
 
         si._value = 21.5
@@ -966,11 +884,7 @@ class TestSensorInputPersistence:
 class TestVdsdSensorInputPersistence:
     """Tests for sensor inputs in Vdsd property tree persistence."""
 
-    def test_vdsd_tree_includes_sensor_inputs(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_vdsd_tree_includes_sensor_inputs(self, vdsd):
         si = _make_sensor_input(vdsd, group=2)
         vdsd.add_sensor_input(si)
 
@@ -981,12 +895,7 @@ class TestVdsdSensorInputPersistence:
         assert tree["sensorInputs"][0]["dsIndex"] == 0
         assert tree["sensorInputs"][0]["group"] == 2
 
-    def test_vdsd_tree_no_sensor_inputs(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_vdsd_tree_no_sensor_inputs(self, vdsd):
         tree = vdsd.get_property_tree()
         assert "sensorInputs" not in tree
 
@@ -1012,12 +921,7 @@ class TestVdsdSensorInputPersistence:
         assert restored_si.group == 4
         assert restored_si.sensor_type == SensorType.TEMPERATURE
 
-    def test_vdsd_apply_state_updates_existing_sensor_input(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_vdsd_apply_state_updates_existing_sensor_input(self, vdsd):
         # Pre-create a sensor input.
         si = _make_sensor_input(vdsd, group=0)
         vdsd.add_sensor_input(si)
@@ -1181,8 +1085,12 @@ class TestVdcHostSensorInputSetProperty:
 class TestSensorInputAutoSave:
     """Tests that settings changes trigger auto-save."""
 
-    def test_group_setter_triggers_auto_save(self):
+    @pytest.fixture
+    def wired(self) -> Tuple[VdcHost, SensorInput]:
+        """A fully wired host → sensor input chain with a mocked
+        ``_schedule_auto_save``, reset after wiring."""
         host = _make_host()
+        host._schedule_auto_save = MagicMock()
         vdc = _make_vdc(host)
         device = _make_device(vdc)
         vdsd = _make_vdsd(device)
@@ -1191,55 +1099,28 @@ class TestSensorInputAutoSave:
         device.add_vdsd(vdsd)
         vdc.add_device(device)
         host.add_vdc(vdc)
+        host._schedule_auto_save.reset_mock()
+        return host, si
 
-        with patch.object(host, "_schedule_auto_save") as mock_save:
-            si.group = 5
-            mock_save.assert_called()
-
-    def test_min_push_interval_setter_triggers_auto_save(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-        si = _make_sensor_input(vdsd)
-        vdsd.add_sensor_input(si)
-        device.add_vdsd(vdsd)
-        vdc.add_device(device)
-        host.add_vdc(vdc)
-
-        with patch.object(host, "_schedule_auto_save") as mock_save:
-            si.min_push_interval = 5.0
-            mock_save.assert_called()
-
-    def test_changes_only_interval_setter_triggers_auto_save(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-        si = _make_sensor_input(vdsd)
-        vdsd.add_sensor_input(si)
-        device.add_vdsd(vdsd)
-        vdc.add_device(device)
-        host.add_vdc(vdc)
+    def test_group_setter_triggers_auto_save(self, wired):
+        host, si = wired
+        si.group = 5
+        host._schedule_auto_save.assert_called()
 
-        with patch.object(host, "_schedule_auto_save") as mock_save:
-            si.changes_only_interval = 10.0
-            mock_save.assert_called()
+    def test_min_push_interval_setter_triggers_auto_save(self, wired):
+        host, si = wired
+        si.min_push_interval = 5.0
+        host._schedule_auto_save.assert_called()
 
-    def test_apply_settings_triggers_auto_save(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-        si = _make_sensor_input(vdsd)
-        vdsd.add_sensor_input(si)
-        device.add_vdsd(vdsd)
-        vdc.add_device(device)
-        host.add_vdc(vdc)
+    def test_changes_only_interval_setter_triggers_auto_save(self, wired):
+        host, si = wired
+        si.changes_only_interval = 10.0
+        host._schedule_auto_save.assert_called()
 
-        with patch.object(host, "_schedule_auto_save") as mock_save:
-            si.apply_settings({"group": 3})
-            mock_save.assert_called()
+    def test_apply_settings_triggers_auto_save(self, wired):
+        host, si = wired
+        si.apply_settings({"group": 3})
+        host._schedule_auto_save.assert_called()
 
 
 # ===========================================================================
@@ -1250,21 +1131,12 @@ class TestSensorInputAutoSave:
 class TestSensorInputAge:
     """Tests for the age property."""
 
-    def test_age_none_initially(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_age_none_initially(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         assert si.age is None
 
-    @pytest.mark.asyncio
-    async def test_age_after_update(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_age_after_update(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         await si.update_value(21.5)
@@ -1274,12 +1146,7 @@ class TestSensorInputAge:
         assert age >= 0.0
         assert age < 1.0  # should be near-instant
 
-    @pytest.mark.asyncio
-    async def test_age_increases(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_age_increases(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         await si.update_value(21.5)
@@ -1303,33 +1170,20 @@ class TestSensorInputAge:
 class TestMinPushInterval:
     """Tests for minPushInterval rate-limiting."""
 
-    @pytest.mark.asyncio
-    async def test_first_push_always_goes_through(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_first_push_always_goes_through(self, vdsd, session):
         si = _make_sensor_input(vdsd, min_push_interval=5.0)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
         await si.update_value(21.5, session)
 
         session.send_notification.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_second_push_within_interval_deferred(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_second_push_within_interval_deferred(self, vdsd, session):
         si = _make_sensor_input(vdsd, min_push_interval=5.0)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         # First push goes through.
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
@@ -1341,18 +1195,11 @@ class TestMinPushInterval:
         # A deferred push handle should be scheduled.
         assert si._deferred_push_handle is not None
 
-    @pytest.mark.asyncio
-    async def test_push_after_interval_elapsed(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_push_after_interval_elapsed(self, vdsd, session):
         si = _make_sensor_input(vdsd, min_push_interval=0.5)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
 
@@ -1363,19 +1210,12 @@ class TestMinPushInterval:
         await si.update_value(22.0, session)
         assert session.send_notification.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_deferred_push_fires(self):
+    async def test_deferred_push_fires(self, vdsd, fake_clock, session):
         """The deferred push should fire after the delay."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
         si = _make_sensor_input(vdsd, min_push_interval=0.05)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
 
@@ -1383,21 +1223,55 @@ class TestMinPushInterval:
         await si.update_value(22.0, session)
         assert session.send_notification.call_count == 1
 
-        # Wait for the deferred push to fire.
-        await asyncio.sleep(0.1)
+        # Let the deferred push fire.
+        await fake_clock.advance(0.1)
         assert session.send_notification.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_deferred_push_cancelled_on_stop(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-        si = _make_sensor_input(vdsd, min_push_interval=5.0)
+    async def test_burst_coalesces_into_one_deferred_push(
+        self, vdsd, fake_clock, session
+    ):
+        si = _make_sensor_input(vdsd, min_push_interval=1.0)
+        vdsd.add_sensor_input(si)
+        vdsd._announced = True
+
+        await si.update_value(20.0, session)
+        await si.update_value(20.5, session)
+        handle = si._deferred_push_handle
+        assert handle is not None
+        for value in (21.0, 21.5, 22.0):
+            await fake_clock.advance(0.1)
+            await si.update_value(value, session)
+            assert si._deferred_push_handle is handle
+
+        await fake_clock.advance(1.0)
+        assert session.send_notification.call_count == 2
+        (msg,) = session.send_notification.call_args.args
+        props = elements_to_dict(
+            msg.vdc_send_push_notification.changedproperties
+        )
+        assert props["sensorStates"]["0"]["value"] == 22.0
+
+    async def test_deferred_push_uses_latest_session(
+        self, vdsd, fake_clock, session
+    ):
+        """A reconnect inside the window sends on the new session."""
+        si = _make_sensor_input(vdsd, min_push_interval=1.0)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
+        await si.update_value(20.0, session)
+        await si.update_value(20.5, session)
+        new_session = _make_mock_session()
+        await si.update_value(21.0, new_session)
+
+        await fake_clock.advance(1.0)
+        assert session.send_notification.call_count == 1
+        new_session.send_notification.assert_awaited_once()
+
+    async def test_deferred_push_cancelled_on_stop(self, vdsd, session):
+        si = _make_sensor_input(vdsd, min_push_interval=5.0)
+        vdsd.add_sensor_input(si)
+        vdsd._announced = True
 
         await si.update_value(21.5, session)
         await si.update_value(22.0, session)
@@ -1415,18 +1289,11 @@ class TestMinPushInterval:
 class TestChangesOnlyInterval:
     """Tests for changesOnlyInterval duplicate suppression."""
 
-    @pytest.mark.asyncio
-    async def test_same_value_suppressed(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_same_value_suppressed(self, vdsd, session):
         si = _make_sensor_input(vdsd, changes_only_interval=10.0)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
 
@@ -1434,20 +1301,13 @@ class TestChangesOnlyInterval:
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_different_value_not_suppressed(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_different_value_not_suppressed(self, vdsd, session):
         si = _make_sensor_input(
             vdsd, changes_only_interval=10.0, min_push_interval=0.0,
         )
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
 
@@ -1455,18 +1315,11 @@ class TestChangesOnlyInterval:
         await si.update_value(22.0, session)
         assert session.send_notification.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_same_value_after_interval_elapsed(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_same_value_after_interval_elapsed(self, vdsd, session):
         si = _make_sensor_input(vdsd, changes_only_interval=1.0)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
 
@@ -1487,18 +1340,11 @@ class TestChangesOnlyInterval:
 class TestPushForce:
     """Tests that force=True bypasses throttling."""
 
-    @pytest.mark.asyncio
-    async def test_force_bypasses_min_push_interval(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_force_bypasses_min_push_interval(self, vdsd, session):
         si = _make_sensor_input(vdsd, min_push_interval=999.0)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
 
@@ -1506,18 +1352,11 @@ class TestPushForce:
         await si._push_state(session, force=True)
         assert session.send_notification.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_force_bypasses_changes_only_interval(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_force_bypasses_changes_only_interval(self, vdsd, session):
         si = _make_sensor_input(vdsd, changes_only_interval=999.0)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
 
@@ -1534,45 +1373,28 @@ class TestPushForce:
 class TestAliveTimer:
     """Tests for the alive timer (periodic heartbeat push)."""
 
-    def test_start_stores_session(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_start_stores_session(self, vdsd, session):
         si = _make_sensor_input(vdsd, alive_sign_interval=10.0)
 
-        session = _make_mock_session()
         si.start_alive_timer(session)
 
         assert si._session is session
 
-    def test_stop_clears_session(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_stop_clears_session(self, vdsd, session):
         si = _make_sensor_input(vdsd, alive_sign_interval=10.0)
 
-        session = _make_mock_session()
         si.start_alive_timer(session)
         si.stop_alive_timer()
 
         assert si._session is None
         assert si._alive_timer_handle is None
 
-    @pytest.mark.asyncio
-    async def test_alive_timer_fires(self):
+    async def test_alive_timer_fires(self, vdsd, fake_clock, session):
         """Alive timer should re-push state after the interval."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
         si = _make_sensor_input(vdsd, alive_sign_interval=0.05)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         # Set initial value.
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
@@ -1580,21 +1402,14 @@ class TestAliveTimer:
         # Start alive timer.
         si.start_alive_timer(session)
 
-        # Wait for the alive timer to fire.
-        await asyncio.sleep(0.15)
+        # Let the alive timer fire twice (at +0.05 s and +0.10 s).
+        await fake_clock.advance(0.12)
 
-        # Should have re-pushed at least once.
-        assert session.send_notification.call_count >= 2
+        assert session.send_notification.call_count == 3
 
-    @pytest.mark.asyncio
-    async def test_alive_timer_does_not_start_when_zero(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_alive_timer_does_not_start_when_zero(self, vdsd, session):
         si = _make_sensor_input(vdsd, alive_sign_interval=0.0)
 
-        session = _make_mock_session()
         si.start_alive_timer(session)
 
         # Timer not scheduled.
@@ -1602,41 +1417,31 @@ class TestAliveTimer:
         # But session IS stored.
         assert si._session is session
 
-    @pytest.mark.asyncio
-    async def test_alive_timer_reset_after_push(self):
+    async def test_alive_timer_reset_after_push(
+        self, vdsd, fake_clock, session
+    ):
         """A regular push should reset the alive timer."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
         si = _make_sensor_input(
             vdsd, alive_sign_interval=0.2, min_push_interval=0.0,
         )
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
         si.start_alive_timer(session)
 
         # Push 3 times within the alive interval.
         for i in range(3):
             await si.update_value(20.0 + i, session)
-            await asyncio.sleep(0.05)
+            await fake_clock.advance(0.05)
 
         # Only value-change pushes, no alive timer fire yet.
         assert session.send_notification.call_count == 3
 
-    @pytest.mark.asyncio
-    async def test_alive_timer_cancelled_on_vanish(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_alive_timer_cancelled_on_vanish(self, vdsd, session):
         si = _make_sensor_input(vdsd, alive_sign_interval=10.0)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
         si.start_alive_timer(session)
         assert si._alive_timer_handle is not None
 
@@ -1654,17 +1459,11 @@ class TestAliveTimer:
 class TestSessionFallback:
     """Tests that update methods use the stored session as fallback."""
 
-    @pytest.mark.asyncio
-    async def test_update_value_uses_stored_session(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_value_uses_stored_session(self, vdsd, session):
         si = _make_sensor_input(vdsd)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
         si.start_alive_timer(session)
 
         # No session passed — should use stored session.
@@ -1672,29 +1471,18 @@ class TestSessionFallback:
 
         session.send_notification.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_update_error_uses_stored_session(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_update_error_uses_stored_session(self, vdsd, session):
         si = _make_sensor_input(vdsd)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
         si.start_alive_timer(session)
 
         await si.update_error(InputError.LOW_BATTERY)
 
         session.send_notification.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_explicit_session_overrides_stored(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_explicit_session_overrides_stored(self, vdsd):
         si = _make_sensor_input(vdsd)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
@@ -1718,13 +1506,7 @@ class TestSessionFallback:
 class TestVdsdAliveTimerLifecycle:
     """Tests that Vdsd announce/vanish/reset manage alive timers."""
 
-    def test_add_sensor_input_after_announce_starts_timer(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
-        session = _make_mock_session()
+    def test_add_sensor_input_after_announce_starts_timer(self, vdsd, session):
         vdsd._announced = True
         vdsd._session = session
 
@@ -1733,12 +1515,7 @@ class TestVdsdAliveTimerLifecycle:
 
         assert si._session is session
 
-    def test_reset_announcement_stops_all_timers(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
-
+    def test_reset_announcement_stops_all_timers(self, vdsd, session):
         si0 = SensorInput(
             vdsd=vdsd, ds_index=0, alive_sign_interval=10.0,
             sensor_type=SensorType.TEMPERATURE,
@@ -1752,7 +1529,6 @@ class TestVdsdAliveTimerLifecycle:
         vdsd.add_sensor_input(si0)
         vdsd.add_sensor_input(si1)
 
-        session = _make_mock_session()
         si0.start_alive_timer(session)
         si1.start_alive_timer(session)
 
@@ -1763,14 +1539,9 @@ class TestVdsdAliveTimerLifecycle:
         assert si0._alive_timer_handle is None
         assert si1._alive_timer_handle is None
 
-    def test_vdsd_stores_session_on_announce(self):
+    def test_vdsd_stores_session_on_announce(self, vdsd, session):
         """When vdSD is announced, it stores the session."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
 
-        session = _make_mock_session()
         vdsd._announced = True
         vdsd._session = session
 
@@ -1788,40 +1559,25 @@ class TestVdsdAliveTimerLifecycle:
 class TestCurrentStateKey:
     """Tests for _current_state_key used in changesOnlyInterval."""
 
-    def test_initial_state_key(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_initial_state_key(self, vdsd):
         si = _make_sensor_input(vdsd)
 
-        assert si._current_state_key() == (None,)
+        assert si._current_state_key() is None
 
-    @pytest.mark.asyncio
-    async def test_state_key_after_value_update(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_state_key_after_value_update(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         await si.update_value(21.5)
-        assert si._current_state_key() == (21.5,)
+        assert si._current_state_key() == 21.5
 
-    @pytest.mark.asyncio
-    async def test_last_pushed_state_tracked(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_last_pushed_state_tracked(self, vdsd, session):
         si = _make_sensor_input(vdsd)
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
         await si.update_value(21.5, session)
 
-        assert si._last_pushed_state == (21.5,)
+        assert si._last_pushed_state == 21.5
         assert si._last_push_time is not None
 
 
@@ -1833,15 +1589,10 @@ class TestCurrentStateKey:
 class TestCombinedThrottling:
     """Tests with both minPushInterval and changesOnlyInterval set."""
 
-    @pytest.mark.asyncio
-    async def test_changes_only_checked_before_min_push(self):
+    async def test_changes_only_checked_before_min_push(self, vdsd, session):
         """changesOnlyInterval suppression should take priority over
         minPushInterval deferral (no deferred push scheduled for
         same-value duplicates)."""
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
         si = _make_sensor_input(
             vdsd,
             min_push_interval=5.0,
@@ -1850,8 +1601,6 @@ class TestCombinedThrottling:
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
 
@@ -1861,12 +1610,7 @@ class TestCombinedThrottling:
         # No deferred push scheduled (changesOnly wins).
         assert si._deferred_push_handle is None
 
-    @pytest.mark.asyncio
-    async def test_different_value_deferred_by_min_push(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    async def test_different_value_deferred_by_min_push(self, vdsd, session):
         si = _make_sensor_input(
             vdsd,
             min_push_interval=5.0,
@@ -1875,8 +1619,6 @@ class TestCombinedThrottling:
         vdsd.add_sensor_input(si)
         vdsd._announced = True
 
-        session = _make_mock_session()
-
         await si.update_value(21.5, session)
         assert session.send_notification.call_count == 1
 
@@ -1895,11 +1637,7 @@ class TestCombinedThrottling:
 class TestSensorInputNameSetter:
     """Tests for the name property setter."""
 
-    def test_name_setter(self):
-        host = _make_host()
-        vdc = _make_vdc(host)
-        device = _make_device(vdc)
-        vdsd = _make_vdsd(device)
+    def test_name_setter(self, vdsd):
         si = _make_sensor_input(vdsd)
 
         si.name = "New Name"
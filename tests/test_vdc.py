@@ -301,7 +301,7 @@ class TestVdcAutoSave:
 
         vdc.name = "New Name"
         # A timer should now be running on the host.
-        assert host._save_timer is not None
+        assert host._save_deadline is not None
         host._cancel_auto_save()
 
     def test_non_tracked_attr_does_not_trigger(self, tmp_path):
@@ -311,7 +311,7 @@ class TestVdcAutoSave:
         host._cancel_auto_save()
 
         vdc._announced = True  # not tracked
-        assert host._save_timer is None
+        assert host._save_deadline is None
 
     def test_zone_id_is_tracked(self, tmp_path):
         host = _make_host(tmp_path)
@@ -320,7 +320,7 @@ class TestVdcAutoSave:
         host._cancel_auto_save()
 
         vdc.zone_id = 99
-        assert host._save_timer is not None
+        assert host._save_deadline is not None
         host._cancel_auto_save()
 
     def test_capabilities_setter_triggers_save(self, tmp_path):
@@ -330,7 +330,7 @@ class TestVdcAutoSave:
         host._cancel_auto_save()
 
         vdc.capabilities = VdcCapabilities(metering=True)
-        assert host._save_timer is not None
+        assert host._save_deadline is not None
         host._cancel_auto_save()
 
     def test_auto_save_disabled_during_init(self, tmp_path):
@@ -340,7 +340,7 @@ class TestVdcAutoSave:
         # Creating a vDC should NOT trigger host auto-save
         # because _auto_save_enabled is False during __init__.
         vdc = _make_vdc(host)
-        assert host._save_timer is None
+        assert host._save_deadline is None
 
 
 # ---------------------------------------------------------------------------
@@ -391,7 +391,7 @@ class TestVdcApplyState:
         host._cancel_auto_save()
 
         vdc._apply_state({"name": "No-save", "zoneID": 7})
-        assert host._save_timer is None
+        assert host._save_deadline is None
 
     def test_apply_state_partial(self):
         host = _make_host()
@@ -651,7 +651,7 @@ class TestVdcHostPersistenceWithVdcs:
         host._cancel_auto_save()
         vdc = _make_vdc(host)
         host.add_vdc(vdc)
-        assert host._save_timer is not None
+        assert host._save_deadline is not None
         host._cancel_auto_save()
 
     def test_remove_vdc_triggers_auto_save(self, tmp_path):
@@ -661,7 +661,7 @@ class TestVdcHostPersistenceWithVdcs:
         host._cancel_auto_save()
 
         host.remove_vdc(vdc.dsuid)
-        assert host._save_timer is not None
+        assert host._save_deadline is not None
         host._cancel_auto_save()
 
 
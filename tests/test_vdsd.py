@@ -420,7 +420,7 @@ class TestVdsdAutoSave:
 
         # Mutate a tracked attribute.
         vdsd.name = "Changed"
-        assert host._save_timer is not None
+        assert host._save_deadline is not None
         host._cancel_auto_save()
 
     def test_untracked_attr_no_auto_save(self, tmp_path):
@@ -436,7 +436,7 @@ class TestVdsdAutoSave:
         host._cancel_auto_save()
 
         vdsd._active = False  # not tracked
-        assert host._save_timer is None
+        assert host._save_deadline is None
 
 
 # ===========================================================================
@@ -548,6 +548,23 @@ class TestDeviceVdsdManagement:
 
         assert device.remove_vdsd(99) is None
 
+    def test_sparse_indices_ordered_by_index(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        v3 = _make_vdsd(device, subdevice_index=3)
+        v1 = _make_vdsd(device, subdevice_index=1)
+        device.add_vdsd(v3)
+        device.add_vdsd(v1)
+
+        assert list(device.vdsds) == [1, 3]
+        assert device.get_vdsd(2) is None
+        assert device.get_vdsd(3) is v3
+
+        device.remove_vdsd(3)
+        assert device.vdsds == {1: v1}
+        assert device.get_vdsd(3) is None
+
     def test_get_vdsd_by_dsuid(self):
         host = _make_host()
         vdc = _make_vdc(host)
@@ -743,6 +760,42 @@ class TestDeviceVanish:
         assert msg.type == pb.VDC_SEND_VANISH
         assert msg.vdc_send_vanish.dSUID == str(vdsd.dsuid)
 
+    async def test_vanish_failure_is_logged_and_continues(self, caplog):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        v0 = _make_vdsd(device, subdevice_index=0)
+        v1 = _make_vdsd(device, subdevice_index=1)
+        device.add_vdsd(v0)
+        device.add_vdsd(v1)
+
+        session = _make_mock_session(pb.ERR_OK)
+        await device.announce(session)
+        session.send_notification.side_effect = [  # type: ignore[union-attr]
+            RuntimeError("boom"), None,
+        ]
+
+        await device.vanish(session)
+        assert device.is_announced is False
+        assert v1.is_announced is False
+        assert "Failed to vanish vdSD" in caplog.text
+
+    async def test_vanish_propagates_cancellation(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device, subdevice_index=0)
+        device.add_vdsd(vdsd)
+
+        session = _make_mock_session(pb.ERR_OK)
+        await device.announce(session)
+        session.send_notification.side_effect = (  # type: ignore[union-attr]
+            asyncio.CancelledError()
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await device.vanish(session)
+
 
 # ===========================================================================
 # Device — update (vanish + modify + re-announce)
@@ -805,6 +858,165 @@ class TestDeviceUpdate:
         await device.update(session, modify)
         assert announced_during_modify == [False]
 
+    async def test_rename_only_pushes_without_vanish(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device, subdevice_index=0, name="Original")
+        device.add_vdsd(vdsd)
+
+        session = _make_mock_session(pb.ERR_OK)
+        await device.announce(session)
+        session.send_request.reset_mock()
+
+        def modify(dev: Device) -> None:
+            dev.get_vdsd(0).name = "Updated"  # type: ignore[union-attr]
+
+        count = await device.update(session, modify)
+        assert count == 1
+        assert vdsd.name == "Updated"
+        assert device.is_announced is True
+        assert vdsd.is_announced is True
+        session.send_request.assert_not_awaited()
+        session.send_notification.assert_awaited_once()
+        msg = session.send_notification.call_args[0][0]
+        assert msg.type == pb.VDC_SEND_PUSH_NOTIFICATION
+        assert msg.vdc_send_push_notification.dSUID == str(vdsd.dsuid)
+        elem = msg.vdc_send_push_notification.changedproperties[0]
+        assert elem.name == "name"
+        assert elem.value.v_string == "Updated"
+
+    async def test_rename_with_other_change_reannounces(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device, subdevice_index=0, name="Original")
+        device.add_vdsd(vdsd)
+
+        session = _make_mock_session(pb.ERR_OK)
+        await device.announce(session)
+        session.send_request.reset_mock()
+
+        def modify(dev: Device) -> None:
+            v0 = dev.get_vdsd(0)
+            assert v0 is not None
+            v0.name = "Updated"
+            v0.add_sensor_input(SensorInput(
+                vdsd=v0, ds_index=0, sensor_type=SensorType.TEMPERATURE,
+                name="Temp", min_value=-20.0, max_value=60.0,
+                resolution=0.1,
+            ))
+
+        await device.update(session, modify)
+        sent = session.send_notification.call_args[0][0]
+        assert sent.type == pb.VDC_SEND_VANISH
+        session.send_request.assert_awaited_once()
+
+    async def test_callback_without_change_reannounces(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device, subdevice_index=0)
+        device.add_vdsd(vdsd)
+
+        session = _make_mock_session(pb.ERR_OK)
+        await device.announce(session)
+        session.send_request.reset_mock()
+
+        await device.update(session, lambda dev: None)
+        sent = session.send_notification.call_args[0][0]
+        assert sent.type == pb.VDC_SEND_VANISH
+        session.send_request.assert_awaited_once()
+
+    async def test_failed_modify_vanishes_device(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device, subdevice_index=0)
+        device.add_vdsd(vdsd)
+
+        session = _make_mock_session(pb.ERR_OK)
+        await device.announce(session)
+        session.send_request.reset_mock()
+
+        def modify(dev: Device) -> None:
+            dev.get_vdsd(0).model = "Half applied"  # type: ignore[union-attr]
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await device.update(session, modify)
+        assert device.is_announced is False
+        assert vdsd.is_announced is False
+        sent = session.send_notification.call_args[0][0]
+        assert sent.type == pb.VDC_SEND_VANISH
+        session.send_request.assert_not_awaited()
+
+    async def test_vdsd_added_in_callback_belongs_to_device(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        device.add_vdsd(_make_vdsd(device, subdevice_index=0))
+
+        session = _make_mock_session(pb.ERR_OK)
+        await device.announce(session)
+
+        added = []
+
+        def modify(dev: Device) -> None:
+            assert dev is device
+            added.append(_make_vdsd(dev, subdevice_index=2, name="Added"))
+            dev.add_vdsd(added[0])
+
+        await device.update(session, modify)
+        v2 = added[0]
+        assert v2.device is device
+        v2.add_model_feature("blink")
+        tree = device.get_property_tree()
+        assert tree["vdsds"][1]["modelFeatures"] == ["blink"]
+
+    async def test_immutable_change_reannounces(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device, subdevice_index=0)
+        device.add_vdsd(vdsd)
+
+        session = _make_mock_session(pb.ERR_OK)
+        await device.announce(session)
+        session.send_request.reset_mock()
+
+        def modify(dev: Device) -> None:
+            dev.get_vdsd(0).model = "Other model"  # type: ignore[union-attr]
+
+        await device.update(session, modify)
+        sent = session.send_notification.call_args[0][0]
+        assert sent.type == pb.VDC_SEND_VANISH
+        session.send_request.assert_awaited_once()
+
+    async def test_removed_vdsd_is_vanished(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        v0 = _make_vdsd(device, subdevice_index=0)
+        v1 = _make_vdsd(device, subdevice_index=1)
+        device.add_vdsd(v0)
+        device.add_vdsd(v1)
+
+        session = _make_mock_session(pb.ERR_OK)
+        await device.announce(session)
+
+        def modify(dev: Device) -> None:
+            dev.remove_vdsd(1)
+
+        count = await device.update(session, modify)
+        assert count == 1
+        assert v1.is_announced is False
+        vanished = {
+            c[0][0].vdc_send_vanish.dSUID
+            for c in session.send_notification.call_args_list
+        }
+        assert vanished == {str(v0.dsuid), str(v1.dsuid)}
+
 
 # ===========================================================================
 # Device — reset_announcement
@@ -856,6 +1068,51 @@ class TestDevicePropertyTree:
         assert tree["vdsds"][0]["subdeviceIndex"] == 0
         assert tree["vdsds"][1]["subdeviceIndex"] == 2
 
+    def test_tree_built_fresh_each_call(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device, name="Light")
+        device.add_vdsd(vdsd)
+
+        tree = device.get_property_tree()
+        tree["vdsds"][0]["name"] = "Changed by caller"
+        assert device.get_property_tree()["vdsds"][0]["name"] == "Light"
+
+        vdsd.name = "Renamed"
+        assert device.get_property_tree()["vdsds"][0]["name"] == "Renamed"
+
+    def test_component_change_reaches_tree(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device)
+        device.add_vdsd(vdsd)
+        bi = BinaryInput(
+            vdsd=vdsd,
+            ds_index=0,
+            sensor_function=BinaryInputType.PRESENCE,
+            name="Motion",
+        )
+        vdsd.add_binary_input(bi)
+
+        device.get_property_tree()
+        bi.group = 5
+        tree = device.get_property_tree()
+        assert tree["vdsds"][0]["binaryInputs"][0]["group"] == 5
+
+    def test_model_feature_change_reaches_tree(self):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device)
+        device.add_vdsd(vdsd)
+
+        device.get_property_tree()
+        vdsd.add_model_feature("blink")
+        tree = device.get_property_tree()
+        assert tree["vdsds"][0]["modelFeatures"] == ["blink"]
+
 
 class TestDeviceApplyState:
 
@@ -900,6 +1157,24 @@ class TestDeviceApplyState:
         })
         assert vdsd.name == "Updated Name"
 
+    @pytest.mark.parametrize("idx", [-1, 256, 10**9, "0"])
+    def test_restore_rejects_bad_subdevice_index(self, idx):
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device, subdevice_index=0, name="Kept")
+        device.add_vdsd(vdsd)
+
+        with pytest.raises(ValueError, match="subdeviceIndex"):
+            device._apply_state({
+                "vdsds": [
+                    {"subdeviceIndex": 0, "name": "Renamed"},
+                    {"subdeviceIndex": idx, "name": "Bad"},
+                ],
+            })
+        assert device.vdsds == {0: vdsd}
+        assert vdsd.name == "Kept"
+
 
 # ===========================================================================
 # Vdc — device integration
@@ -1220,6 +1495,27 @@ class TestVdcHostVdsdPropertyDispatch:
         assert resp.generic_response.code == pb.ERR_OK
         assert vdsd.zone_id == 42
 
+    def test_set_property_keys_applied_in_fixed_order(self, monkeypatch):
+        """Keys are applied in table order, not in request order."""
+        host = _make_host()
+        vdc = _make_vdc(host)
+        device = _make_device(vdc)
+        vdsd = _make_vdsd(device, subdevice_index=0)
+        device.add_vdsd(vdsd)
+
+        applied = []
+
+        def recorder(key):
+            return lambda host, vdsd, value: applied.append(key)
+
+        table = {key: recorder(key) for key in VdcHost._VDSD_SET_PROPERTY}
+        monkeypatch.setattr(VdcHost, "_VDSD_SET_PROPERTY", table)
+
+        host._apply_vdsd_set_property(
+            vdsd, {"scenes": {}, "progMode": True, "name": "X"}
+        )
+        assert applied == ["name", "progMode", "scenes"]
+
 
 # ===========================================================================
 # W3 — progMode / currentConfigId / configurations (§4.1.1)